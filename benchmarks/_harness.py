@@ -0,0 +1,75 @@
+"""Minimal timing harness shared by the benchmark modules."""
+
+import importlib.metadata
+import json
+import platform
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+
+@dataclass
+class Benchmark:
+    """
+    A benchmarked statement.
+
+    Attributes:
+        name (str): Unique dotted name, e.g. "kinematics.jacobian.scalar".
+        setup (Callable[[], Callable[[], object]]): Builds the inputs and returns the statement to time.
+        number (int): Calls per timing repeat.
+        size (int): Elements processed per call, used to report throughput.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int = 1000
+    size: int = 1
+
+
+@dataclass
+class Result:
+    name: str
+    best: float
+    median: float
+    number: int
+    size: int
+
+    @property
+    def throughput(self) -> float:
+        return self.size / self.best
+
+
+def run(benchmark: Benchmark, repeat: int = 5) -> Result:
+    statement = benchmark.setup()
+    statement()  # warm up caches and lazy imports
+    times = np.array(timeit.repeat(statement, number=benchmark.number, repeat=repeat)) / benchmark.number
+    return Result(benchmark.name, float(times.min()), float(np.median(times)), benchmark.number, benchmark.size)
+
+
+def environment() -> dict:
+    try:
+        version = importlib.metadata.version("twisted-strings")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "package": version,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(path: str, results: list[Result]) -> None:
+    with open(path, "w") as file:
+        json.dump({"environment": environment(), "results": [asdict(result) for result in results]}, file, indent=2)
+
+
+def load(path: str) -> dict[str, dict]:
+    with open(path) as file:
+        return {result["name"]: result for result in json.load(file)["results"]}
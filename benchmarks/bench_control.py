@@ -0,0 +1,35 @@
+"""Latency of the controller steps, the budget of a 1-10 kHz loop."""
+
+import numpy as np
+from _harness import Benchmark
+
+from twisted_strings import Model
+from twisted_strings.control import ComputedTorque, Impedance, PDFeedforward
+
+BATCH = 1000
+REFERENCE = (0.03, 0.01, 0.1)
+
+
+def _scalar(cls, *args):
+    def setup():
+        controller = cls(Model(), *args)
+        return lambda: controller.step(100.0, 10.0, REFERENCE)
+
+    return setup
+
+
+def _batch(cls, *args):
+    def setup():
+        controller = cls(Model(), *args, size=BATCH)
+        theta, dtheta = np.linspace(1.0, 150.0, BATCH), np.full(BATCH, 10.0)
+        return lambda: controller.step_batch(theta, dtheta, REFERENCE)
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark("control.computed_torque.scalar", _scalar(ComputedTorque, 400.0, 40.0), number=100_000),
+    Benchmark("control.pd_feedforward.scalar", _scalar(PDFeedforward, 2000.0, 50.0), number=100_000),
+    Benchmark("control.impedance.scalar", _scalar(Impedance, 2000.0, 50.0, 0.5), number=100_000),
+    Benchmark("control.computed_torque.batch", _batch(ComputedTorque, 400.0, 40.0), number=10_000, size=BATCH),
+]
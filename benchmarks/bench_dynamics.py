@@ -0,0 +1,75 @@
+"""Latency and throughput of the dynamics hot paths."""
+
+import numpy as np
+from _harness import Benchmark
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.dynamics import (
+    Space,
+    compute_all,
+    forward_dynamics,
+    inverse_dynamics,
+    kinetic_energy,
+    nonlinear,
+    power,
+    trajectory_inverse_dynamics,
+)
+from twisted_strings.kinematics import contraction, contraction_speed
+
+BATCH = 100_000
+
+
+def _prepare(data: Data, model: Model) -> Data:
+    data.motor.position = np.linspace(1.0, 150.0, len(data)) if isinstance(data, BatchData) else 100.0
+    data.motor.velocity = 10.0
+    data.load.force = data.motor.acceleration = data.load.acceleration = 1.0
+    contraction(model, data)
+    contraction_speed(model, data)
+    return data
+
+
+def _scalar(function, *args):
+    def setup():
+        model = Model()
+        data = _prepare(Data(), model)
+        return lambda: function(model, data, *args)
+
+    return setup
+
+
+def _batch(function, *args):
+    def setup():
+        model = Model()
+        data = _prepare(BatchData(BATCH), model)
+        return lambda: function(model, data, *args)
+
+    return setup
+
+
+def _trajectory(space: Space):
+    def setup():
+        model = Model()
+        position = np.linspace(1.0, 150.0, BATCH) if space == Space.MOTOR else np.linspace(1e-3, 0.1, BATCH)
+        return lambda: trajectory_inverse_dynamics(model, position, 1.0, 1.0, space)
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark("dynamics.nonlinear.scalar", _scalar(nonlinear, Space.MOTOR), number=20_000),
+    Benchmark("dynamics.compute_all.scalar", _scalar(compute_all, Space.MOTOR), number=20_000),
+    Benchmark("dynamics.forward_dynamics.motor.scalar", _scalar(forward_dynamics, Space.MOTOR), number=20_000),
+    Benchmark("dynamics.forward_dynamics.load.scalar", _scalar(forward_dynamics, Space.LOAD), number=20_000),
+    Benchmark(
+        "dynamics.forward_dynamics.load.jamming.scalar", _scalar(forward_dynamics, Space.LOAD, True), number=20_000
+    ),
+    Benchmark("dynamics.inverse_dynamics.load.scalar", _scalar(inverse_dynamics, Space.LOAD), number=20_000),
+    Benchmark("dynamics.kinetic_energy.scalar", _scalar(kinetic_energy, Space.MOTOR), number=20_000),
+    Benchmark("dynamics.power.scalar", _scalar(power, Space.MOTOR, 1.0), number=20_000),
+    Benchmark("dynamics.nonlinear.batch", _batch(nonlinear, Space.MOTOR), number=20, size=BATCH),
+    Benchmark("dynamics.forward_dynamics.motor.batch", _batch(forward_dynamics, Space.MOTOR), number=20, size=BATCH),
+    Benchmark("dynamics.kinetic_energy.batch", _batch(kinetic_energy, Space.MOTOR), number=20, size=BATCH),
+    Benchmark("dynamics.inverse_dynamics.load.batch", _batch(inverse_dynamics, Space.LOAD), number=20, size=BATCH),
+    Benchmark("dynamics.trajectory_inverse_dynamics.motor", _trajectory(Space.MOTOR), number=20, size=BATCH),
+    Benchmark("dynamics.trajectory_inverse_dynamics.load", _trajectory(Space.LOAD), number=20, size=BATCH),
+]
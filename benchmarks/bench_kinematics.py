@@ -0,0 +1,63 @@
+"""Latency of the Data based kinematics and throughput of the batch kinematics."""
+
+import numpy as np
+from _harness import Benchmark
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.kinematics import batch, contraction, contraction_speed, djacobian, fast, jacobian
+
+BATCH = 1_000_000
+
+
+def _scalar(function, *args):
+    def setup():
+        model, data = Model(), Data()
+        data.motor.position, data.motor.velocity = 100.0, 10.0
+        contraction(model, data)
+        contraction_speed(model, data)
+        return lambda: function(model, data, *args)
+
+    return setup
+
+
+def _fast(function, *args):
+    def setup():
+        model = Model()
+        L, r = model.kinematic.length, model.kinematic.radius
+        return lambda: function(*args, L, r)
+
+    return setup
+
+
+def _batch(function, *args):
+    def setup():
+        model = Model()
+        theta = np.linspace(1.0, 150.0, BATCH)
+        return lambda: function(model, theta, *args)
+
+    return setup
+
+
+def _batch_data(function):
+    def setup():
+        model, data = Model(), BatchData(BATCH)
+        data.motor.position, data.motor.velocity = np.linspace(1.0, 150.0, BATCH), 10.0
+        contraction(model, data)
+        contraction_speed(model, data)
+        return lambda: function(model, data)
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark("kinematics.contraction.scalar", _scalar(contraction), number=20_000),
+    Benchmark("kinematics.jacobian.scalar", _scalar(jacobian), number=20_000),
+    Benchmark("kinematics.djacobian.scalar", _scalar(djacobian), number=20_000),
+    Benchmark("kinematics.fast.jacobian", _fast(fast.jacobian, 100.0), number=100_000),
+    Benchmark("kinematics.fast.motor_state", _fast(fast.motor_state, 100.0, 10.0), number=100_000),
+    Benchmark("kinematics.fast.load_state", _fast(fast.load_state, 0.03, 0.01), number=100_000),
+    Benchmark("kinematics.contraction.batch", _batch(batch.contraction), number=10, size=BATCH),
+    Benchmark("kinematics.djacobian.batch", _batch(batch.djacobian, 10.0), number=10, size=BATCH),
+    Benchmark("kinematics.motor_state.batch", _batch(batch.motor_state, 10.0), number=10, size=BATCH),
+    Benchmark("kinematics.djacobian.batch_data", _batch_data(djacobian), number=10, size=BATCH),
+]
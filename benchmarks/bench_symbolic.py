@@ -0,0 +1,31 @@
+"""Cost of tracing the dynamics with symbolic types (skipped when SymPy/CasADi are missing)."""
+
+import importlib.util
+
+from _harness import Benchmark
+
+from twisted_strings.codegen import trace
+from twisted_strings.dynamics import Space
+
+
+def _trace(quantity: str, backend: str):
+    def setup():
+        if backend == "sympy":
+            import sympy
+
+            symbol = sympy.Symbol
+        else:
+            import casadi
+
+            symbol = casadi.SX.sym
+        return lambda: trace(quantity, Space.MOTOR, symbol)
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark(f"symbolic.{backend}.{quantity}", _trace(quantity, backend), number=20)
+    for backend in ("sympy", "casadi")
+    if importlib.util.find_spec(backend) is not None
+    for quantity in ("nonlinear", "forward_dynamics", "inverse_dynamics")
+]
@@ -0,0 +1,72 @@
+"""
+Speedup of the single-pass compute_all over the individual component functions.
+
+Two comparisons are made for a scalar Data and for a BatchData:
+- forward_dynamics as it was evaluated before compute_all (inertia followed by nonlinear,
+  which recompute the Jacobian and its derivative through the kinematics) against the
+  current forward_dynamics
+- every term filled by compute_all (both spaces and jamming) obtained from the component
+  functions against a single compute_all call
+
+Run with:
+    python benchmarks/compute_all.py
+"""
+
+import timeit
+
+import numpy as np
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.dynamics import Space, compute_all, forward_dynamics, inertia, jamming, nonlinear
+from twisted_strings.kinematics import contraction, contraction_speed
+
+
+def legacy_forward_dynamics(model: Model, data: Data) -> float:
+    m = inertia(model, data, Space.MOTOR)
+    n = nonlinear(model, data, Space.MOTOR)
+    return (data.load.force - n) / m
+
+
+def legacy_compute_all(model: Model, data: Data) -> None:
+    for space in (Space.MOTOR, Space.LOAD):
+        inertia(model, data, space)
+        nonlinear(model, data, space)
+    jamming(model, data, data.load.force)
+
+
+def prepare(data: Data, model: Model) -> Data:
+    data.motor.position = np.linspace(1.0, 150.0, len(data)) if isinstance(data, BatchData) else 100.0
+    data.motor.velocity = 10.0
+    data.load.force = 1.0
+    contraction(model, data)
+    contraction_speed(model, data)
+    return data
+
+
+def measure(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def report(label: str, legacy: float, current: float) -> None:
+    print(f"  {label:<18} {legacy * 1e6:9.2f} us -> {current * 1e6:9.2f} us  ({legacy / current:.2f}x)")
+
+
+if __name__ == "__main__":
+    model = Model()
+    cases = [
+        ("scalar Data", prepare(Data(), model), 20_000),
+        ("BatchData(1_000)", prepare(BatchData(1_000), model), 2_000),
+    ]
+
+    for name, data, number in cases:
+        print(f"{name}:")
+        report(
+            "forward_dynamics",
+            measure(lambda data=data: legacy_forward_dynamics(model, data), number),
+            measure(lambda data=data: forward_dynamics(model, data, Space.MOTOR), number),
+        )
+        report(
+            "all terms",
+            measure(lambda data=data: legacy_compute_all(model, data), number),
+            measure(lambda data=data: compute_all(model, data, Space.MOTOR), number),
+        )
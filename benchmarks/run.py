@@ -0,0 +1,67 @@
+"""
+Benchmark suite for the kinematics and dynamics hot paths.
+
+Measures per-call latency for scalar inputs, throughput for batched arrays and the cost
+of symbolic tracing, and optionally records the results as JSON so that releases can be
+compared.
+
+Usage:
+    python benchmarks/run.py                                  # run and print everything
+    python benchmarks/run.py -k batch                         # only names containing "batch"
+    python benchmarks/run.py -o results.json                  # record the results
+    python benchmarks/run.py --compare baseline.json          # flag regressions, exit code 1 if any
+"""
+
+import argparse
+import sys
+
+import bench_control
+import bench_dynamics
+import bench_kinematics
+import bench_symbolic
+from _harness import load, run, save
+
+MODULES = (bench_kinematics, bench_dynamics, bench_control, bench_symbolic)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="run only benchmarks whose name contains this string")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as regression")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per benchmark")
+    args = parser.parse_args()
+
+    baseline = load(args.compare) if args.compare else {}
+    results, regressions = [], []
+
+    for module in MODULES:
+        for benchmark in module.BENCHMARKS:
+            if args.filter not in benchmark.name:
+                continue
+            result = run(benchmark, args.repeat)
+            results.append(result)
+
+            line = f"{result.name:<45} {result.best * 1e6:12.3f} us"
+            if result.size > 1:
+                line += f" {result.throughput / 1e6:10.2f} M/s"
+            if result.name in baseline:
+                ratio = result.best / baseline[result.name]["best"]
+                line += f"   {ratio:5.2f}x baseline"
+                if ratio > args.threshold:
+                    regressions.append(result.name)
+                    line += "  REGRESSION"
+            print(line, flush=True)
+
+    if args.output:
+        save(args.output, results)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
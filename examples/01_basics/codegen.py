@@ -0,0 +1,19 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.codegen import casadi_function, generate, parameters
+from twisted_strings.dynamics import Space
+
+# Trace the forward dynamics once and emit a flat NumPy function
+model = Model()
+forward = generate("forward_dynamics", Space.MOTOR)
+print(forward.__doc__)
+
+# Positional arrays: state, input, then the model parameters
+theta = np.linspace(10, 150, 5)
+ddtheta = forward(theta, 1.0, 0.1, *parameters(model))
+print("Motor acceleration:", ddtheta)
+
+# The same function generated as C through CasADi and compiled locally
+forward_c = casadi_function("forward_dynamics", Space.MOTOR, compile=True)
+print("Compiled motor acceleration:", forward_c(theta[0], 1.0, 0.1, *parameters(model)))
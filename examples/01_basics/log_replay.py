@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+import numpy as np
+
+from twisted_strings import Data, Model
+from twisted_strings.dynamics import Space, forward_dynamics
+from twisted_strings.io import LogReader, LogWriter
+
+model = Model()
+path = os.path.join(tempfile.mkdtemp(), "run.tsalog")
+
+# Record one minute of a 1 kHz control loop
+data = Data()
+with LogWriter(path, model, metadata={"controller": "open loop"}) as log:
+    for i in range(60_000):
+        t = i * 1e-3
+        data.motor.position = 80 + 70 * np.sin(2 * np.pi * 0.5 * t)
+        data.motor.velocity = 70 * np.pi * np.cos(2 * np.pi * 0.5 * t)
+        data.load.force = 0.01
+        forward_dynamics(model, data, Space.MOTOR)
+        log.append(data, t)
+
+# Random access into the memory-mapped columns
+log = LogReader(path)
+print(log, log.metadata)
+print("Sample at t=12.5s:", log.snapshot(log.index(12.5)).load)
+print("Contraction from 10s to 10.005s:", log["load.position"][log.index(10.0) : log.index(10.005)])
+
+# Replay the whole log in chunks through the vectorized dynamics
+peak = 0.0
+for _, batch in log.iter_batches(1 << 14):
+    acceleration = forward_dynamics(log.model, batch, Space.MOTOR)
+    peak = max(peak, np.abs(acceleration).max())
+print("Peak motor acceleration:", peak)
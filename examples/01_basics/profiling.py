@@ -0,0 +1,35 @@
+import numpy as np
+
+from twisted_strings import Data, Model
+from twisted_strings.dynamics import Space, forward_dynamics, inverse_dynamics, nonlinear
+from twisted_strings.profiling import Profiler, compare
+
+model = Model()
+data = Data()
+
+
+def loop(steps: int):
+    for theta in np.linspace(10.0, 150.0, steps):
+        data.motor.position, data.motor.velocity = theta, 5.0
+        data.load.force = 0.01
+        forward_dynamics(model, data, Space.MOTOR)
+        data.load.acceleration = 0.1
+        inverse_dynamics(model, data, Space.LOAD)
+        nonlinear(model, data, Space.MOTOR)
+
+
+# Count the nested calls, with nonlinear as an extra root to expose its recomputations
+with Profiler(roots=("dynamics.forward_dynamics", "dynamics.inverse_dynamics", "dynamics.nonlinear")) as profiler:
+    loop(10_000)
+print(profiler.report())
+baseline = profiler.summary()
+
+# The functions are restored on exit, so the loop runs at full speed again
+loop(10_000)
+
+# A second run with fewer steps, compared against the first
+profiler.reset()
+with profiler:
+    loop(5_000)
+for name, changes in compare(baseline, profiler.summary()).items():
+    print(name, "calls:", changes["calls"])
@@ -0,0 +1,26 @@
+from twisted_strings import Model
+from twisted_strings.systems import SystemData, SystemModel, forward_dynamics
+
+# Antagonistic pair on a pulley of radius R: x1 = x0 + R q, x2 = x0 - R q
+R = 0.02
+system = SystemModel.from_models([Model(), Model()], coupling=[R, -R], offset=0.03, inertia=1e-4, damping=1e-3)
+data = SystemData(system)
+
+# PD control of the joint angle on top of a co-contraction torque
+kp, kd, pretension = 0.5, 0.02, 0.01
+target = 0.3
+dt, steps = 1e-4, 20_000
+
+for step in range(steps):
+    u = kp * (target - data.position[0]) - kd * data.velocity[0]
+    data.torque[:] = pretension + max(u, 0.0), pretension + max(-u, 0.0)
+
+    # semi-implicit Euler step of the joint
+    ddq = forward_dynamics(system, data)
+    data.velocity += dt * ddq
+    data.position += dt * data.velocity
+
+    if step % 2000 == 0:
+        print(f"t={step * dt:.2f}s  q={data.position[0]:+.4f} rad  tensions={data.tension}")
+
+print("Final joint angle:", data.position[0], "target:", target)
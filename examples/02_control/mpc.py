@@ -0,0 +1,41 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.control import ModelPredictive
+from twisted_strings.dynamics import Space
+from twisted_strings.simulation import simulate
+
+# Track a sinusoidal contraction with a 0.2 s prediction horizon at 100 Hz
+model = Model()
+dt, horizon = 0.01, 20
+w = 2 * np.pi * 1.0
+
+
+def reference(t):
+    return np.stack((0.03 + 0.01 * np.sin(w * t), 0.01 * w * np.cos(w * t)), axis=-1)
+
+
+# The NLP is built on the first construction and shared by every controller with the same horizon
+mpc = ModelPredictive(
+    model,
+    horizon,
+    dt,
+    weights=(1e4, 0.0, 1e-6),
+    position_bounds=(1e-3, 0.15),
+    input_bounds=(-100.0, 100.0),
+)
+
+x, dx = 0.03, 0.0
+for k in range(200):
+    t = k * dt
+    force = mpc.step(x, dx, reference(t + dt * np.arange(horizon + 1)))
+
+    # the plant holds the force over one control period
+    plant = simulate(
+        model, np.array([t, t + dt]), x, dx, Space.LOAD, lambda *_, u=force: u, method="midpoint", substeps=10
+    )
+    x, dx = plant.position[-1], plant.velocity[-1]
+
+    if k % 20 == 0:
+        error = x - reference(t + dt)[0]
+        print(f"t={t:.2f}s  force={force:+.3f} N  error={1e3 * error:+.4f} mm  iterations={mpc.iterations}")
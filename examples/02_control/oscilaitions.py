@@ -0,0 +1,41 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.control import ComputedTorque, Impedance, PDFeedforward
+from twisted_strings.dynamics import Space
+from twisted_strings.kinematics import batch
+from twisted_strings.simulation import simulate
+
+# Track a sinusoidal contraction around a pre-twisted operating point
+model = Model()
+amplitude, offset, frequency = 0.01, 0.03, 2.0
+w = 2 * np.pi * frequency
+
+
+def reference(t):
+    return offset + amplitude * np.sin(w * t), amplitude * w * np.cos(w * t), -amplitude * w**2 * np.sin(w * t)
+
+
+time = np.arange(0, 2, 1e-3)
+
+controllers = {
+    "computed torque": ComputedTorque(model, kp=400.0, kd=40.0, size=1),
+    "pd + feedforward": PDFeedforward(model, kp=2000.0, kd=50.0, size=1),
+    "impedance": Impedance(model, stiffness=2000.0, damping=50.0, size=1),
+}
+
+for name, controller in controllers.items():
+    # The controllers read the motor encoder and return the motor torque, which the
+    # strings apply to the load as the force tau / J
+    def control(t, x, dx, controller=controller):
+        theta, dtheta, J, _ = batch.load_state(model, x, dx)
+        return controller.step_batch(theta, dtheta, reference(t)) / J
+
+    trajectory = simulate(model, time, offset, space=Space.LOAD, control=control, method="midpoint")
+    error = trajectory.position - reference(time)[0]
+    print(f"{name:>18}: max tracking error {1e3 * np.abs(error[len(time) // 2 :]).max():.4f} mm")
+
+# A real-time loop calls the scalar step directly, e.g. at 10 kHz
+theta0 = float(batch.motor_angle(model, offset))
+torque = controllers["computed torque"].step(theta0, 0.0, reference(0.0))
+print("Initial torque:", torque)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.planning import TrajectoryOptimizer
+
+# np.trapz was renamed to np.trapezoid in NumPy 2.0
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+model = Model()
+limits = {"torque_limit": 0.5, "speed_limit": 500.0, "external": 0.5}
+
+# Fastest contraction from 1 cm to 5 cm lifting a 0.5 N load
+fastest = TrajectoryOptimizer(model, objective="time", **limits)
+plan = fastest.solve(0.01, 0.05)
+print(f"Minimum time: {plan.duration:.3f} s, peak motor speed {np.abs(plan.motor_velocity).max():.1f} rad/s")
+
+# The same motion in twice the time, minimizing the motor losses
+efficient = TrajectoryOptimizer(model, objective="energy", **limits)
+slow = efficient.solve(0.01, 0.05, duration=2 * plan.duration)
+losses = trapezoid(plan.torque**2, plan.time)
+print(f"Integral of squared torque: {losses:.5f} (time optimal), {slow.cost:.5f} (energy optimal)")
+
+# Minimum times to many targets, all planned with the same compiled problem
+targets = np.linspace(0.02, 0.06, 9)
+for target, plan in zip(targets, fastest.solve_batch(0.01, targets), strict=True):
+    print(f"target {100 * target:.1f} cm: {plan.duration:.3f} s, {plan.iterations} iterations, success {plan.success}")
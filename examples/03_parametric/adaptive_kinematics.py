@@ -0,0 +1,26 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.estimation import AdaptiveKinematics
+from twisted_strings.kinematics import batch
+
+# The true strings stretch by 2% over the run
+dt = 1e-3
+time = np.arange(0, 60, dt)
+true = Model()
+true.kinematic.length = 0.2 * (1 + 0.02 * time / time[-1])
+
+theta = 80 + 70 * np.sin(2 * np.pi * 0.5 * time)
+dtheta = 70 * np.pi * np.cos(2 * np.pi * 0.5 * time)
+x, dx, _, _ = batch.motor_state(true, theta, dtheta)
+x += np.random.default_rng(0).normal(0, 1e-5, x.shape)
+
+# The estimator updates model.kinematic in place at every sample
+model = Model()
+estimator = AdaptiveKinematics(model, forgetting=0.9995)
+for i in range(len(time)):
+    estimator.update(theta[i], x[i], dtheta[i], dx[i])
+    if i % 10_000 == 0:
+        print(f"t={time[i]:5.1f}s  L={model.kinematic.length:.5f} (true {true.kinematic.length[i]:.5f})")
+
+print("Final:", model.kinematic)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from twisted_strings import Model
+from twisted_strings.dynamics import Space
+from twisted_strings.identification import fit_dynamics, fit_kinematics, regressor
+from twisted_strings.kinematics import batch
+
+# Synthetic log of a "true" actuator
+true = Model()
+true.kinematic.length = 0.25
+true.kinematic.radius = 1.2e-3
+true.dynamic.motor.damping = 0.05
+
+rng = np.random.default_rng(0)
+samples = 1_000_000
+theta = rng.uniform(0, 160, samples)
+dtheta = rng.normal(0, 20, samples)
+ddtheta = rng.normal(0, 200, samples)
+x = batch.contraction(true, theta) + rng.normal(0, 1e-6, samples)
+torque = regressor(true, theta, dtheta, ddtheta, Space.MOTOR) @ [1e-6, 1.0, 0.05, 0.01]
+torque += rng.normal(0, 1e-3, samples)
+
+# Start from the nominal model: kinematics first, then the linear dynamic parameters
+kinematics = fit_kinematics(Model(), theta, x)
+print("Kinematics:", kinematics.parameters, "rms:", kinematics.rms)
+
+dynamics = fit_dynamics(kinematics.model, theta, dtheta, ddtheta, torque, Space.MOTOR)
+print("Dynamics:", dynamics.parameters, "rms:", dynamics.rms)
+print(dynamics.model)
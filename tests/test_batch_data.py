@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.dynamics import Space, compute_all, forward_dynamics, inverse_dynamics
+
+SIZE = 6
+
+
+def _states(space):
+    if space == Space.MOTOR:
+        return np.linspace(20.0, 120.0, SIZE), np.linspace(-10.0, 10.0, SIZE)
+    return np.linspace(0.002, 0.03, SIZE), np.linspace(-0.05, 0.05, SIZE)
+
+
+def _set(data, space, position, velocity):
+    space_data = data.motor if space == Space.MOTOR else data.load
+    space_data.position, space_data.velocity = position, velocity
+    data.load.force = 0.02
+    space_data.acceleration = 3.0
+
+
+@pytest.mark.parametrize("space", [Space.MOTOR, Space.LOAD])
+@pytest.mark.parametrize("function", [compute_all, forward_dynamics, inverse_dynamics])
+def test_batch_data_matches_scalar_data(space, function):
+    model = Model()
+    position, velocity = _states(space)
+    batch = BatchData(SIZE)
+    _set(batch, space, position, velocity)
+    function(model, batch, space)
+
+    for i in range(SIZE):
+        data = Data()
+        _set(data, space, position[i], velocity[i])
+        function(model, data, space)
+        expected = BatchData.from_data([data])
+        np.testing.assert_allclose(batch.buffer[..., i], expected.buffer[..., 0], rtol=1e-12, atol=1e-300)
+
+
+def test_batch_data_indexing_round_trip():
+    batch = BatchData(3)
+    batch.motor.position = [1.0, 2.0, 3.0]
+    batch.load.force = 0.5
+    snapshot = batch[1]
+    assert isinstance(snapshot, Data)
+    assert snapshot.motor.position == 2.0 and snapshot.load.force == 0.5
+
+    snapshot.load.velocity = 7.0
+    batch[2] = snapshot
+    assert batch.load.velocity.tolist() == [0.0, 0.0, 7.0]
+    packed = BatchData.from_data([batch[i] for i in range(3)])
+    np.testing.assert_array_equal(packed.buffer, batch.buffer)
+    assert np.shares_memory(batch.motor.position, batch.buffer)
@@ -0,0 +1,65 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from twisted_strings import Data, Model, codegen
+from twisted_strings.dynamics import Space, forward_dynamics
+
+STATE = (50.0, 10.0, 0.05)
+
+
+def _reference(model):
+    data = Data()
+    data.motor.position, data.motor.velocity = STATE[:2]
+    data.load.force = STATE[2]
+    return forward_dynamics(model, data, Space.MOTOR)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "casadi"])
+def test_generated_forward_dynamics_matches(backend):
+    pytest.importorskip("sympy" if backend == "numpy" else "casadi")
+    model = Model()
+    function = codegen.generate("forward_dynamics", Space.MOTOR, backend)
+    value = float(np.asarray(function(*STATE, *codegen.parameters(model))).squeeze())
+    assert value == pytest.approx(_reference(model), rel=1e-10)
+
+
+@pytest.mark.skipif(shutil.which("cc") is None and shutil.which("gcc") is None, reason="no C compiler")
+def test_compiled_function_is_written_to_the_directory(tmp_path, monkeypatch):
+    pytest.importorskip("casadi")
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    directory = tmp_path / "build"
+    directory.mkdir()
+
+    model = Model()
+    function = codegen.casadi_function("forward_dynamics", Space.MOTOR, compile=True, directory=str(directory))
+    assert float(function(*STATE, *codegen.parameters(model))) == pytest.approx(_reference(model), rel=1e-10)
+    assert "forward_dynamics_motor.c" in os.listdir(directory)
+    assert not os.listdir(cwd)
+
+
+def test_cached_trace_is_keyed_by_the_symbolic_inputs():
+    ca = pytest.importorskip("casadi")
+    codegen.clear_cache()
+    symbols, expression = codegen.cached_trace("nonlinear", Space.LOAD, ca.SX.sym)
+    # a different factory producing the same inputs hits the cache
+    hit = codegen.cached_trace("nonlinear", Space.LOAD, lambda name: ca.SX.sym(name))
+    assert hit[0] is symbols and hit[1] is expression
+    assert codegen.cached_trace("nonlinear", Space.MOTOR, ca.SX.sym)[1] is not expression
+
+
+def test_generated_functions_are_cached_until_cleared():
+    ca = pytest.importorskip("casadi")
+    codegen.clear_cache()
+    function = codegen.casadi_function("inertia", Space.MOTOR)
+    assert codegen.casadi_function("inertia", space=Space.MOTOR, compile=False) is function
+    assert codegen.generate("inertia", Space.MOTOR, "casadi") is function
+    symbols, expression = codegen.cached_trace("inertia", Space.MOTOR, ca.SX.sym)
+
+    codegen.clear_cache()
+    assert codegen.casadi_function("inertia", Space.MOTOR) is not function
+    assert codegen.cached_trace("inertia", Space.MOTOR, ca.SX.sym)[1] is not expression
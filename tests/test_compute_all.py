@@ -0,0 +1,32 @@
+import pytest
+
+from twisted_strings import Data, Model
+from twisted_strings.dynamics import Space, compute_all, coriolis, inertia, jamming, nonlinear
+
+FIELDS = ("jacobian", "djacobian", "inertia", "coriolis", "nonlinear", "static", "jamming")
+
+
+@pytest.mark.parametrize("space", [Space.MOTOR, Space.LOAD])
+def test_compute_all_matches_the_component_functions(space):
+    model = Model()
+    fused = Data()
+    if space == Space.MOTOR:
+        fused.motor.position, fused.motor.velocity = 60.0, 5.0
+    else:
+        fused.load.position, fused.load.velocity = 0.02, 0.01
+    fused.load.force = 2.0
+    compute_all(model, fused, space)
+
+    # the component functions read the state of both spaces
+    separate = Data()
+    for name in ("position", "velocity"):
+        setattr(separate.motor, name, getattr(fused.motor, name))
+        setattr(separate.load, name, getattr(fused.load, name))
+    inertia(model, separate, space)
+    coriolis(model, separate, space)
+    nonlinear(model, separate, space)
+    jamming(model, separate, fused.load.force)
+
+    chosen = (fused.motor, separate.motor) if space == Space.MOTOR else (fused.load, separate.load)
+    for name in FIELDS:
+        assert getattr(chosen[0], name) == pytest.approx(getattr(chosen[1], name), rel=1e-10), name
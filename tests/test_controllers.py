@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.control import ComputedTorque, Impedance, LoadController, PDFeedforward
+
+CONTROLLERS = [
+    lambda model, size=None: ComputedTorque(model, kp=400.0, kd=40.0, size=size),
+    lambda model, size=None: PDFeedforward(model, kp=2000.0, kd=50.0, size=size),
+    lambda model, size=None: Impedance(model, stiffness=1000.0, damping=20.0, size=size),
+    lambda model, size=None: Impedance(model, stiffness=1000.0, damping=20.0, mass=0.5, size=size),
+]
+
+
+@pytest.mark.parametrize("make", CONTROLLERS)
+def test_step_batch_matches_step(make):
+    model = Model()
+    theta, dtheta = np.linspace(20.0, 80.0, 5), np.linspace(-10.0, 10.0, 5)
+    ref = (np.linspace(0.001, 0.01, 5), 0.01, np.linspace(-1.0, 1.0, 5))
+
+    batch = make(model, size=5).step_batch(theta, dtheta, ref)
+    scalar = make(model)
+    expected = [scalar.step(theta[i], dtheta[i], (ref[0][i], ref[1], ref[2][i])) for i in range(5)]
+    np.testing.assert_allclose(batch, expected, rtol=1e-12)
+
+
+def test_step_batch_requires_size():
+    with pytest.raises(ValueError, match="size"):
+        ComputedTorque(Model(), kp=1.0, kd=1.0).step_batch(np.ones(2), np.ones(2), (0.0, 0.0, 0.0))
+
+
+def test_load_controller_is_abstract():
+    with pytest.raises(TypeError):
+        LoadController(Model())
@@ -0,0 +1,40 @@
+import pytest
+
+from twisted_strings import Data, Model
+from twisted_strings.dynamics import Space, compute_all, dissipated_power, forward_dynamics, kinetic_energy, power
+
+
+def _state(model, space, position, velocity):
+    data = Data()
+    if space == Space.MOTOR:
+        data.motor.position, data.motor.velocity = position, velocity
+    else:
+        data.load.position, data.load.velocity = position, velocity
+    return data
+
+
+def test_energy_does_not_depend_on_space():
+    model = Model()
+    motor = _state(model, Space.MOTOR, 50.0, 10.0)
+    compute_all(model, motor, Space.MOTOR)
+    load = _state(model, Space.LOAD, motor.load.position, motor.load.velocity)
+
+    assert kinetic_energy(model, load, Space.LOAD) == pytest.approx(kinetic_energy(model, motor, Space.MOTOR))
+    assert dissipated_power(model, load, Space.LOAD) == pytest.approx(dissipated_power(model, motor, Space.MOTOR))
+    torque = 0.1
+    assert power(model, load, Space.LOAD, torque / motor.motor.jacobian) == pytest.approx(
+        power(model, motor, Space.MOTOR, torque)
+    )
+
+
+def test_power_balance_in_motor_space():
+    model, h = Model(), 1e-6
+    theta, dtheta, torque = 50.0, 10.0, 0.1
+    data = _state(model, Space.MOTOR, theta, dtheta)
+    data.load.force = torque
+    acceleration = forward_dynamics(model, data, Space.MOTOR)
+
+    after = _state(model, Space.MOTOR, theta + h * dtheta, dtheta + h * acceleration)
+    before = _state(model, Space.MOTOR, theta - h * dtheta, dtheta - h * acceleration)
+    derivative = (kinetic_energy(model, after, Space.MOTOR) - kinetic_energy(model, before, Space.MOTOR)) / (2 * h)
+    assert derivative == pytest.approx(power(model, data, Space.MOTOR, torque), rel=1e-6)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.estimation import AdaptiveKinematics, iter_chunks, read_encoder, stream_load
+from twisted_strings.kinematics import batch
+
+TIME = np.arange(0.0, 4.0, 1e-3)
+THETA = 80 + 70 * np.sin(2 * np.pi * 0.5 * TIME)
+DTHETA = 70 * np.pi * np.cos(2 * np.pi * 0.5 * TIME)
+
+
+def _measure(length, radius):
+    true = Model()
+    true.kinematic.length, true.kinematic.radius = length, radius
+    x, dx, _, _ = batch.motor_state(true, THETA, DTHETA)
+    return x, dx
+
+
+def test_adaptive_kinematics_converges_to_the_true_parameters():
+    x, dx = _measure(0.21, 1.1e-3)
+    model = Model()
+    estimator = AdaptiveKinematics(model, forgetting=1.0)
+    for i in range(len(TIME)):
+        estimator.update(THETA[i], x[i], DTHETA[i], dx[i])
+    assert model.kinematic.length == pytest.approx(0.21, rel=1e-4)
+    assert model.kinematic.radius == pytest.approx(1.1e-3, rel=1e-4)
+    assert estimator.samples == len(TIME)
+
+
+def test_adaptive_kinematics_batch_matches_single_estimators():
+    lengths, radii = np.array([0.19, 0.21]), np.array([0.9e-3, 1.1e-3])
+    measured = [_measure(L, r) for L, r in zip(lengths, radii, strict=True)]
+    x, dx = (np.stack(values, axis=1) for values in zip(*measured, strict=True))
+
+    model = Model()
+    model.kinematic.length, model.kinematic.radius = np.full(2, 0.2), np.full(2, 1e-3)
+    estimator = AdaptiveKinematics(model)
+    singles = [AdaptiveKinematics(Model()) for _ in lengths]
+    for i in range(0, len(TIME), 4):
+        estimator.update(THETA[i], x[i], DTHETA[i], dx[i])
+        for j, single in enumerate(singles):
+            single.update(THETA[i], x[i, j], DTHETA[i], dx[i, j])
+
+    assert estimator.covariance.shape == (2, 2, 2)
+    for j, single in enumerate(singles):
+        assert model.kinematic.length[j] == pytest.approx(single.model.kinematic.length, rel=1e-12)
+        assert model.kinematic.radius[j] == pytest.approx(single.model.kinematic.radius, rel=1e-12)
+    np.testing.assert_allclose(model.kinematic.length, lengths, rtol=1e-3)
+
+
+def test_adaptive_kinematics_forgets_once_per_update():
+    # uninformative constraints leave only the forgetting in the covariance update
+    estimator = AdaptiveKinematics(Model(), forgetting=0.5, position_noise=1e30, velocity_noise=1e30)
+    initial = estimator.covariance
+    estimator.update(THETA[1], 0.01, DTHETA[1], 0.01)
+    np.testing.assert_allclose(estimator.covariance.diagonal(), initial.diagonal() / 0.5, rtol=1e-9)
+
+
+def test_read_encoder_memory_maps_npy_files(tmp_path):
+    samples = np.stack((THETA, DTHETA), axis=1)
+    np.save(tmp_path / "encoder.npy", samples)
+    log = read_encoder(tmp_path / "encoder.npy")
+    np.testing.assert_array_equal(log.theta, THETA)
+    np.testing.assert_array_equal(log.dtheta, DTHETA)
+
+    np.save(tmp_path / "flat.npy", THETA)
+    with pytest.raises(ValueError, match="Invalid encoder log shape"):
+        read_encoder(str(tmp_path / "flat.npy"))
+
+
+def test_read_encoder_reads_raw_samples_after_a_header(tmp_path):
+    path = tmp_path / "encoder.bin"
+    samples = np.stack((THETA, DTHETA), axis=1).astype(np.float32)
+    path.write_bytes(b"header!!" + samples.tobytes())
+    log = read_encoder(str(path), dtype=np.float32, offset=8)
+    assert log.theta.dtype == np.float32
+    np.testing.assert_array_equal(log.theta, samples[:, 0])
+    np.testing.assert_array_equal(log.dtheta, samples[:, 1])
+
+
+def test_iter_chunks_covers_the_columns():
+    theta = np.arange(10, dtype=np.float32)
+    chunks = list(iter_chunks(theta, -theta, chunk_size=4))
+    assert [len(chunk) for chunk, _ in chunks] == [4, 4, 2]
+    assert all(chunk.dtype == float and chunk.flags.c_contiguous for pair in chunks for chunk in pair)
+    np.testing.assert_array_equal(np.concatenate([chunk for chunk, _ in chunks]), theta)
+    np.testing.assert_array_equal(np.concatenate([chunk for _, chunk in chunks]), -theta)
+    assert list(iter_chunks(theta[:0], theta[:0])) == []
+
+
+def test_stream_load_matches_the_batch_kinematics():
+    model = Model()
+    chunks = list(stream_load(model, iter_chunks(THETA, DTHETA, chunk_size=1000)))
+    assert [chunk.start for chunk in chunks] == [0, 1000, 2000, 3000]
+    expected = batch.motor_state(model, THETA, DTHETA)
+    for streamed, full in zip(zip(*(chunk[1:] for chunk in chunks), strict=True), expected, strict=True):
+        np.testing.assert_array_equal(np.concatenate(streamed), full)
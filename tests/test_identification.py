@@ -0,0 +1,81 @@
+from operator import attrgetter
+
+import numpy as np
+import pytest
+
+from twisted_strings import BatchData, Model
+from twisted_strings.dynamics import Space, inverse_dynamics
+from twisted_strings.identification import LeastSquares, fit_dynamics, fit_kinematics, parameter_names, regressor
+from twisted_strings.kinematics import batch
+
+rng = np.random.default_rng(0)
+THETA = rng.uniform(10.0, 150.0, 500)
+DTHETA = rng.normal(0.0, 20.0, 500)
+DDTHETA = rng.normal(0.0, 200.0, 500)
+
+
+def _true_model():
+    model = Model()
+    model.dynamic.motor.inertia, model.dynamic.load.inertia = 2e-6, 0.8
+    model.dynamic.motor.damping, model.dynamic.load.damping = 0.05, 0.02
+    return model
+
+
+def _state(model, space):
+    if space == Space.MOTOR:
+        return THETA, DTHETA, DDTHETA
+    x, dx, J, dJ = batch.motor_state(model, THETA, DTHETA)
+    return x, dx, J * DDTHETA + dJ * DTHETA
+
+
+@pytest.mark.parametrize("space", [Space.MOTOR, Space.LOAD])
+def test_regressor_reproduces_inverse_dynamics(space):
+    model = _true_model()
+    position, velocity, acceleration = _state(model, space)
+    params = [attrgetter(name)(model) for name in parameter_names(space)]
+
+    data = BatchData(len(position))
+    chosen = data.motor if space == Space.MOTOR else data.load
+    chosen.position, chosen.velocity, chosen.acceleration = position, velocity, acceleration
+    expected = inverse_dynamics(model, data, space, include_jamming=False)
+    np.testing.assert_allclose(regressor(model, position, velocity, acceleration, space) @ params, expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("space", [Space.MOTOR, Space.LOAD])
+def test_fit_dynamics_recovers_the_parameters(space):
+    true = _true_model()
+    position, velocity, acceleration = _state(true, space)
+    force = regressor(true, position, velocity, acceleration, space) @ [
+        attrgetter(name)(true) for name in parameter_names(space)
+    ]
+
+    result = fit_dynamics(Model(), position, velocity, acceleration, force, space, chunk_size=128)
+    for name in parameter_names(space):
+        assert result.parameters[name] == pytest.approx(attrgetter(name)(true), rel=1e-8)
+        assert attrgetter(name)(result.model) == pytest.approx(attrgetter(name)(true), rel=1e-8)
+    assert result.samples == len(force)
+    assert result.rms == pytest.approx(0.0, abs=1e-12)
+
+
+def test_fit_kinematics_recovers_length_and_radius():
+    pytest.importorskip("sympy")
+    true = Model()
+    true.kinematic.length, true.kinematic.radius = 0.25, 1.2e-3
+    x = batch.contraction(true, THETA)
+
+    result = fit_kinematics(Model(), THETA, x, chunk_size=128)
+    assert result.parameters["kinematic.length"] == pytest.approx(0.25, rel=1e-9)
+    assert result.parameters["kinematic.radius"] == pytest.approx(1.2e-3, rel=1e-9)
+    assert result.model.dynamic == true.dynamic
+
+
+def test_chunked_least_squares_matches_lstsq():
+    A, b = rng.normal(size=(1000, 4)), rng.normal(size=1000)
+    solver = LeastSquares(4)
+    for start in range(0, len(b), 300):
+        solver.update(A[start : start + 300], b[start : start + 300])
+
+    expected, residual = np.linalg.lstsq(A, b, rcond=None)[:2]
+    np.testing.assert_allclose(solver.solve(), expected, rtol=1e-10)
+    assert solver.samples == len(b)
+    assert solver.residual == pytest.approx(np.sqrt(residual[0] / len(b)), rel=1e-10)
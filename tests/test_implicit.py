@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.simulation import IMPLICIT_METHODS, simulate
+
+pytest.importorskip("casadi")
+
+
+def _control(t, position, velocity):
+    return 0.05 * np.sin(200 * t)
+
+
+def _constant(t, position, velocity):
+    return 0.05
+
+
+@pytest.mark.parametrize("method", IMPLICIT_METHODS)
+def test_implicit_methods_match_rk4(method):
+    model, time = Model(), np.linspace(0.0, 0.02, 5)
+    model.dynamic.motor.damping = 1e-4
+    reference = simulate(model, time, 50.0, control=_control, method="rk4", substeps=2000)
+    implicit = simulate(model, time, 50.0, control=_control, method=method, substeps=200)
+    np.testing.assert_allclose(implicit.position, reference.position, rtol=1e-4)
+
+
+@pytest.fixture(scope="module")
+def stiff_reference():
+    # with the default, stiff motor damping rk4 diverges at the steps of the implicit methods
+    time = np.linspace(0.0, 0.2, 21)
+    return time, simulate(Model(), time, 50.0, control=_constant, substeps=2000)
+
+
+@pytest.mark.parametrize("method", IMPLICIT_METHODS)
+def test_implicit_methods_stay_stable_at_large_steps(method, stiff_reference):
+    time, reference = stiff_reference
+    implicit = simulate(Model(), time, 50.0, control=_constant, method=method)
+    np.testing.assert_allclose(implicit.position, reference.position, rtol=1e-6)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.simulation import simulate
+
+
+def _model():
+    model = Model()
+    # lighter motor damping keeps the dynamics non-stiff for the explicit methods
+    model.dynamic.motor.damping = 1e-4
+    return model
+
+
+def _control(t, position, velocity):
+    return 0.05 * np.sin(200 * t)
+
+
+def test_rk45_matches_rk4():
+    model, time = _model(), np.linspace(0.0, 0.02, 3)
+    reference = simulate(model, time, 50.0, control=_control, method="rk4", substeps=2000)
+    adaptive = simulate(model, time, 50.0, control=_control, method="rk45", rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(adaptive.position, reference.position, rtol=1e-8)
+    np.testing.assert_allclose(adaptive.velocity, reference.velocity, rtol=1e-6, atol=1e-6)
+
+
+def test_rk45_step_size_survives_close_grid_points():
+    model = _model()
+    coarse = simulate(model, np.array([0.0, 0.01, 0.02]), 50.0, control=_control, method="rk45")
+    close = simulate(model, np.array([0.0, 0.01, 0.01 + 1e-9, 0.02]), 50.0, control=_control, method="rk45")
+    assert close.position[-1] == pytest.approx(coarse.position[-1], rel=1e-7)
+    # the tiny interval costs one extra step instead of regrowing the step size from 1e-9
+    assert close.evaluations <= coarse.evaluations + 12
+
+
+def test_batch_simulation_matches_single_runs():
+    model, time = _model(), np.linspace(0.0, 0.005, 6)
+    positions = np.array([30.0, 50.0, 70.0])
+    batch = simulate(model, time, positions, 1.0, control=_control, method="rk4", substeps=50)
+    for i, position in enumerate(positions):
+        single = simulate(model, time, position, 1.0, control=_control, method="rk4", substeps=50)
+        np.testing.assert_allclose(batch.position[:, i], single.position, rtol=1e-12)
+        np.testing.assert_allclose(batch.input[:, i], single.input, rtol=1e-12)
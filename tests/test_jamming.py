@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.dynamics import Space, forward_dynamics, inverse_dynamics, solve_jamming
+from twisted_strings.simulation import simulate
+
+
+def _load_state(data, x, dx, ddx):
+    data.load.position, data.load.velocity, data.load.acceleration = x, dx, ddx
+    return data
+
+
+@pytest.mark.parametrize("method", ["closed", "newton"])
+def test_forward_dynamics_inverts_inverse_dynamics_with_jamming(method):
+    model = Model()
+    x, dx, ddx = np.linspace(0.002, 0.02, 8), np.linspace(0.0, 0.1, 8), np.linspace(0.1, 1.0, 8)
+    data = _load_state(BatchData(8), x, dx, ddx)
+    inverse_dynamics(model, data, Space.LOAD, include_jamming=True)
+    assert np.any(data.load.jamming != 0.0)
+
+    acceleration, iterations = forward_dynamics(
+        model, data, Space.LOAD, include_jamming=True, jamming_method=method, iterations=64, full_output=True
+    )
+    np.testing.assert_allclose(acceleration, ddx, rtol=1e-8, atol=1e-8)
+    assert (iterations > 0) == (method == "newton")
+
+
+def test_solve_jamming_methods_agree():
+    model = Model()
+    data = _load_state(Data(), 0.01, 0.0, 0.0)
+    inverse_dynamics(model, data, Space.LOAD, include_jamming=False)
+    closed, _ = solve_jamming(model, data, 5.0)
+    newton, iterations = solve_jamming(model, data, 5.0, method="newton")
+    assert newton == pytest.approx(closed, rel=1e-12)
+    assert 0 < iterations <= 8
+    with pytest.raises(ValueError):
+        solve_jamming(model, data, 5.0, method="bisection")
+
+
+def test_solve_jamming_newton_reports_non_convergence():
+    model = Model()
+    data = _load_state(BatchData(8), np.linspace(0.002, 0.02, 8), 0.0, 0.0)
+    force = np.linspace(1.0, 200.0, 8)
+    F0, iterations = solve_jamming(model, data, force, method="newton", iterations=64)
+    np.testing.assert_allclose(F0, solve_jamming(model, data, force)[0], rtol=1e-10)
+    # the slowest element of the batch needs more than a couple of iterations
+    with pytest.raises(RuntimeError, match="did not converge"):
+        solve_jamming(model, data, force, method="newton", iterations=iterations - 1)
+
+
+def test_jamming_requires_load_space():
+    model = Model()
+    data = Data()
+    data.motor.position = 50.0
+    with pytest.raises(ValueError, match="Jamming"):
+        forward_dynamics(model, data, Space.MOTOR, include_jamming=True)
+    with pytest.raises(ValueError, match="Jamming"):
+        simulate(model, np.linspace(0.0, 1e-3, 3), 50.0, include_jamming=True)
+
+
+def test_simulate_reports_jamming_iterations():
+    model = Model()
+    time = np.linspace(0.0, 1e-3, 5)
+    trajectory = simulate(
+        model, time, 0.01, space=Space.LOAD, control=lambda t, x, dx: 1.0, include_jamming=True, jamming_method="newton"
+    )
+    assert trajectory.jamming_iterations > 0
+    closed = simulate(model, time, 0.01, space=Space.LOAD, control=lambda t, x, dx: 1.0, include_jamming=True)
+    assert closed.jamming_iterations == 0
+    np.testing.assert_allclose(trajectory.position, closed.position, rtol=1e-9)
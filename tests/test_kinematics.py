@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Data, Model
+from twisted_strings.kinematics import (
+    CacheInfo,
+    KinematicsCache,
+    batch,
+    contraction,
+    contraction_speed,
+    djacobian,
+    fast,
+    jacobian,
+    motor_acceleration,
+    motor_angle,
+    motor_speed,
+)
+
+THETA = np.linspace(10.0, 150.0, 15)
+DTHETA = np.linspace(-20.0, 20.0, 15)
+
+
+def test_batch_kinematics_match_scalar_functions():
+    model, data = Model(), Data()
+    x = batch.contraction(model, THETA)
+    dx = batch.contraction_speed(model, x, DTHETA)
+    for i, (theta, dtheta) in enumerate(zip(THETA, DTHETA, strict=True)):
+        assert x[i] == pytest.approx(contraction(model, data, theta))
+        assert batch.motor_angle(model, x[i]) == pytest.approx(motor_angle(model, data, x[i]))
+        assert batch.jacobian(model, theta=theta) == pytest.approx(jacobian(model, data, theta=theta))
+        assert batch.jacobian(model, x=x[i]) == pytest.approx(jacobian(model, data, theta=theta))
+        assert dx[i] == pytest.approx(contraction_speed(model, data, x[i], dtheta))
+        assert batch.motor_speed(model, theta, dx[i]) == pytest.approx(motor_speed(model, data, theta, dx[i]))
+        assert batch.djacobian(model, theta, dtheta) == pytest.approx(djacobian(model, data, theta, dtheta))
+        assert batch.motor_acceleration(model, x[i], dx[i], 0.5) == pytest.approx(
+            motor_acceleration(model, data, (x[i], dx[i], 0.5))
+        )
+
+
+def test_batch_states_are_inverse():
+    model = Model()
+    x, dx, J, dJ = batch.motor_state(model, THETA, DTHETA)
+    theta, dtheta, J_load, dJ_load = batch.load_state(model, x, dx)
+    np.testing.assert_allclose(theta, THETA, rtol=1e-9)
+    np.testing.assert_allclose(dtheta, DTHETA, rtol=1e-9)
+    np.testing.assert_allclose(J_load, J, rtol=1e-9)
+    np.testing.assert_allclose(dJ_load, dJ, rtol=1e-9)
+
+
+def test_batch_kinematics_broadcast_model_arrays():
+    model = Model()
+    radii = np.array([8e-4, 1e-3, 1.2e-3])
+    model.kinematic.radius = radii
+    for radius, x in zip(radii, batch.contraction(model, 50.0), strict=True):
+        single = Model()
+        single.kinematic.radius = radius
+        assert x == pytest.approx(batch.contraction(single, 50.0))
+
+
+def test_kinematics_cache_hits_and_invalidates_on_model_change():
+    model, cache = Model(), KinematicsCache(maxsize=2)
+    assert cache.jacobian(model, theta=100.0) == pytest.approx(jacobian(model, Data(), theta=100.0))
+    cache.jacobian(model, theta=100.0)
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    model.kinematic.radius = 1.5e-3
+    assert cache.contraction(model, 50.0) == pytest.approx(contraction(model, Data(), 50.0))
+    cache.jacobian(model, theta=100.0)
+    assert cache.cache_info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+    with pytest.raises(ValueError):
+        cache.jacobian(model)
+
+
+def test_fast_kinematics_match_batch_kinematics():
+    model = Model()
+    L, r = model.kinematic.length, model.kinematic.radius
+    x, dx, J, dJ = batch.motor_state(model, THETA, DTHETA)
+    for i, (theta, dtheta) in enumerate(zip(THETA, DTHETA, strict=True)):
+        assert fast.motor_state(theta, dtheta, L, r) == pytest.approx((x[i], dx[i], J[i], dJ[i]), rel=1e-12)
+        assert fast.load_state(x[i], dx[i], L, r) == pytest.approx((theta, dtheta, J[i], dJ[i]), rel=1e-9)
+        assert fast.contraction(theta, L, r) == pytest.approx(x[i], rel=1e-12)
+        assert fast.motor_angle(x[i], L, r) == pytest.approx(theta, rel=1e-9)
+        assert fast.jacobian(theta, L, r) == pytest.approx(J[i], rel=1e-12)
+        assert fast.djacobian(theta, dtheta, L, r) == pytest.approx(dJ[i], rel=1e-12)
+        assert fast.motor_acceleration(x[i], dx[i], 0.5, L, r) == pytest.approx(
+            batch.motor_acceleration(model, x[i], dx[i], 0.5), rel=1e-9
+        )
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.control import ModelPredictive
+from twisted_strings.dynamics import Space
+from twisted_strings.simulation import simulate
+
+pytest.importorskip("casadi")
+
+
+def _regulate(mpc, model, x, target, steps):
+    dx = 0.0
+    for _ in range(steps):
+        force = mpc.step(x, dx, target)
+        plant = simulate(model, np.array([0.0, mpc.dt]), x, dx, Space.LOAD, lambda *_, u=force: u, method="midpoint")
+        x, dx = plant.position[-1], plant.velocity[-1]
+    return x
+
+
+def test_mpc_regulates_the_contraction():
+    model = Model()
+    mpc = ModelPredictive(
+        model, horizon=10, dt=0.01, weights=(1e4, 0.0, 1e-6), position_bounds=(1e-3, 0.15), input_bounds=(-100, 100)
+    )
+    x = _regulate(mpc, model, 0.02, 0.03, 30)
+    assert mpc.success
+    assert x == pytest.approx(0.03, abs=1e-4)
+    assert mpc.position[0] == pytest.approx(x, abs=1e-3)
+
+
+def test_mpc_warm_start_and_shared_solver():
+    model = Model()
+    options = {"weights": (1e4, 0.0, 1e-6), "position_bounds": (1e-3, 0.15), "input_bounds": (-100, 100)}
+    mpc = ModelPredictive(model, horizon=10, dt=0.01, **options)
+    assert ModelPredictive(model, horizon=10, dt=0.02, **options)._solver is mpc._solver
+
+    mpc.step(0.03, 0.0, 0.03)
+    cold = mpc.iterations
+    mpc.step(0.03, 0.0, 0.03)
+    assert mpc.iterations <= cold
+
+    mpc.reset()
+    assert not mpc.success
+    with pytest.raises(ValueError, match="reference"):
+        mpc.step(0.03, 0.0, np.zeros(3))
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.planning import TrajectoryOptimizer
+
+pytest.importorskip("casadi")
+
+LIMITS = {"torque_limit": 0.5, "speed_limit": 500.0, "external": 0.5}
+
+
+def test_time_optimal_plan_respects_the_limits():
+    plan = TrajectoryOptimizer(Model(), objective="time", intervals=30, **LIMITS).solve(0.01, 0.05)
+    assert plan.success
+    assert plan.position[0] == pytest.approx(0.01) and plan.position[-1] == pytest.approx(0.05)
+    assert plan.velocity[0] == pytest.approx(0.0, abs=1e-9) and plan.velocity[-1] == pytest.approx(0.0, abs=1e-9)
+    assert np.abs(plan.torque).max() <= LIMITS["torque_limit"] * (1 + 1e-6)
+    assert np.abs(plan.motor_velocity).max() <= LIMITS["speed_limit"] * (1 + 1e-6)
+    assert plan.cost == pytest.approx(plan.duration)
+
+
+def test_energy_optimal_plan_uses_less_torque():
+    model = Model()
+    fastest = TrajectoryOptimizer(model, objective="time", intervals=30, **LIMITS).solve(0.01, 0.05)
+    slow = TrajectoryOptimizer(model, objective="energy", intervals=30, **LIMITS).solve(
+        0.01, 0.05, duration=2 * fastest.duration
+    )
+    assert slow.success
+    assert slow.duration == pytest.approx(2 * fastest.duration)
+    assert np.abs(slow.torque).max() < np.abs(fastest.torque).max()
+
+
+def test_solve_batch_matches_single_solves():
+    optimizer = TrajectoryOptimizer(Model(), objective="time", intervals=30, **LIMITS)
+    targets = np.array([0.03, 0.035, 0.04])
+    plans = optimizer.solve_batch(0.01, targets)
+    assert all(plan.success for plan in plans)
+    for target, plan in zip(targets, plans, strict=True):
+        assert plan.duration == pytest.approx(optimizer.solve(0.01, target).duration, rel=1e-4)
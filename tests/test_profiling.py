@@ -0,0 +1,67 @@
+from twisted_strings import Data, Model, dynamics
+from twisted_strings.dynamics import Space, forward_dynamics, nonlinear
+from twisted_strings.profiling import Profiler, compare, load
+
+
+def _run(calls=3):
+    model, data = Model(), Data()
+    data.motor.position, data.motor.velocity = 60.0, 5.0
+    for _ in range(calls):
+        forward_dynamics(model, data, Space.MOTOR)
+
+
+def test_profiler_counts_root_calls_and_restores_the_functions():
+    original = dynamics.forward_dynamics
+    with Profiler() as profiler:
+        assert dynamics.forward_dynamics is not original
+        _run()
+    assert dynamics.forward_dynamics is original
+
+    summary = profiler.summary()
+    assert summary["functions"]["dynamics.forward_dynamics"]["calls"] == 3
+    assert summary["functions"]["dynamics.forward_dynamics"]["depth"] == 1
+    assert summary["roots"]["dynamics.forward_dynamics"]["calls"] == 3
+    assert "dynamics.forward_dynamics" in profiler.report()
+
+    # a disabled profiler records nothing
+    _run()
+    assert profiler.summary() == summary
+
+
+def test_profiler_summary_round_trip(tmp_path):
+    with Profiler() as profiler:
+        _run(1)
+    path = tmp_path / "profile.json"
+    profiler.save(str(path))
+    baseline = load(str(path))
+    assert compare(baseline, baseline) == {}
+
+    profiler.reset()
+    with profiler:
+        _run(2)
+    differences = compare(baseline, profiler.summary())
+    assert differences["dynamics.forward_dynamics"]["calls"] == (1, 2)
+
+
+def test_profiler_counts_nested_and_redundant_calls():
+    model, data = Model(), Data()
+    data.motor.position, data.motor.velocity = 60.0, 5.0
+    with Profiler(roots=("dynamics.nonlinear",)) as profiler:
+        for _ in range(2):
+            nonlinear(model, data, Space.MOTOR)
+
+    functions = profiler.functions
+    root, coriolis, jacobian = (
+        functions[name] for name in ("dynamics.nonlinear", "dynamics.coriolis", "kinematics.jacobian")
+    )
+    assert root.depth == 1 and coriolis.depth == 2 and jacobian.depth > 2
+    # the Jacobian is recomputed from the same state inside coriolis and recursively inside itself
+    assert jacobian.redundant > 0 and jacobian.recursion > 1
+    assert root.redundant == coriolis.redundant == 0
+    assert all(0.0 < stats.own <= stats.total for stats in functions.values() if stats.calls)
+    assert root.own < root.total
+
+    calls = profiler.root_calls["dynamics.nonlinear"]
+    assert calls.calls == 2
+    assert calls.redundant == sum(stats.redundant for stats in functions.values())
+    assert calls.redundant_per_call == calls.redundant / 2 > 0
@@ -0,0 +1,68 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from twisted_strings import BatchData, Data, Model
+
+
+def _data(seed):
+    data = Data()
+    for i, name in enumerate(Data.dtype["motor"].names):
+        setattr(data.motor, name, seed + i)
+        setattr(data.load, name, seed - i)
+    return data
+
+
+def _model(seed):
+    model = Model()
+    model.kinematic.radius += seed * 1e-4
+    model.dynamic.load.damping = 0.1 * seed
+    model.stiffness.longitudinal = 1e3 + seed
+    return model
+
+
+def test_data_record_round_trip():
+    data = _data(1.0)
+    record = data.to_array()
+    assert record.shape == () and record.dtype == Data.dtype
+    assert record["load"]["position"] == data.load.position
+    assert Data.from_array(record) == data
+    assert type(data.motor).from_array(data.motor.to_array()) == data.motor
+
+
+def test_model_record_round_trip_keeps_nested_fields():
+    model = _model(2.0)
+    record = model.to_array()
+    assert record.dtype == Model.dtype
+    assert record["dynamic"]["load"]["damping"] == pytest.approx(0.2)
+    assert record["stiffness"]["longitudinal"] == 1002.0
+    restored = Model.from_array(record)
+    assert restored == model
+    assert restored.dynamic.load is not model.dynamic.load
+
+
+@pytest.mark.parametrize(("cls", "make"), [(Data, _data), (Model, _model)])
+def test_stacked_records_round_trip(cls, make):
+    objects = [make(float(seed)) for seed in range(4)]
+    stacked = np.array([obj.to_array() for obj in objects])
+    assert stacked.shape == (4,) and stacked.dtype == cls.dtype
+    assert [cls.from_array(record) for record in stacked] == objects
+    # records survive a raw buffer round trip, e.g. through a file
+    assert cls.from_array(np.frombuffer(stacked.tobytes(), dtype=cls.dtype)[2]) == objects[2]
+
+
+@pytest.mark.parametrize("obj", [_data(3.0), _data(3.0).load, _model(3.0), _model(3.0).dynamic])
+def test_slotted_dataclasses_pickle_and_copy(obj):
+    assert not hasattr(obj, "__dict__")
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert copy.deepcopy(obj) == obj
+
+
+def test_batch_data_pickles():
+    data = BatchData(3)
+    data.motor.position = [1.0, 2.0, 3.0]
+    restored = pickle.loads(pickle.dumps(data))
+    np.testing.assert_array_equal(restored.buffer, data.buffer)
+    np.testing.assert_array_equal(restored.motor.position, [1.0, 2.0, 3.0])
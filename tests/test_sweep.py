@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+
+from twisted_strings import Model
+from twisted_strings.simulation import parameter_grid, sweep
+
+TIME = np.linspace(0.0, 0.002, 5)
+
+
+def _sweep(checkpoint, workers=0, **options):
+    grid = parameter_grid({"kinematic.radius": np.linspace(8e-4, 1.2e-3, 6)})
+    options = {"time": TIME, "position": 50.0, "velocity": 10.0, "method": "rk45", **options}
+    return sweep(Model(), grid, chunk_size=2, workers=workers, checkpoint=checkpoint and str(checkpoint), **options)
+
+
+def test_sweep_resumes_from_checkpoint(tmp_path):
+    first = _sweep(tmp_path)
+    chunks = sorted(name for name in os.listdir(tmp_path) if name.startswith("chunk_"))
+    assert len(chunks) == 3
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+    os.remove(tmp_path / chunks[1])
+    done = []
+    resumed = _sweep(tmp_path, progress=lambda count, total: done.append(count))
+    assert done == [6]
+    np.testing.assert_array_equal(resumed, first)
+    np.testing.assert_array_equal(_sweep(None), first)
+
+
+@pytest.mark.parametrize("options", [{"time": 2 * TIME}, {"position": 40.0}, {"method": "euler"}])
+def test_sweep_refuses_a_different_checkpoint(tmp_path, options):
+    _sweep(tmp_path)
+    with pytest.raises(ValueError, match="different sweep"):
+        _sweep(tmp_path, **options)
+
+
+def test_sweep_in_worker_processes_matches_the_serial_sweep(tmp_path):
+    serial = _sweep(None)
+    np.testing.assert_array_equal(_sweep(None, workers=2), serial)
+
+    # a partial checkpoint is completed by the workers
+    _sweep(tmp_path)
+    for name in sorted(name for name in os.listdir(tmp_path) if name.startswith("chunk_"))[1:]:
+        os.remove(tmp_path / name)
+    done = []
+    resumed = _sweep(tmp_path, workers=2, progress=lambda count, total: done.append((count, total)))
+    assert done[-1] == (6, 6) and len(done) == 2
+    np.testing.assert_array_equal(resumed, serial)
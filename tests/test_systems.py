@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Data, Model
+from twisted_strings.dynamics import Space
+from twisted_strings.dynamics import forward_dynamics as actuator_forward_dynamics
+from twisted_strings.systems import SystemData, SystemModel, coriolis, forward_dynamics, inertia, tension
+
+
+def test_single_actuator_system_matches_the_load_space_dynamics():
+    model = Model()
+    system = SystemModel.from_models([model], coupling=[1.0])
+    data = SystemData(system)
+    data.position[:], data.velocity[:], data.torque[:] = 0.02, 0.05, 0.03
+    ddq = forward_dynamics(system, data)
+
+    actuator = Data()
+    actuator.load.position, actuator.load.velocity = 0.02, 0.05
+    actuator.load.force = 0.03 / data.actuators.load.jacobian[0]
+    assert ddq[0] == pytest.approx(actuator_forward_dynamics(model, actuator, Space.LOAD), rel=1e-12)
+    assert inertia(system, data)[0, 0] == pytest.approx(actuator.load.inertia, rel=1e-12)
+    assert coriolis(system, data)[0, 0] == pytest.approx(actuator.load.coriolis, rel=1e-12)
+    # without joint inertia the string carries no tension
+    assert data.tension[0] == pytest.approx(0.0, abs=1e-12 * actuator.load.force)
+
+
+def test_tensions_balance_the_joint_load_at_static_equilibrium():
+    R, light = 0.02, Model()
+    light.kinematic.radius = 1e-3
+    system = SystemModel.from_models([Model(), light], coupling=[R, -R], offset=0.03, inertia=1e-4, damping=1e-3)
+    data = SystemData(system)
+    data.position[:], data.torque[:] = 0.2, (0.05, 0.02)
+
+    # the external load holding the joint at rest
+    forward_dynamics(system, data)
+    data.external = -system.coupling.T @ (data.torque / data.actuators.load.jacobian)
+    np.testing.assert_allclose(forward_dynamics(system, data), 0.0, atol=1e-12)
+
+    T = tension(system, data)
+    np.testing.assert_allclose(T, data.torque / data.actuators.load.jacobian, rtol=1e-12)
+    np.testing.assert_allclose(system.coupling.T @ T + data.external, 0.0, atol=1e-12 * np.abs(T).max())
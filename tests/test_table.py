@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from twisted_strings import Data, Model
+from twisted_strings.kinematics import ContractionTable, contraction, jacobian
+
+
+def test_table_matches_closed_form():
+    model = Model()
+    table = ContractionTable.from_model(model, size=2048)
+    theta = np.linspace(-0.8, 0.8, 101) * table.theta_max
+
+    data = Data()
+    np.testing.assert_allclose(table.contraction(theta), contraction(model, data, theta), atol=1e-9)
+    np.testing.assert_allclose(table.jacobian(theta), jacobian(model, data, theta), atol=1e-9)
+    np.testing.assert_allclose(table.motor_angle(table.contraction(np.abs(theta))), np.abs(theta), atol=1e-6)
+    assert max(table.error.values()) < 1e-6
+
+
+def test_table_rejects_queries_outside_the_range():
+    table = ContractionTable.from_model(Model(), size=64)
+    assert table.contraction(table.theta_max) == pytest.approx(table.x[-1])
+    with pytest.raises(ValueError, match="range"):
+        table.contraction(np.array([0.0, 1.01 * table.theta_max]))
+    with pytest.raises(ValueError, match="range"):
+        table.jacobian(-1.01 * table.theta_max)
+    with pytest.raises(ValueError, match="range"):
+        table.motor_angle(1.01 * table.x[-1])
+
+
+def test_table_stores_the_requested_dtype(tmp_path):
+    model = Model()
+    table = ContractionTable.from_model(model, size=256, dtype=np.float32)
+    assert table.x.dtype == table._x.dtype == np.float32
+    reference = ContractionTable.from_model(model, size=256)
+    assert table.error["contraction"] < 1e-6
+    np.testing.assert_allclose(table.contraction(1.0), reference.contraction(1.0), rtol=1e-6)
+
+    table.save(tmp_path / "table.npz")
+    loaded = ContractionTable.load(tmp_path / "table.npz")
+    assert loaded.error == table.error
+    assert loaded.contraction(1.0) == table.contraction(1.0)
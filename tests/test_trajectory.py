@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from twisted_strings import BatchData, Data, Model
+from twisted_strings.dynamics import Space, inverse_dynamics, trajectory_inverse_dynamics
+from twisted_strings.kinematics import acceleration_constraint, motor_acceleration
+
+t = np.linspace(0.0, 1.0, 7)
+REFERENCES = {
+    Space.MOTOR: (40.0 + 30.0 * t, 30.0 + 5.0 * t, -20.0 + 50.0 * t),
+    Space.LOAD: (0.005 + 0.01 * t, 0.01 + 0.02 * t, -0.1 + 0.3 * t),
+}
+
+
+@pytest.mark.parametrize("include_jamming", [False, True])
+@pytest.mark.parametrize("space", [Space.MOTOR, Space.LOAD])
+def test_trajectory_inverse_dynamics_matches_inverse_dynamics(space, include_jamming):
+    model, data = Model(), BatchData(len(t))
+    position, velocity, acceleration = REFERENCES[space]
+    forces = trajectory_inverse_dynamics(model, position, velocity, acceleration, space, include_jamming, data)
+
+    for i, (q, dq, ddq) in enumerate(zip(position, velocity, acceleration, strict=True)):
+        waypoint = Data()
+        state = waypoint.motor if space == Space.MOTOR else waypoint.load
+        state.position, state.velocity, state.acceleration = q, dq, ddq
+        assert forces[i] == pytest.approx(inverse_dynamics(model, waypoint, space, include_jamming), rel=1e-10)
+
+        # the accelerations of both spaces satisfy the acceleration constraint
+        thetas = (data.motor.position[i], data.motor.velocity[i], data.motor.acceleration[i])
+        xs = (data.load.position[i], data.load.velocity[i], data.load.acceleration[i])
+        scale = model.kinematic.length * abs(xs[2]) + (model.kinematic.radius * thetas[1]) ** 2
+        assert acceleration_constraint(model, Data(), thetas, xs) == pytest.approx(0.0, abs=1e-10 * scale)
+
+
+def test_motor_acceleration_subtracts_the_jacobian_rate_times_the_motor_speed():
+    model, data = Model(), Data()
+    L, r = model.kinematic.length, model.kinematic.radius
+    theta, dtheta, ddtheta = 60.0, 20.0, 300.0
+    # exact load kinematics of the motor motion from x = L - sqrt(L^2 - (theta r)^2)
+    s = np.sqrt(L**2 - (theta * r) ** 2)
+    J = theta * r**2 / s
+    dJ = r**2 * L**2 * dtheta / s**3
+    x, dx, ddx = L - s, J * dtheta, J * ddtheta + dJ * dtheta
+    assert motor_acceleration(model, data, (x, dx, ddx)) == pytest.approx(ddtheta, rel=1e-9)
@@ -18,8 +18,17 @@ like SymPy for symbolic calculations.
 Main components:
 - Model: Represents the physical parameters and properties of a TSA
 - Data: Stores the state variables and computed values for a TSA
+- BatchData: Array-backed Data for advancing many actuators in one vectorized call
 - Kinematics: Functions for computing kinematic properties (e.g., contraction, jacobian)
 - Dynamics: Functions for computing dynamic properties and simulating TSA behavior
+- Codegen: Flat NumPy/CasADi functions generated from the symbolic dynamics
+- Identification: Least squares fitting of the model parameters to logged trajectories
+- Estimation: Streaming reconstruction of the load state from motor encoder logs
+- Systems: Several actuators composed onto a shared joint with coupled dynamics
+- Control: Real-time load space controllers with precomputed constants and buffers
+- Planning: Time and energy optimal contraction profiles by direct collocation
+- IO: Columnar, memory-mapped logs of Data streams with the model in the header
+- Profiling: Opt-in call counting and timing of the kinematics and dynamics functions
 
 This module is intended for researchers, engineers, and developers working on
 robotic systems, soft actuators, or any application involving twisted string actuators.
@@ -27,9 +36,5 @@ It provides tools for design optimization, control system development, and perfo
 of TSA-based systems.
 """
 
-from ._structs import Data, Model
-
-
-# TODO:
-# Create compute_all function
-# Think about code gen features
+from ._structs import BatchData, Data, Model
+from .dynamics import compute_all
@@ -1,2 +1,4 @@
-from ._data import Data, Space
+from ._data import BatchData, Data, Space, SpaceData
 from ._model import Model
+from ._paths import get_field, set_field
+from ._records import from_columns
@@ -1,13 +1,17 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import IntEnum
 
+import numpy as np
+
+from ._records import from_record, record_dtype, to_record
+
 
 class Space(IntEnum):
     MOTOR = 1
     LOAD = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaceData:
     """
     Data structure for storing state and dynamic information for a specific space (motor or load) in the twisted string actuator system.
@@ -38,8 +42,30 @@ class SpaceData:
     static: float = 0.0
     jamming: float = 0.0
 
+    def to_array(self) -> np.ndarray:
+        """
+        Pack the fields into a 0-d record array of dtype SpaceData.dtype.
+
+        Returns:
+            np.ndarray: The record holding a copy of every field.
+        """
+        return to_record(self)
+
+    @classmethod
+    def from_array(cls, record: np.ndarray) -> "SpaceData":
+        """
+        Unpack a record of dtype SpaceData.dtype.
+
+        Args:
+            record (np.ndarray): The record, e.g. one element of a record array.
+
+        Returns:
+            SpaceData: The unpacked data.
+        """
+        return from_record(cls, record)
 
-@dataclass
+
+@dataclass(slots=True)
 class Data:
     """
     Data structure for storing state and dynamic information for both motor and load spaces in the twisted string actuator system.
@@ -52,6 +78,136 @@ class Data:
     motor: SpaceData = field(default_factory=SpaceData)
     load: SpaceData = field(default_factory=SpaceData)
 
+    def to_array(self) -> np.ndarray:
+        """
+        Pack both spaces into a 0-d record array of dtype Data.dtype.
+
+        Snapshots stack into a single record array with named columns:
+
+            records = np.array([snapshot.to_array() for snapshot in snapshots])
+            records["motor"]["position"]
+
+        Returns:
+            np.ndarray: The record holding a copy of the 22 fields.
+        """
+        return to_record(self)
+
+    @classmethod
+    def from_array(cls, record: np.ndarray) -> "Data":
+        """
+        Unpack a record of dtype Data.dtype.
+
+        Args:
+            record (np.ndarray): The record, e.g. one element of a record array.
+
+        Returns:
+            Data: The unpacked data.
+        """
+        return from_record(cls, record)
+
+
+SpaceData.dtype = record_dtype(SpaceData)
+Data.dtype = record_dtype(Data)
+
+
+def _column(index: int) -> property:
+    def getter(self: "BatchSpaceData") -> np.ndarray:
+        return self._buffer[index]
+
+    def setter(self: "BatchSpaceData", value: np.ndarray) -> None:
+        self._buffer[index] = value
+
+    return property(getter, setter)
+
+
+class BatchSpaceData:
+    """
+    Array-backed counterpart of SpaceData holding one space of many actuators.
+
+    Every attribute of SpaceData is exposed as a contiguous float64 view into the buffer
+    owned by BatchData. Assigning to an attribute writes into that buffer in place (scalars
+    are broadcast), so the kinematics and dynamics functions update the whole batch without
+    allocating new containers.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, buffer: np.ndarray):
+        self._buffer = buffer
+
+    position = _column(0)
+    velocity = _column(1)
+    acceleration = _column(2)
+    jacobian = _column(3)
+    djacobian = _column(4)
+    force = _column(5)
+    coriolis = _column(6)
+    inertia = _column(7)
+    nonlinear = _column(8)
+    static = _column(9)
+    jamming = _column(10)
+
+    def __repr__(self) -> str:
+        return f"BatchSpaceData(size={self._buffer.shape[-1]})"
+
+
+class BatchData:
+    """
+    Structure-of-arrays data for a batch of twisted string actuators.
+
+    The state of N actuators is stored in a single float64 buffer of shape (2, 11, N), indexed
+    by space (motor, load) and by SpaceData field, so each field of each space is a contiguous
+    array of length N. BatchData exposes the same ``motor``/``load`` attribute layout as Data
+    and can be passed to every kinematics and dynamics function in place of it, advancing the
+    whole batch in one vectorized call.
+
+    Note:
+        Attributes return views into the buffer rather than copies. Keep a copy if a value must
+        survive a later call that overwrites the same field.
+
+    Attributes:
+        buffer (np.ndarray): The underlying (2, 11, N) float64 buffer.
+        motor (BatchSpaceData): Data for the motor space.
+        load (BatchSpaceData): Data for the load space.
+    """
+
+    __slots__ = ("buffer", "motor", "load")
+
+    def __init__(self, size: int):
+        self.buffer = np.zeros((2, len(fields(SpaceData)), size))
+        self.motor = BatchSpaceData(self.buffer[0])
+        self.load = BatchSpaceData(self.buffer[1])
+
+    def __len__(self) -> int:
+        return self.buffer.shape[-1]
+
+    def __repr__(self) -> str:
+        return f"BatchData(size={len(self)})"
+
+    def __getitem__(self, index: int) -> Data:
+        motor, load = self.buffer[..., index].tolist()
+        return Data(motor=SpaceData(*motor), load=SpaceData(*load))
+
+    def __setitem__(self, index: int, data: Data) -> None:
+        for space, values in enumerate((data.motor, data.load)):
+            self.buffer[space, :, index] = [getattr(values, f.name) for f in fields(SpaceData)]
+
+    @classmethod
+    def from_data(cls, snapshots: list[Data]) -> "BatchData":
+        """
+        Pack a sequence of Data objects into a BatchData.
+
+        Args:
+            snapshots (list[Data]): The data objects, one per actuator.
+
+        Returns:
+            BatchData: The batch holding a copy of every snapshot.
+        """
+        batch = cls(len(snapshots))
+        for index, data in enumerate(snapshots):
+            batch[index] = data
+        return batch
+
 
 # TODO: Should we mark space with ENUM value?
 # Maybe it will be easier to separate kinematics and dynamics in data?
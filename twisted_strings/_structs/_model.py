@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
+from ._records import from_record, record_dtype, to_record
+
+
+@dataclass(slots=True)
 class KinematicParameters:
     """
     Kinematic parameters for the twisted string actuator.
@@ -15,7 +19,7 @@ class KinematicParameters:
     length: float = 0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaceParameters:
     """
     Parameters for a specific space (motor or load) in the twisted string actuator system.
@@ -31,7 +35,7 @@ class SpaceParameters:
     friction: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicParameters:
     """
     Dynamic parameters for both motor and load spaces in the twisted string actuator system.
@@ -57,7 +61,7 @@ class DynamicParameters:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class StiffnessParameters:
     """
     Stiffness parameters for the twisted string actuator.
@@ -71,7 +75,7 @@ class StiffnessParameters:
     longitudinal: float = 5000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     """
     Complete model of the twisted string actuator system.
@@ -88,3 +92,30 @@ class Model:
     kinematic: KinematicParameters = field(default_factory=KinematicParameters)
     dynamic: DynamicParameters = field(default_factory=DynamicParameters)
     stiffness: StiffnessParameters = field(default_factory=StiffnessParameters)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Pack all parameters into a 0-d record array of dtype Model.dtype.
+
+        The nested fields are kept as named sub-records, e.g. ``record["kinematic"]["radius"]``.
+
+        Returns:
+            np.ndarray: The record holding a copy of every parameter.
+        """
+        return to_record(self)
+
+    @classmethod
+    def from_array(cls, record: np.ndarray) -> "Model":
+        """
+        Unpack a record of dtype Model.dtype.
+
+        Args:
+            record (np.ndarray): The record, e.g. one element of a record array.
+
+        Returns:
+            Model: The unpacked model.
+        """
+        return from_record(cls, record)
+
+
+Model.dtype = record_dtype(Model)
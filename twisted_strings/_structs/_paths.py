@@ -0,0 +1,16 @@
+from typing import Any
+
+
+def get_field(obj: Any, path: str) -> Any:
+    """Read a nested field given by a dotted path, e.g. ``get_field(model, "kinematic.radius")``."""
+    for name in path.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def set_field(obj: Any, path: str, value: Any) -> None:
+    """Write a nested field given by a dotted path, e.g. ``set_field(model, "kinematic.radius", 2e-3)``."""
+    *parents, name = path.split(".")
+    for parent in parents:
+        obj = getattr(obj, parent)
+    setattr(obj, name, value)
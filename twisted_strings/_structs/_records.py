@@ -0,0 +1,60 @@
+from dataclasses import fields, is_dataclass
+from functools import cache
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+
+
+def record_dtype(cls: type) -> np.dtype:
+    """Structured float64 dtype mirroring the (nested) fields of a dataclass."""
+    return np.dtype([(f.name, record_dtype(f.type) if is_dataclass(f.type) else np.float64) for f in fields(cls)])
+
+
+@cache
+def _layout(cls: type) -> tuple[attrgetter, tuple[type | None, ...]]:
+    """Getter of all fields of cls at once and the dataclass type of each nested field."""
+    return attrgetter(*(f.name for f in fields(cls))), tuple(
+        f.type if is_dataclass(f.type) else None for f in fields(cls)
+    )
+
+
+def _values(obj: Any) -> tuple:
+    getter, nested = _layout(type(obj))
+    values = getter(obj)
+    if not any(nested):
+        return values
+    return tuple(value if cls is None else _values(value) for value, cls in zip(values, nested, strict=True))
+
+
+def _build(cls: type, values: tuple) -> Any:
+    _, nested = _layout(cls)
+    if not any(nested):
+        return cls(*values)
+    return cls(
+        *(
+            value if field_cls is None else _build(field_cls, value)
+            for value, field_cls in zip(values, nested, strict=True)
+        )
+    )
+
+
+def to_record(obj: Any) -> np.ndarray:
+    """Pack a dataclass instance into a 0-d structured array of its record dtype."""
+    return np.array(_values(obj), dtype=type(obj).dtype)
+
+
+def from_record(cls: type, record: np.ndarray) -> Any:
+    """Unpack a structured record (or 0-d structured array) into a dataclass instance."""
+    return _build(cls, record.item())
+
+
+def from_columns(cls: type, records: np.ndarray) -> Any:
+    """Unpack a 1-d structured array into one dataclass instance whose fields hold arrays over the records."""
+    _, nested = _layout(cls)
+    return cls(
+        *(
+            np.array(records[f.name]) if field_cls is None else from_columns(field_cls, records[f.name])
+            for f, field_cls in zip(fields(cls), nested, strict=True)
+        )
+    )
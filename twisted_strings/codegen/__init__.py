@@ -0,0 +1,21 @@
+"""
+Code Generation for Twisted String Actuators
+
+This module traces the dynamics functions once with symbolic inputs and emits flat,
+branch-free functions of positional arrays, suitable for high rate control loops where
+re-running the Data based functions every tick is too slow.
+
+Backends (optional dependencies):
+- "numpy": traced with SymPy, common subexpressions eliminated, emitted as NumPy code
+- "casadi": traced with CasADi SX, optionally generated as C and compiled locally
+
+Every quantity is traced once per space and backend, and the generated functions are
+cached, so repeated calls to ``generate`` are free. ``clear_cache`` releases them.
+
+Example:
+    f = codegen.generate("forward_dynamics", Space.MOTOR)
+    ddtheta = f(theta, dtheta, torque, *codegen.parameters(model))
+"""
+
+from ._generate import casadi_function, clear_cache, generate, numpy_function
+from ._trace import PARAMETERS, QUANTITIES, arguments, cached_trace, parameters, trace
@@ -0,0 +1,127 @@
+import os
+import tempfile
+from collections.abc import Callable
+from functools import cache
+
+from .._structs import Space
+from ._trace import _TRACES, arguments, cached_trace
+
+
+def numpy_function(quantity: str, space: Space = Space.MOTOR) -> Callable:
+    """
+    Generate a flat NumPy function of a dynamics quantity.
+
+    The quantity is traced once with SymPy, common subexpressions are eliminated and the
+    result is emitted as straight-line, branch-free NumPy code taking positional arrays in
+    the order given by ``arguments(quantity)``. The generated source is available in the
+    ``__doc__`` of the returned function. Functions are cached per quantity and space.
+
+    Args:
+        quantity (str): One of "inertia", "nonlinear", "forward_dynamics" or "inverse_dynamics".
+        space (Space, optional): The space enum (MOTOR or LOAD). Defaults to Space.MOTOR.
+
+    Returns:
+        Callable: The generated function.
+
+    Raises:
+        ImportError: If SymPy is not installed.
+    """
+    return _numpy_function(quantity, space)
+
+
+@cache
+def _numpy_function(quantity: str, space: Space) -> Callable:
+    import sympy as sp
+
+    symbols, expression = cached_trace(quantity, space, sp.Symbol)
+    # turn the float exponents (** 0.5) of the traced code into exact square roots
+    expression = sp.nsimplify(expression, rational=True)
+    function = sp.lambdify(symbols, expression, modules="numpy", cse=True)
+    function.__name__ = f"{quantity}_{space.name.lower()}"
+    return function
+
+
+def casadi_function(
+    quantity: str,
+    space: Space = Space.MOTOR,
+    compile: bool = False,
+    directory: str | None = None,
+):
+    """
+    Generate a CasADi function of a dynamics quantity, optionally compiled to C.
+
+    Repeated subexpressions of the traced graph, such as the square root of the
+    contraction, are merged by ``casadi.cse`` before the function is built. Functions are
+    cached per quantity, space and compilation options.
+
+    Args:
+        quantity (str): One of "inertia", "nonlinear", "forward_dynamics" or "inverse_dynamics".
+        space (Space, optional): The space enum (MOTOR or LOAD). Defaults to Space.MOTOR.
+        compile (bool, optional): Whether to generate C code and load it back as a compiled
+            external function. Requires a system C compiler. Defaults to False.
+        directory (str | None, optional): Where the generated C source and shared library are
+            written. Defaults to a new temporary directory.
+
+    Returns:
+        casadi.Function: The generated function with positional scalar arguments in the order
+            given by ``arguments(quantity)``.
+
+    Raises:
+        ImportError: If CasADi is not installed.
+    """
+    return _casadi_function(quantity, space, compile, directory)
+
+
+@cache
+def _casadi_function(quantity: str, space: Space, compile: bool, directory: str | None):
+    import casadi as ca
+
+    name = f"{quantity}_{space.name.lower()}"
+    symbols, expression = cached_trace(quantity, space, ca.SX.sym)
+    function = ca.Function(name, list(symbols), [ca.cse(expression)], list(arguments(quantity)), [quantity])
+
+    if not compile:
+        return function
+
+    directory = tempfile.mkdtemp(prefix="twisted_strings_") if directory is None else directory
+    # write the source and the compiler outputs straight into the directory, not the working directory
+    generator = ca.CodeGenerator(f"{name}.c")
+    generator.add(function)
+    source = generator.generate(os.path.join(directory, ""))
+    importer = ca.Importer(source, "shell", {"directory": directory})
+    return ca.external(name, importer)
+
+
+def generate(
+    quantity: str,
+    space: Space = Space.MOTOR,
+    backend: str = "numpy",
+    **options,
+) -> Callable:
+    """
+    Generate a function of a dynamics quantity with the chosen backend.
+
+    Args:
+        quantity (str): One of "inertia", "nonlinear", "forward_dynamics" or "inverse_dynamics".
+        space (Space, optional): The space enum (MOTOR or LOAD). Defaults to Space.MOTOR.
+        backend (str, optional): "numpy" or "casadi". Defaults to "numpy".
+        **options: Extra keyword arguments forwarded to the backend (see casadi_function).
+
+    Returns:
+        Callable: The generated function.
+
+    Raises:
+        ValueError: If an unknown backend is provided.
+    """
+    if backend == "numpy":
+        return numpy_function(quantity, space, **options)
+    if backend == "casadi":
+        return casadi_function(quantity, space, **options)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def clear_cache() -> None:
+    """Release all cached traces and generated functions."""
+    _TRACES.clear()
+    _numpy_function.cache_clear()
+    _casadi_function.cache_clear()
@@ -0,0 +1,151 @@
+from collections.abc import Callable
+from typing import Any
+
+from .._structs import Data, Model, Space, get_field, set_field
+from ..dynamics import forward_dynamics, inertia, inverse_dynamics, nonlinear
+from ..kinematics import contraction, contraction_speed, motor_angle, motor_speed
+
+# Model fields in the order they are passed to generated functions
+PARAMETERS = (
+    "kinematic.radius",
+    "kinematic.length",
+    "dynamic.motor.inertia",
+    "dynamic.motor.damping",
+    "dynamic.motor.friction",
+    "dynamic.load.inertia",
+    "dynamic.load.damping",
+    "dynamic.load.friction",
+    "stiffness.transverse",
+    "stiffness.longitudinal",
+)
+
+QUANTITIES = ("inertia", "nonlinear", "forward_dynamics", "inverse_dynamics")
+
+
+def parameters(model: Model) -> tuple:
+    """
+    Extract the model parameters in the order expected by generated functions.
+
+    Args:
+        model (Model): The model object containing system parameters.
+
+    Returns:
+        tuple: The values of the fields listed in PARAMETERS.
+    """
+    return tuple(get_field(model, path) for path in PARAMETERS)
+
+
+def arguments(quantity: str) -> tuple[str, ...]:
+    """
+    Return the names of the positional arguments of a generated function.
+
+    Args:
+        quantity (str): One of QUANTITIES.
+
+    Returns:
+        tuple[str, ...]: The argument names, state first, then the input (for forward and
+            inverse dynamics), then the model parameters.
+
+    Raises:
+        ValueError: If an unknown quantity is provided.
+    """
+    if quantity not in QUANTITIES:
+        raise ValueError(f"Unknown quantity: {quantity}")
+    state = ("position", "velocity", "input") if quantity.endswith("dynamics") else ("position", "velocity")
+    return state + tuple(path.replace(".", "_") for path in PARAMETERS)
+
+
+def trace(quantity: str, space: Space, symbol: Callable[[str], Any]) -> tuple[list, Any]:
+    """
+    Build the expression of a dynamics quantity from symbolic inputs.
+
+    The state is set in the chosen space and propagated to the other one through the
+    kinematics, so the traced expression depends only on the returned symbols.
+
+    Args:
+        quantity (str): One of QUANTITIES.
+        space (Space): The space enum (MOTOR or LOAD) in which the quantity is expressed.
+        symbol (Callable[[str], Any]): Factory creating a scalar symbol from its name,
+            e.g. ``sympy.Symbol`` or ``casadi.SX.sym``.
+
+    Returns:
+        tuple[list, Any]: The symbols in the order given by ``arguments(quantity)`` and the
+            traced expression.
+
+    Raises:
+        ValueError: If an unknown quantity or invalid space is provided.
+    """
+    symbols = [symbol(name) for name in arguments(quantity)]
+    named = dict(zip(arguments(quantity), symbols, strict=True))
+
+    model = Model()
+    for path in PARAMETERS:
+        set_field(model, path, named[path.replace(".", "_")])
+
+    data = Data()
+    if space == Space.MOTOR:
+        data.motor.position, data.motor.velocity = named["position"], named["velocity"]
+        contraction(model, data)
+        contraction_speed(model, data)
+    elif space == Space.LOAD:
+        data.load.position, data.load.velocity = named["position"], named["velocity"]
+        motor_angle(model, data)
+        motor_speed(model, data)
+    else:
+        raise ValueError(f"Invalid space: {space}")
+
+    if quantity == "inertia":
+        expression = inertia(model, data, space)
+    elif quantity == "nonlinear":
+        expression = nonlinear(model, data, space)
+    elif quantity == "forward_dynamics":
+        data.load.force = named["input"]
+        expression = forward_dynamics(model, data, space)
+    else:
+        if space == Space.MOTOR:
+            data.motor.acceleration = named["input"]
+        else:
+            data.load.acceleration = named["input"]
+        expression = inverse_dynamics(model, data, space)
+
+    return symbols, expression
+
+
+# Traces by quantity, space and the signature of the symbolic inputs, see cached_trace
+_TRACES: dict[tuple, tuple[tuple, Any]] = {}
+
+
+def _signature(symbols: list) -> tuple:
+    """Hashable description of symbolic inputs: the type, name and shape of every symbol."""
+    return tuple((type(s).__module__, type(s).__qualname__, str(s), getattr(s, "shape", ())) for s in symbols)
+
+
+def cached_trace(quantity: str, space: Space, symbol: Callable[[str], Any]) -> tuple[tuple, Any]:
+    """
+    Memoized trace: each quantity is traced once per space and set of symbolic inputs.
+
+    The factory is called for the input names and the trace is keyed by the type, name and
+    shape of the resulting symbols, so any factory producing the same inputs (e.g.
+    ``casadi.SX.sym`` or a lambda wrapping it) shares one trace. On a hit the cached symbols
+    are returned in place of the fresh ones; symbolic expressions are immutable, so they can
+    be shared by every caller. ``clear_cache`` releases them.
+
+    Args:
+        quantity (str): One of QUANTITIES.
+        space (Space): The space enum (MOTOR or LOAD) in which the quantity is expressed.
+        symbol (Callable[[str], Any]): Symbol factory, e.g. ``sympy.Symbol`` or ``casadi.SX.sym``.
+
+    Returns:
+        tuple[tuple, Any]: The symbols in the order given by ``arguments(quantity)`` and the
+            traced expression.
+
+    Raises:
+        ValueError: If an unknown quantity or invalid space is provided.
+    """
+    names = arguments(quantity)
+    symbols = [symbol(name) for name in names]
+    key = (quantity, space, _signature(symbols))
+    if key not in _TRACES:
+        traced, expression = trace(quantity, space, dict(zip(names, symbols, strict=True)).__getitem__)
+        _TRACES[key] = tuple(traced), expression
+    return _TRACES[key]
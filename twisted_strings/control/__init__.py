@@ -0,0 +1,21 @@
+"""
+Control of Twisted String Actuators
+
+Real-time controllers tracking a load space reference (x, dx, ddx) from the measured motor
+state. Each controller precomputes the model constants and maps the motor state to the
+load space dynamics with plain float arithmetic, so ``step`` costs a few microseconds on
+CPython, while ``step_batch`` runs many actuators at once in preallocated buffers.
+
+Available controllers:
+- ComputedTorque: feedback linearization with acceleration level gains
+- PDFeedforward: PD feedback plus inverse dynamics feedforward (PD+)
+- Impedance: mass-spring-damper behaviour of the load around the reference
+- ModelPredictive: receding horizon optimal control with a cached CasADi NLP (optional dependency)
+
+Example:
+    controller = ComputedTorque(model, kp=400.0, kd=40.0)
+    torque = controller.step(theta, dtheta, (x_d, dx_d, ddx_d))
+"""
+
+from ._controllers import ComputedTorque, Impedance, LoadController, PDFeedforward, Reference
+from ._mpc import DISCRETIZATIONS, ModelPredictive
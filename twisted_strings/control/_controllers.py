@@ -0,0 +1,285 @@
+from abc import ABC, abstractmethod
+from math import sqrt
+
+import numpy as np
+
+from .._structs import Model
+
+Reference = tuple[float, float, float]
+
+
+class LoadController(ABC):
+    """
+    Base of the load space controllers.
+
+    The model constants are read once at construction. Every tick the measured motor state
+    is mapped to the load space terms of the dynamics (see compute_all)
+
+        x, dx, J, M = I / J^2, C = M dJ + b_x + b_theta / J
+
+    and the controller computes a load space force F, which is returned as the motor
+    torque tau = J F. ``step`` works on plain floats and allocates nothing but floats.
+    ``step_batch`` evaluates many actuators at once in buffers preallocated for ``size``
+    actuators; the model parameters may then be arrays of that size.
+
+    Subclasses implement ``step`` and ``step_batch``.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        size (int | None, optional): Number of actuators of step_batch. Defaults to None
+            (scalar step only).
+
+    Note:
+        The Jacobian vanishes at theta = 0, so the strings must be pre-twisted.
+    """
+
+    def __init__(self, model: Model, size: int | None = None):
+        L, r = model.kinematic.length, model.kinematic.radius
+        self._L, self._L2, self._r2, self._rL2 = L, L * L, r * r, (r * L) ** 2
+        self._I = model.dynamic.motor.inertia
+        self._b_x = model.dynamic.load.damping
+        self._b_theta = model.dynamic.motor.damping
+
+        self.size = size
+        if size is not None:
+            self._s, self._x, self._dx, self._J, self._M, self._C, self._a, self._tmp, self._torque = np.empty(
+                (9, size)
+            )
+
+    def _terms(self, theta: float, dtheta: float) -> tuple[float, float, float, float, float]:
+        s = sqrt(self._L2 - self._r2 * theta * theta)
+        J = theta * self._r2 / s
+        M = self._I / (J * J)
+        C = M * self._rL2 * dtheta / (s * s * s) + self._b_x + self._b_theta / J
+        return self._L - s, J * dtheta, J, M, C
+
+    def _terms_batch(self, theta: np.ndarray, dtheta: np.ndarray) -> None:
+        if self.size is None:
+            raise ValueError(f"{type(self).__name__} needs a size to run step_batch")
+        s, x, dx, J, M, C, tmp = self._s, self._x, self._dx, self._J, self._M, self._C, self._tmp
+        np.multiply(theta, theta, out=s)
+        s *= self._r2
+        np.subtract(self._L2, s, out=s)
+        np.sqrt(s, out=s)
+        np.subtract(self._L, s, out=x)
+        np.multiply(theta, self._r2, out=J)
+        J /= s
+        np.multiply(J, dtheta, out=dx)
+        np.multiply(J, J, out=M)
+        np.divide(self._I, M, out=M)
+        # C = M dJ + b_x + b_theta / J with dJ = r^2 L^2 dtheta / s^3
+        np.multiply(s, s, out=C)
+        C *= s
+        np.divide(dtheta, C, out=C)
+        C *= self._rL2
+        C *= M
+        C += self._b_x
+        np.divide(self._b_theta, J, out=tmp)
+        C += tmp
+
+    @abstractmethod
+    def step(self, theta: float, dtheta: float, ref: Reference) -> float:
+        """
+        Compute the motor torque for one actuator.
+
+        Args:
+            theta (float): The measured motor angle in radians.
+            dtheta (float): The measured motor speed in rad/s.
+            ref (Reference): The reference (x, dx, ddx) in the load space.
+
+        Returns:
+            float: The motor torque.
+        """
+
+    @abstractmethod
+    def step_batch(self, theta: np.ndarray, dtheta: np.ndarray, ref: tuple) -> np.ndarray:
+        """
+        Compute the motor torques of all actuators.
+
+        Args:
+            theta (np.ndarray): The measured motor angles in radians, shape (size,).
+            dtheta (np.ndarray): The measured motor speeds in rad/s, shape (size,).
+            ref (tuple): The references (x, dx, ddx) in the load space, arrays or scalars.
+
+        Returns:
+            np.ndarray: The motor torques. The array is an internal buffer overwritten by the next call.
+
+        Raises:
+            ValueError: If the controller was constructed without a size.
+        """
+
+
+class ComputedTorque(LoadController):
+    """
+    Computed torque control in load space.
+
+    The dynamics are linearized by the measured inertia and Coriolis terms,
+    F = M (ddx_d + kd (dx_d - dx) + kp (x_d - x)) + C dx, so the tracking error obeys
+    e'' + kd e' + kp e = 0.
+
+    Example:
+        controller = ComputedTorque(model, kp=400.0, kd=40.0)
+        torque = controller.step(theta, dtheta, (x_d, dx_d, ddx_d))
+
+    Args:
+        model (Model): The model object containing system parameters.
+        kp (float): Proportional gain in 1/s^2.
+        kd (float): Derivative gain in 1/s.
+        size (int | None, optional): Number of actuators of step_batch. Defaults to None.
+    """
+
+    def __init__(self, model: Model, kp: float, kd: float, size: int | None = None):
+        super().__init__(model, size)
+        self.kp = kp
+        self.kd = kd
+
+    def step(self, theta: float, dtheta: float, ref: Reference) -> float:
+        x_d, dx_d, ddx_d = ref
+        x, dx, J, M, C = self._terms(theta, dtheta)
+        return J * (M * (ddx_d + self.kd * (dx_d - dx) + self.kp * (x_d - x)) + C * dx)
+
+    def step_batch(self, theta: np.ndarray, dtheta: np.ndarray, ref: tuple) -> np.ndarray:
+        x_d, dx_d, ddx_d = ref
+        self._terms_batch(theta, dtheta)
+        a, tmp = self._a, self._tmp
+        np.subtract(x_d, self._x, out=a)
+        a *= self.kp
+        np.subtract(dx_d, self._dx, out=tmp)
+        tmp *= self.kd
+        a += tmp
+        a += ddx_d
+        a *= self._M
+        np.multiply(self._C, self._dx, out=tmp)
+        a += tmp
+        return np.multiply(a, self._J, out=self._torque)
+
+
+class PDFeedforward(LoadController):
+    """
+    PD control plus model based feedforward in load space.
+
+    F = M ddx_d + C dx_d + kp (x_d - x) + kd (dx_d - dx), where the feedforward terms are
+    evaluated at the measured state (the PD+ law), so the gains are forces per unit error.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        kp (float): Proportional gain in N/m.
+        kd (float): Derivative gain in N s/m.
+        size (int | None, optional): Number of actuators of step_batch. Defaults to None.
+    """
+
+    def __init__(self, model: Model, kp: float, kd: float, size: int | None = None):
+        super().__init__(model, size)
+        self.kp = kp
+        self.kd = kd
+
+    def step(self, theta: float, dtheta: float, ref: Reference) -> float:
+        x_d, dx_d, ddx_d = ref
+        x, dx, J, M, C = self._terms(theta, dtheta)
+        return J * (M * ddx_d + C * dx_d + self.kp * (x_d - x) + self.kd * (dx_d - dx))
+
+    def step_batch(self, theta: np.ndarray, dtheta: np.ndarray, ref: tuple) -> np.ndarray:
+        x_d, dx_d, ddx_d = ref
+        self._terms_batch(theta, dtheta)
+        a, tmp = self._a, self._tmp
+        np.subtract(x_d, self._x, out=a)
+        a *= self.kp
+        np.subtract(dx_d, self._dx, out=tmp)
+        tmp *= self.kd
+        a += tmp
+        np.multiply(self._M, ddx_d, out=tmp)
+        a += tmp
+        np.multiply(self._C, dx_d, out=tmp)
+        a += tmp
+        return np.multiply(a, self._J, out=self._torque)
+
+
+class Impedance(LoadController):
+    """
+    Impedance control in load space.
+
+    The load is made to behave as the mass-spring-damper
+    mass (ddx - ddx_d) + damping (dx - dx_d) + stiffness (x - x_d) = F_ext around the
+    reference, where F_ext is the external force on the load in the direction of contraction:
+
+        F = M (ddx_d + (stiffness e + damping e' + F_ext) / mass) + C dx - F_ext,   e = x_d - x
+
+    Without a mass the natural inertia of the actuator is kept and F_ext is not needed.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        stiffness (float): Desired stiffness in N/m.
+        damping (float): Desired damping in N s/m.
+        mass (float | None, optional): Desired apparent mass in kg. Defaults to None (natural inertia).
+        size (int | None, optional): Number of actuators of step_batch. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        stiffness: float,
+        damping: float,
+        mass: float | None = None,
+        size: int | None = None,
+    ):
+        super().__init__(model, size)
+        self.stiffness = stiffness
+        self.damping = damping
+        self.mass = mass
+
+    def step(self, theta: float, dtheta: float, ref: Reference, force: float = 0.0) -> float:
+        """
+        Compute the motor torque for one actuator.
+
+        Args:
+            theta (float): The measured motor angle in radians.
+            dtheta (float): The measured motor speed in rad/s.
+            ref (Reference): The reference (x, dx, ddx) in the load space.
+            force (float, optional): The measured external force, used with a desired mass. Defaults to 0.0.
+
+        Returns:
+            float: The motor torque.
+        """
+        x_d, dx_d, ddx_d = ref
+        x, dx, J, M, C = self._terms(theta, dtheta)
+        spring = self.stiffness * (x_d - x) + self.damping * (dx_d - dx)
+        if self.mass is None:
+            return J * (M * ddx_d + spring + C * dx)
+        return J * (M * (ddx_d + (spring + force) / self.mass) + C * dx - force)
+
+    def step_batch(self, theta: np.ndarray, dtheta: np.ndarray, ref: tuple, force: np.ndarray = 0.0) -> np.ndarray:
+        """
+        Compute the motor torques of all actuators.
+
+        Args:
+            theta (np.ndarray): The measured motor angles in radians, shape (size,).
+            dtheta (np.ndarray): The measured motor speeds in rad/s, shape (size,).
+            ref (tuple): The references (x, dx, ddx) in the load space, arrays or scalars.
+            force (np.ndarray, optional): The measured external forces, used with a desired mass. Defaults to 0.0.
+
+        Returns:
+            np.ndarray: The motor torques. The array is an internal buffer overwritten by the next call.
+
+        Raises:
+            ValueError: If the controller was constructed without a size.
+        """
+        x_d, dx_d, ddx_d = ref
+        self._terms_batch(theta, dtheta)
+        a, tmp = self._a, self._tmp
+        np.subtract(x_d, self._x, out=a)
+        a *= self.stiffness
+        np.subtract(dx_d, self._dx, out=tmp)
+        tmp *= self.damping
+        a += tmp
+        if self.mass is None:
+            np.multiply(self._M, ddx_d, out=tmp)
+            a += tmp
+        else:
+            a += force
+            a /= self.mass
+            a += ddx_d
+            a *= self._M
+            a -= force
+        np.multiply(self._C, self._dx, out=tmp)
+        a += tmp
+        return np.multiply(a, self._J, out=self._torque)
@@ -0,0 +1,227 @@
+from functools import cache
+
+import numpy as np
+
+from .._structs import Model, Space
+from ..codegen import PARAMETERS, casadi_function, parameters
+
+DISCRETIZATIONS = ("euler", "midpoint")
+
+# Layout of the NLP parameter vector after the initial state and the reference:
+# the model parameters, the step size and the weights (position, velocity, input)
+_TAIL = len(PARAMETERS) + 4
+
+
+@cache
+def _defect(space: Space, method: str):
+    """CasADi function of the implicit step defect y1 - y0 - h f(y, u) of the traced dynamics."""
+    import casadi as ca
+
+    if method not in DISCRETIZATIONS:
+        raise ValueError(f"Unknown method: {method}")
+    forward = casadi_function("forward_dynamics", space)
+    y0, y1 = ca.SX.sym("y0", 2), ca.SX.sym("y1", 2)
+    u, h, p = ca.SX.sym("u"), ca.SX.sym("h"), ca.SX.sym("p", len(PARAMETERS))
+
+    y = y1 if method == "euler" else (y0 + y1) / 2
+    acceleration = forward(y[0], y[1], u, *ca.vertsplit(p))
+    defect = y1 - y0 - h * ca.vertcat(y[1], acceleration)
+    return ca.Function(f"defect_{space.name.lower()}_{method}", [y0, y1, u, h, p], [defect])
+
+
+@cache
+def _solver(space: Space, horizon: int, method: str, max_iterations: int):
+    """Multiple shooting NLP over the horizon, built once per space, horizon, method and iteration cap."""
+    import casadi as ca
+
+    N = horizon
+    Y, U = ca.SX.sym("y", 2, N + 1), ca.SX.sym("u", 1, N)
+    y0, reference = ca.SX.sym("y_init", 2), ca.SX.sym("reference", 2, N + 1)
+    p, h, weights = ca.SX.sym("p", len(PARAMETERS)), ca.SX.sym("h"), ca.SX.sym("weights", 3)
+
+    defects = _defect(space, method).map(N)(Y[:, :-1], Y[:, 1:], U, h, p)
+    error = Y - reference
+    cost = weights[0] * ca.sumsqr(error[0, :]) + weights[1] * ca.sumsqr(error[1, :]) + weights[2] * ca.sumsqr(U)
+
+    nlp = {
+        "x": ca.vertcat(ca.vec(Y), ca.vec(U)),
+        "p": ca.vertcat(y0, ca.vec(reference), p, h, weights),
+        "f": cost,
+        "g": ca.vertcat(Y[:, 0] - y0, ca.vec(defects)),
+    }
+    options = {
+        "print_time": False,
+        "ipopt.print_level": 0,
+        "ipopt.sb": "yes",
+        "ipopt.max_iter": max_iterations,
+        "ipopt.warm_start_init_point": "yes",
+        "ipopt.warm_start_bound_push": 1e-9,
+        "ipopt.warm_start_mult_bound_push": 1e-9,
+        "ipopt.mu_init": 1e-4,
+    }
+    return ca.nlpsol(f"mpc_{space.name.lower()}_{N}_{method}", "ipopt", nlp, options)
+
+
+def _shift(values: np.ndarray, horizon: int, rows: int) -> np.ndarray:
+    """Shift the stage-wise blocks of a solution vector one stage ahead, repeating the last stage."""
+    N = horizon
+    states = values[: rows * (N + 1)].reshape(N + 1, rows)
+    states[:-1] = states[1:].copy()
+    if len(values) > rows * (N + 1):
+        inputs = values[rows * (N + 1) :]
+        inputs[:-1] = inputs[1:].copy()
+    return values
+
+
+class ModelPredictive:
+    """
+    Model predictive control of one actuator with a cached, warm-started NLP.
+
+    The forward dynamics are traced once with CasADi and discretized by implicit Euler or
+    the implicit midpoint rule, which stay stable at control rate step sizes despite the
+    stiff damping of the actuator. The multiple shooting NLP over the states y_k = (position,
+    velocity) and the inputs u_k minimizes
+
+        sum_k q_x (position_k - ref_k)^2 + q_v (velocity_k - dref_k)^2 + sum_k r u_k^2
+
+    subject to the discretized dynamics and the box constraints. The initial state, the
+    reference, the model parameters, the step size and the weights are parameters of the NLP,
+    so the solver is built once per space, horizon, discretization and iteration cap and
+    shared by every controller with these settings; a new horizon builds a new NLP. The model
+    is read at each step, so online parameter estimates are picked up.
+    Each solve is warm started from the previous solution and multipliers shifted by one stage.
+
+    Example:
+        mpc = ModelPredictive(model, horizon=20, dt=0.01, input_bounds=(0.0, 50.0))
+        force = mpc.step(x, dx, reference)
+
+    Args:
+        model (Model): The model object containing system parameters.
+        horizon (int): Number of steps N of the prediction horizon.
+        dt (float): The step size of the discretization in seconds.
+        space (Space, optional): The space enum (MOTOR or LOAD) of the state and input.
+            Defaults to Space.LOAD.
+        weights (tuple[float, float, float], optional): The weights (q_x, q_v, r). Defaults to (1.0, 0.0, 1e-6).
+        position_bounds (tuple[float, float], optional): Bounds of the predicted positions.
+            Defaults to (-inf, inf).
+        velocity_bounds (tuple[float, float], optional): Bounds of the predicted velocities.
+            Defaults to (-inf, inf).
+        input_bounds (tuple[float, float], optional): Bounds of the inputs. Defaults to (-inf, inf).
+        method (str, optional): "euler" or "midpoint". Defaults to "euler".
+        max_iterations (int, optional): Iteration cap of a solve, which bounds the time per tick.
+            Defaults to 50.
+
+    Raises:
+        ValueError: If an invalid space or method is provided.
+        ImportError: If CasADi is not installed.
+
+    Note:
+        The load position must stay in (0, L) and the motor angle away from zero, where the
+        Jacobian vanishes; bound the positions accordingly.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        horizon: int,
+        dt: float,
+        space: Space = Space.LOAD,
+        weights: tuple[float, float, float] = (1.0, 0.0, 1e-6),
+        position_bounds: tuple[float, float] = (-np.inf, np.inf),
+        velocity_bounds: tuple[float, float] = (-np.inf, np.inf),
+        input_bounds: tuple[float, float] = (-np.inf, np.inf),
+        method: str = "euler",
+        max_iterations: int = 50,
+    ):
+        if space not in (Space.MOTOR, Space.LOAD):
+            raise ValueError(f"Invalid space: {space}")
+        self.model = model
+        self.horizon = horizon
+        self.dt = dt
+        self.space = space
+        self.weights = weights
+        self._solver = _solver(space, horizon, method, max_iterations)
+
+        N = horizon
+        self._parameters = np.zeros(2 + 2 * (N + 1) + _TAIL)
+        self._reference = self._parameters[2 : 2 + 2 * (N + 1)].reshape(N + 1, 2)
+        self._lbx, self._ubx = np.empty(3 * N + 2), np.empty(3 * N + 2)
+        for bounds, index in ((position_bounds, 0), (velocity_bounds, 1)):
+            self._lbx[index : 2 * (N + 1) : 2], self._ubx[index : 2 * (N + 1) : 2] = bounds
+        self._lbx[2 * (N + 1) :], self._ubx[2 * (N + 1) :] = input_bounds
+        self._zeros = np.zeros(2 * (N + 1))
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard the warm start, the next step is solved from a constant initial guess."""
+        self._x0 = None
+        self._lam_x0 = np.zeros(3 * self.horizon + 2)
+        self._lam_g0 = np.zeros(2 * (self.horizon + 1))
+        self.success = False
+        self.iterations = 0
+
+    def _set_reference(self, reference: np.ndarray | float) -> None:
+        reference = np.asarray(reference, dtype=float)
+        if reference.ndim == 0 or reference.shape == (self.horizon + 1,):
+            self._reference[:, 0] = reference
+            self._reference[:, 1] = 0.0
+        elif reference.shape == (self.horizon + 1, 2):
+            self._reference[:] = reference
+        else:
+            raise ValueError(f"Invalid reference shape: {reference.shape}")
+
+    def step(self, position: float, velocity: float, reference: np.ndarray | float) -> float:
+        """
+        Solve the optimal control problem from the measured state and return the first input.
+
+        Args:
+            position (float): The measured position in the chosen space.
+            velocity (float): The measured velocity in the chosen space.
+            reference (np.ndarray | float): The reference over the horizon, a constant position,
+                N + 1 positions or (N + 1, 2) positions and velocities.
+
+        Returns:
+            float: The first input, a torque in MOTOR space or a force in LOAD space.
+
+        Raises:
+            ValueError: If the reference has an invalid shape.
+
+        Note:
+            The predicted trajectory is stored in the position, velocity and input attributes,
+            the solver status in success and iterations.
+        """
+        N = self.horizon
+        p = self._parameters
+        p[:2] = position, velocity
+        self._set_reference(reference)
+        p[-_TAIL:] = (*parameters(self.model), self.dt, *self.weights)
+
+        if self._x0 is None:
+            self._x0 = np.concatenate((np.tile((position, velocity), N + 1), np.zeros(N)))
+
+        solution = self._solver(
+            x0=self._x0,
+            p=p,
+            lbx=self._lbx,
+            ubx=self._ubx,
+            lbg=self._zeros,
+            ubg=self._zeros,
+            lam_x0=self._lam_x0,
+            lam_g0=self._lam_g0,
+        )
+        stats = self._solver.stats()
+        self.success = stats["success"]
+        self.iterations = stats["iter_count"]
+
+        x = np.asarray(solution["x"]).ravel()
+        states = x[: 2 * (N + 1)].reshape(N + 1, 2)
+        self.position, self.velocity, self.input = states[:, 0].copy(), states[:, 1].copy(), x[2 * (N + 1) :].copy()
+
+        self._x0 = _shift(x, N, 2)
+        self._lam_x0 = _shift(np.asarray(solution["lam_x"]).ravel(), N, 2)
+        # the first two multipliers belong to the initial state constraint, only the defects are shifted
+        lam_g = np.asarray(solution["lam_g"]).ravel()
+        _shift(lam_g[2:], N - 1, 2)
+        self._lam_g0 = lam_g
+        return float(self.input[0])
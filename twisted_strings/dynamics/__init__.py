@@ -3,7 +3,8 @@ Dynamic Components for Twisted String Actuators
 
 This module provides functions for calculating various dynamic effect and
 components of twisted string actuators, including inertia, Coriolis effect,
-jamming, static forces, and nonlinear terms.
+jamming, static forces, and nonlinear terms, as well as the kinetic, potential and
+string elastic energy and the power flow of the actuator.
 
 The models and calculations in this module are based on the research
 presented in the following papers:
@@ -18,5 +19,7 @@ presented in the following papers:
 """
 
 from ._components import Space, coriolis, inertia, jamming, nonlinear, static
-from ._problems import forward_dynamics, inverse_dynamics
-# TODO: Add forward and inverse dynamics functions
+from ._compute import compute_all
+from ._energy import dissipated_power, elastic_energy, kinetic_energy, potential_energy, power
+from ._problems import forward_dynamics, inverse_dynamics, solve_jamming
+from ._trajectory import trajectory_inverse_dynamics
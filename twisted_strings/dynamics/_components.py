@@ -85,6 +85,18 @@ def coriolis(model: Model, data: Data, space: Space) -> float:
     return C
 
 
+def _jamming_coefficient(model: Model, data: Data) -> float:
+    """Coefficient dS/dtheta of the jamming term dS/dtheta * force^2 at the current position."""
+    L = model.kinematic.length
+    r = model.kinematic.radius
+    C_r = model.stiffness.transverse
+    C_L = model.stiffness.longitudinal
+
+    theta, X = data.motor.position, data.load.position
+
+    return (r / (L - X) ** 2) ** 2 * ((2 * L**2 - (r * theta) ** 2) * r * theta**3 * C_r - L**3 * theta * C_L)
+
+
 def jamming(model: Model, data: Data, force: float) -> float:
     """
     Calculate the jamming effect.
@@ -97,16 +109,7 @@ def jamming(model: Model, data: Data, force: float) -> float:
     Returns:
         float: The jamming effect.
     """
-    L = model.kinematic.length
-    r = model.kinematic.radius
-    C_r = model.stiffness.transverse
-    C_L = model.stiffness.longitudinal
-
-    theta, X = data.motor.position, data.load.position
-
-    dS_dtheta = (r / (L - X) ** 2) ** 2 * ((2 * L**2 - (r * theta) ** 2) * r * theta**3 * C_r - L**3 * theta * C_L)
-
-    jamming_effect = dS_dtheta * (force**2)
+    jamming_effect = _jamming_coefficient(model, data) * (force**2)
     data.motor.jamming = jamming_effect
     data.load.jamming = jamming_effect
 
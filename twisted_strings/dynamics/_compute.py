@@ -0,0 +1,79 @@
+from .._structs import Data, Model, Space
+
+
+def compute_all(model: Model, data: Data, space: Space = Space.MOTOR, include_jamming: bool = True) -> None:
+    """
+    Compute all kinematic and dynamic terms of the actuator in a single pass.
+
+    The state given in the chosen space is propagated to the other space and the contraction,
+    Jacobian, its time derivative, inertia, Coriolis, static, nonlinear and jamming terms are
+    evaluated once for both spaces. Every square root is taken once, where calling the
+    individual functions recomputes the Jacobian several times per state.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        space (Space, optional): The space enum (MOTOR or LOAD) holding the state. Defaults to Space.MOTOR.
+        include_jamming (bool, optional): Whether to evaluate the jamming term for the force stored
+            in data.load.force. Defaults to True.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+
+    Note:
+        This function reads the position and velocity of the chosen space and data.load.force
+        (for the jamming term), and updates every other field of both spaces except the
+        accelerations and forces (and the jamming terms if include_jamming is False).
+    """
+    L, r = model.kinematic.length, model.kinematic.radius
+    m = model.dynamic.load.inertia
+    I_m = model.dynamic.motor.inertia
+    b_theta = model.dynamic.motor.damping
+    b_x = model.dynamic.load.damping
+    C_r = model.stiffness.transverse
+    C_L = model.stiffness.longitudinal
+
+    if space == Space.MOTOR:
+        theta, dtheta = data.motor.position, data.motor.velocity
+        r_theta2 = (theta * r) ** 2
+        s2 = L**2 - r_theta2
+        s = s2**0.5
+        J = theta * (r**2 / s)
+        x, dx = L - s, J * dtheta
+        data.load.position, data.load.velocity = x, dx
+    elif space == Space.LOAD:
+        x, dx = data.load.position, data.load.velocity
+        s = L - x
+        s2 = s**2
+        r_theta2 = L**2 - s2
+        theta = r_theta2**0.5 / r
+        J = theta * (r**2 / s)
+        dtheta = dx / J
+        data.motor.position, data.motor.velocity = theta, dtheta
+    else:
+        raise ValueError(f"Invalid space: {space}")
+
+    # dJ/dt = r^2 L^2 dtheta / s^3 with s = L - x, see kinematics.djacobian
+    dJ = (r * L) ** 2 / (s2 * s) * dtheta
+    J_inv = 1 / J
+    M_load = I_m * J_inv**2
+    C_motor = J * (m * dJ + b_x) + b_theta
+    C_load = M_load * dJ + b_x + b_theta * J_inv
+
+    for space_data in (data.motor, data.load):
+        space_data.jacobian = J
+        space_data.djacobian = dJ
+        # nonlinear() evaluates the static term without external force
+        space_data.static = 0
+
+    data.motor.inertia = m * J**2 + I_m
+    data.load.inertia = M_load
+    data.motor.coriolis = C_motor
+    data.load.coriolis = C_load
+    data.motor.nonlinear = C_motor * dtheta
+    data.load.nonlinear = C_load * dx
+
+    if include_jamming:
+        # dS/dtheta of jamming() rewritten with 2 L^2 - (r theta)^2 = L^2 + s^2
+        dS_dtheta = theta * ((L**2 + s2) * r_theta2 * (C_r / r) - L**3 * C_L) * (r**2 / s2**2)
+        data.motor.jamming = data.load.jamming = dS_dtheta * data.load.force**2
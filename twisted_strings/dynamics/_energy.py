@@ -1,2 +1,158 @@
-# TODO:
-# implement energy of TSA system
+from .._structs import Data, Model, Space
+
+
+def _jacobian(model: Model, data: Data, space: Space) -> float:
+    """Jacobian from the position of the chosen space only, without touching data."""
+    L, r = model.kinematic.length, model.kinematic.radius
+
+    if space == Space.MOTOR:
+        theta = data.motor.position
+        return theta * r**2 / (L**2 - (theta * r) ** 2) ** 0.5
+    elif space == Space.LOAD:
+        s = L - data.load.position
+        return r * (L**2 - s**2) ** 0.5 / s
+    else:
+        raise ValueError(f"Invalid space: {space}")
+
+
+def kinetic_energy(model: Model, data: Data, space: Space) -> float:
+    """
+    Calculate the kinetic energy T = (m J^2 + I) dtheta^2 / 2 = (m + I / J^2) dx^2 / 2 of the actuator.
+
+    Both expressions are the same energy of the motor and the load masses, so the result does
+    not depend on the space holding the state.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        space (Space): The space enum (MOTOR or LOAD) holding the state.
+
+    Returns:
+        float: The kinetic energy in joules.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+
+    Note:
+        This function reads the position and velocity of the chosen space and does not update the data object.
+    """
+    m = model.dynamic.load.inertia
+    I_m = model.dynamic.motor.inertia
+    J = _jacobian(model, data, space)
+
+    if space == Space.MOTOR:
+        return (m * J**2 + I_m) * data.motor.velocity**2 / 2
+    else:
+        return (m + I_m / J**2) * data.load.velocity**2 / 2
+
+
+def potential_energy(model: Model, data: Data, force: float = 0) -> float:
+    """
+    Calculate the potential energy V = F x of a constant force acting on the load.
+
+    Its derivative dV/dtheta is the static term of the motor space dynamics.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        force (float, optional): The force acting against the contraction. Defaults to 0.
+
+    Returns:
+        float: The potential energy in joules.
+
+    Note:
+        This function reads data.load.position and does not update the data object.
+    """
+    return force * data.load.position
+
+
+def elastic_energy(model: Model, data: Data, force: float) -> float:
+    """
+    Calculate the energy S(theta) F^2 stored in the compliant strings under tension.
+
+    S(theta) = (r theta)^2 (C_r r theta^2 - C_L L) / (2 (L^2 - (r theta)^2)) is the integral
+    of the jamming coefficient with S(0) = 0, so the partial derivative of this energy with
+    respect to the motor angle at constant tension equals the jamming term.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        force (float): The tension of the strings.
+
+    Returns:
+        float: The string elastic energy in joules.
+
+    Note:
+        This function reads data.motor.position and does not update the data object.
+    """
+    L = model.kinematic.length
+    r = model.kinematic.radius
+    C_r = model.stiffness.transverse
+    C_L = model.stiffness.longitudinal
+
+    r_theta2 = (r * data.motor.position) ** 2
+    S = r_theta2 * (C_r * r_theta2 / r - C_L * L) / (2 * (L**2 - r_theta2))
+    return S * force**2
+
+
+def dissipated_power(model: Model, data: Data, space: Space) -> float:
+    """
+    Calculate the power (J b_x + b_theta) dtheta^2 dissipated by viscous damping.
+
+    This is the damping part of the motor space Coriolis term times the squared motor speed,
+    expressed with dtheta = dx / J when the state is held by the LOAD space. In the absence of
+    jamming dT/dt = tau dtheta - dissipated_power = F dx - dissipated_power with F = tau / J
+    along the solutions of forward_dynamics in MOTOR space.
+
+    The LOAD space model of forward_dynamics neglects the load mass and maps the motor damping
+    as b_theta / J, so it is not the same system: along its solutions the balance is off by
+    these terms and should not be used to measure the integration drift.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        space (Space): The space enum (MOTOR or LOAD) holding the state.
+
+    Returns:
+        float: The dissipated power in watts.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+
+    Note:
+        This function reads the position and velocity of the chosen space and does not update the data object.
+    """
+    b_theta = model.dynamic.motor.damping
+    b_x = model.dynamic.load.damping
+    J = _jacobian(model, data, space)
+
+    if space == Space.MOTOR:
+        return (J * b_x + b_theta) * data.motor.velocity**2
+    else:
+        return (J * b_x + b_theta) * (data.load.velocity / J) ** 2
+
+
+def power(model: Model, data: Data, space: Space, force: float) -> float:
+    """
+    Calculate the net power F dq - dissipated_power flowing into the actuator.
+
+    Comparing it to the time derivative of kinetic_energy along a trajectory simulated in
+    MOTOR space (see dissipated_power) measures the energy drift of the integration.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        space (Space): The space enum (MOTOR or LOAD) holding the state.
+        force (float): The generalized input, torque (MOTOR) or force F = tau / J (LOAD).
+
+    Returns:
+        float: The net power in watts.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+
+    Note:
+        This function reads the position and velocity of the chosen space and does not update the data object.
+    """
+    velocity = data.motor.velocity if space == Space.MOTOR else data.load.velocity
+    return force * velocity - dissipated_power(model, data, space)
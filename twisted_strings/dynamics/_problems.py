@@ -1,50 +1,139 @@
+import numpy as np
+
 from .._structs import Model, Data, Space
-from ..kinematics import jacobian
-from ._components import inertia, nonlinear, jamming
+from ._components import _jamming_coefficient, jamming
+from ._compute import compute_all
 
 
 # TODO: Provide arguments similarly to kinematics functions
 
 
-def forward_dynamics(model: Model, data: Data, space: Space) -> float:
+def solve_jamming(
+    model: Model,
+    data: Data,
+    force: float,
+    method: str = "closed",
+    iterations: int = 8,
+    tol: float = 1e-12,
+) -> tuple[float, int]:
+    """
+    Recover the jamming free force F0 from the load force F = F0 + k F0^2.
+
+    inverse_dynamics adds the jamming term k F0^2 (see jamming) to the force F0 of the rigid
+    dynamics, so the forward problem solves this quadratic for F0. The closed form uses the
+    root F0 = 2 F / (1 + sqrt(1 + 4 k F)), which tends to F as k -> 0 and has no
+    cancellation. It is the root on the branch 1 + 2 k F0 > 0 where F grows with F0; forces
+    of inverse_dynamics beyond that branch are not recovered. Alternatively, Newton
+    iterations started from F0 = F are run on the whole batch at once until every element
+    has converged, so a batch spanning large k F may need many more iterations than a single
+    force. Where 1 + 4 k F < 0 the strings jam: no root exists, the closed form returns NaN
+    and the Newton iterations do not converge.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        data (Data): The data object storing state variables.
+        force (float): The load force F.
+        method (str, optional): "closed" for the closed form root or "newton". Defaults to "closed".
+        iterations (int, optional): Maximum number of Newton iterations. Defaults to 8.
+        tol (float, optional): Relative tolerance of the Newton iterations. Defaults to 1e-12.
+
+    Returns:
+        tuple[float, int]: The force F0 and the number of Newton iterations needed by the
+            slowest batch element (0 for the closed form).
+
+    Raises:
+        ValueError: If an invalid method is provided.
+        RuntimeError: If the Newton iterations do not converge within the iteration cap.
+
+    Note:
+        This function reads data.motor.position and data.load.position and does not update the data object.
+    """
+    k = _jamming_coefficient(model, data)
+
+    if method == "closed":
+        return 2 * force / (1 + (1 + 4 * k * force) ** 0.5), 0
+    elif method == "newton":
+        F0 = force
+        for count in range(1, iterations + 1):
+            step = (F0 + k * F0**2 - force) / (1 + 2 * k * F0)
+            F0 = F0 - step
+            if np.all(np.abs(step) <= tol * np.abs(F0)):
+                return F0, count
+        raise RuntimeError(f"Jamming Newton iterations did not converge in {iterations} iterations")
+    else:
+        raise ValueError(f"Invalid method: {method}")
+
+
+def forward_dynamics(
+    model: Model,
+    data: Data,
+    space: Space,
+    include_jamming: bool = False,
+    jamming_method: str = "closed",
+    iterations: int = 8,
+    tol: float = 1e-12,
+    full_output: bool = False,
+) -> float | tuple[float, int]:
     """
     Calculate the forward dynamics (acceleration) for the chosen space.
 
-    NOTE: Jamming is not taken in to account for now.
+    The state is read from the chosen space and propagated to the other one, all terms are
+    evaluated in a single pass by compute_all.
 
     Args:
         model (Model): The model object containing system parameters.
         data (Data): The data object storing state variables.
         space (Space): The space enum (MOTOR or LOAD) for which to calculate the forward dynamics.
-        torque (float): The applied torque (for MOTOR space) or force (for LOAD space).
-        include_jamming (bool, optional): Whether to include jamming effects. Defaults to True.
+        include_jamming (bool, optional): Whether to include jamming effects. As in
+            inverse_dynamics, jamming acts on the load force only, so this requires the LOAD
+            space, where the force is mapped through solve_jamming. Defaults to False.
+        jamming_method (str, optional): The method of solve_jamming, "closed" or "newton".
+            Defaults to "closed".
+        iterations (int, optional): Maximum number of Newton iterations of solve_jamming; a
+            batch spanning large forces may need more. Defaults to 8.
+        tol (float, optional): Relative tolerance of the Newton iterations of solve_jamming. Defaults to 1e-12.
+        full_output (bool, optional): Whether to also return the number of Newton iterations
+            spent by solve_jamming. Defaults to False.
 
     Returns:
-        float: The acceleration in the chosen space.
+        float | tuple[float, int]: The acceleration in the chosen space, and with full_output
+            the number of Newton iterations (0 without jamming or with the closed form).
 
     Raises:
-        ValueError: If an invalid space is provided.
+        ValueError: If an invalid space or jamming method is provided, or jamming is requested
+            in MOTOR space.
+        RuntimeError: If the Newton iterations of solve_jamming do not converge.
+
+    Note:
+        The applied torque (for MOTOR space) or force (for LOAD space) is read from data.load.force.
     """
-    m = inertia(model, data, space)
-    # this term takes in to account external forces
-    n = nonlinear(model, data, space)
+    if include_jamming and space == Space.MOTOR:
+        raise ValueError(f"Jamming is not supported in space: {space}")
+    compute_all(model, data, space, include_jamming=False)
 
+    count = 0
+    # the nonlinear term takes in to account external forces
     if space == Space.MOTOR:
-        acceleration = (data.load.force - n) / m
+        acceleration = (data.load.force - data.motor.nonlinear) / data.motor.inertia
         data.motor.acceleration = acceleration
-    elif space == Space.LOAD:
-        acceleration = (data.load.force - n) / m
-        data.load.acceleration = acceleration
     else:
-        raise ValueError(f"Invalid space: {space}")
+        force = data.load.force
+        if include_jamming:
+            force, count = solve_jamming(model, data, force, jamming_method, iterations, tol)
+            data.motor.jamming = data.load.jamming = data.load.force - force
+        acceleration = (force - data.load.nonlinear) / data.load.inertia
+        data.load.acceleration = acceleration
 
-    return acceleration
+    return (acceleration, count) if full_output else acceleration
 
 
 def inverse_dynamics(model: Model, data: Data, space: Space, include_jamming: bool = True) -> float:
     """
     Calculate the inverse dynamics (required torque/force) for the chosen space.
 
+    The state is read from the chosen space and propagated to the other one, all terms are
+    evaluated in a single pass by compute_all.
+
     Args:
         model (Model): The model object containing system parameters.
         data (Data): The data object storing state variables.
@@ -58,19 +147,16 @@ def inverse_dynamics(model: Model, data: Data, space: Space, include_jamming: bo
     Raises:
         ValueError: If an invalid space is provided.
     """
-    m = inertia(model, data, space)
-    n = nonlinear(model, data, space)
+    compute_all(model, data, space, include_jamming=False)
 
     if space == Space.MOTOR:
-        torque = m * data.motor.acceleration + n
+        torque = data.motor.inertia * data.motor.acceleration + data.motor.nonlinear
         data.motor.force = torque
         return torque
-    elif space == Space.LOAD:
-        force = m * data.load.acceleration + n
+    else:
+        force = data.load.inertia * data.load.acceleration + data.load.nonlinear
         if include_jamming:
             jam = jamming(model, data, force)
             force += jam
         data.load.force = force
         return force
-    else:
-        raise ValueError(f"Invalid space: {space}")
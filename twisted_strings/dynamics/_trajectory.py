@@ -0,0 +1,74 @@
+import numpy as np
+
+from .._structs import BatchData, Model, Space
+from ..kinematics import acceleration_constraint, batch
+from ._components import jamming
+from ._compute import compute_all
+
+
+def trajectory_inverse_dynamics(
+    model: Model,
+    position: np.ndarray,
+    velocity: np.ndarray,
+    acceleration: np.ndarray,
+    space: Space = Space.MOTOR,
+    include_jamming: bool = True,
+    data: BatchData | None = None,
+) -> np.ndarray:
+    """
+    Calculate the inverse dynamics along a whole reference trajectory in one vectorized pass.
+
+    The waypoints are loaded into a BatchData and every term is evaluated once by
+    compute_all. The acceleration of the other space is filled in as well: the motor
+    acceleration from kinematics.batch.motor_acceleration for a load trajectory, and the
+    contraction acceleration from the acceleration constraint for a motor trajectory.
+
+    Example:
+        t = np.linspace(0, 1, 10_000)
+        torque = trajectory_inverse_dynamics(model, theta(t), dtheta(t), ddtheta(t), Space.MOTOR)
+
+    Args:
+        model (Model): The model object containing system parameters.
+        position (np.ndarray): The reference positions (theta for MOTOR, x for LOAD).
+        velocity (np.ndarray): The reference velocities.
+        acceleration (np.ndarray): The reference accelerations.
+        space (Space, optional): The space enum (MOTOR or LOAD) of the reference. Defaults to Space.MOTOR.
+        include_jamming (bool, optional): Whether to include jamming effects. As in
+            inverse_dynamics, jamming is added to the load force only. Defaults to True.
+        data (BatchData | None, optional): Batch receiving the states and all computed terms of
+            both spaces. Defaults to None (a new batch).
+
+    Returns:
+        np.ndarray: The required torque (for MOTOR space) or force (for LOAD space) at every waypoint.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+    """
+    position, velocity, acceleration = np.broadcast_arrays(position, velocity, acceleration)
+    data = BatchData(position.size) if data is None else data
+
+    if space == Space.MOTOR:
+        data.motor.position, data.motor.velocity = position.ravel(), velocity.ravel()
+        compute_all(model, data, space, include_jamming=False)
+        theta, dtheta, ddtheta = data.motor.position, data.motor.velocity, acceleration.ravel()
+        x, dx = data.load.position, data.load.velocity
+        # the constraint is linear in ddx: ddc(ddx) = ddc(0) - (L - x) ddx
+        residual = acceleration_constraint(model, data, (theta, dtheta, ddtheta), (x, dx, 0.0))
+        data.motor.acceleration = ddtheta
+        data.load.acceleration = residual / (model.kinematic.length - x)
+        force = data.motor.inertia * ddtheta + data.motor.nonlinear
+        data.motor.force = force
+    elif space == Space.LOAD:
+        data.load.position, data.load.velocity = position.ravel(), velocity.ravel()
+        compute_all(model, data, space, include_jamming=False)
+        x, dx, ddx = data.load.position, data.load.velocity, acceleration.ravel()
+        data.load.acceleration = ddx
+        data.motor.acceleration = batch.motor_acceleration(model, x, dx, ddx)
+        force = data.load.inertia * ddx + data.load.nonlinear
+        if include_jamming:
+            force = force + jamming(model, data, force)
+        data.load.force = force
+    else:
+        raise ValueError(f"Invalid space: {space}")
+
+    return force.reshape(position.shape)
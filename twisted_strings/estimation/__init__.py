@@ -0,0 +1,23 @@
+"""
+State Estimation for Twisted String Actuators
+
+This module reconstructs the load-side state of an actuator from motor encoder data.
+Encoder logs are memory-mapped and traversed chunk by chunk through the vectorized
+kinematics, so arbitrarily long recordings are processed with bounded memory. It is the
+streaming counterpart of the offline position estimation in:
+
+- Nedelchev S, Kirsanov D, Gaponov I. IMU-based Parameter Identification and
+   Position Estimation in Twisted String Actuators. In2020 IEEE/RSJ International
+   Conference on Intelligent Robots and Systems (IROS) 2020 Oct 24 (pp. 6311-6317). IEEE.
+
+AdaptiveKinematics tracks slowly drifting string length and radius online by recursive
+least squares on the kinematic constraints.
+
+Example:
+    log = estimation.read_encoder("encoder.npy")
+    for chunk in estimation.stream_load(model, estimation.iter_chunks(*log)):
+        print(chunk.start, chunk.x.max())
+"""
+
+from ._adaptive import AdaptiveKinematics
+from ._stream import EncoderLog, LoadChunk, iter_chunks, read_encoder, stream_load
@@ -0,0 +1,115 @@
+import numpy as np
+
+from .._structs import Model
+
+
+class AdaptiveKinematics:
+    """
+    Recursive least squares estimator of the string length L and radius r.
+
+    The position and velocity constraints of kinematics._constraints are linear in the
+    parameters p = (L, r^2):
+
+        position: c = theta^2 r^2 + (L - x)^2 - L^2,    x^2 = 2 x L - theta^2 r^2
+        velocity: dc = theta dtheta r^2 - (L - x) dx,   x dx = dx L - theta dtheta r^2
+
+    so each measured sample gives a scalar regression y = phi^T p with the analytic
+    gradient phi = -dc/dp written out in closed form. The 2x2 covariance is updated
+    elementwise, the cost per sample is constant and a batch of actuators is advanced in
+    one vectorized call when the model parameters are arrays. A forgetting factor below
+    one lets the estimate follow strings that stretch and wear.
+
+    Example:
+        estimator = AdaptiveKinematics(model, forgetting=0.999)
+        for theta, x in samples:
+            estimator.update(theta, x)  # model.kinematic is updated in place
+
+    Args:
+        model (Model): The model whose kinematic parameters are the initial guess and are
+            overwritten by the estimate after every update.
+        uncertainty (tuple[float, float], optional): Initial relative standard deviations of
+            L and r^2. Defaults to (0.1, 0.2).
+        forgetting (float, optional): Forgetting factor in (0, 1]. Defaults to 0.999.
+        position_noise (float, optional): Variance of the position constraint residual.
+            Defaults to 1e-9.
+        velocity_noise (float, optional): Variance of the velocity constraint residual.
+            Defaults to 1e-9.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        uncertainty: tuple[float, float] = (0.1, 0.2),
+        forgetting: float = 0.999,
+        position_noise: float = 1e-9,
+        velocity_noise: float = 1e-9,
+    ):
+        self.model = model
+        self.forgetting = forgetting
+        self.position_noise = position_noise
+        self.velocity_noise = velocity_noise
+        self.samples = 0
+
+        L = np.array(model.kinematic.length, dtype=float)
+        r2 = np.array(model.kinematic.radius, dtype=float) ** 2
+        L, r2 = np.broadcast_arrays(L, r2)
+        self._scalar = L.ndim == 0
+        self._L, self._r2 = L.copy(), r2.copy()
+        # covariance entries P = [[P_LL, P_Lr], [P_Lr, P_rr]]
+        self._P_LL = (uncertainty[0] * L) ** 2
+        self._P_Lr = np.zeros_like(L)
+        self._P_rr = (uncertainty[1] * r2) ** 2
+
+    def _correct(self, y: np.ndarray, phi_L: np.ndarray, phi_r: np.ndarray, noise: float) -> None:
+        P_LL, P_Lr, P_rr = self._P_LL, self._P_Lr, self._P_rr
+        # P phi and the innovation variance phi^T P phi + R
+        Pphi_L = P_LL * phi_L + P_Lr * phi_r
+        Pphi_r = P_Lr * phi_L + P_rr * phi_r
+        gain = 1 / (phi_L * Pphi_L + phi_r * Pphi_r + noise)
+        error = (y - phi_L * self._L - phi_r * self._r2) * gain
+
+        self._L = self._L + Pphi_L * error
+        self._r2 = self._r2 + Pphi_r * error
+        # P = P - P phi phi^T P / S
+        self._P_LL = P_LL - Pphi_L * Pphi_L * gain
+        self._P_Lr = P_Lr - Pphi_L * Pphi_r * gain
+        self._P_rr = P_rr - Pphi_r * Pphi_r * gain
+
+    def update(
+        self,
+        theta: np.ndarray | float,
+        x: np.ndarray | float,
+        dtheta: np.ndarray | float | None = None,
+        dx: np.ndarray | float | None = None,
+    ) -> None:
+        """
+        Correct the estimate with one sample per actuator.
+
+        The position constraint is always used, the velocity constraint is added when both
+        velocities are given. model.kinematic.length and model.kinematic.radius are updated.
+
+        Args:
+            theta (np.ndarray | float): The measured motor angles in radians.
+            x (np.ndarray | float): The measured contractions in meters.
+            dtheta (np.ndarray | float | None, optional): The measured motor speeds in rad/s.
+                Defaults to None.
+            dx (np.ndarray | float | None, optional): The measured contraction speeds in m/s.
+                Defaults to None.
+        """
+        # forget once per sample, however many constraints correct it
+        scale = 1 / self.forgetting
+        self._P_LL, self._P_Lr, self._P_rr = self._P_LL * scale, self._P_Lr * scale, self._P_rr * scale
+        self._correct(x * x, 2 * x, -theta * theta, self.position_noise)
+        if dtheta is not None and dx is not None:
+            self._correct(x * dx, dx, -theta * dtheta, self.velocity_noise)
+        self.samples += 1
+
+        L, r = self._L, np.sqrt(np.abs(self._r2))
+        if self._scalar:
+            L, r = float(L), float(r)
+        self.model.kinematic.length, self.model.kinematic.radius = L, r
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Covariance of the estimate of (L, r^2), of shape (2, 2) or (2, 2, N) for a batch."""
+        return np.array([[self._P_LL, self._P_Lr], [self._P_Lr, self._P_rr]])
@@ -0,0 +1,115 @@
+import os
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+from .._structs import Model
+from ..kinematics import batch
+
+
+class EncoderLog(NamedTuple):
+    """Motor angle and velocity columns of an encoder log, usually memory-mapped."""
+
+    theta: np.ndarray
+    dtheta: np.ndarray
+
+
+class LoadChunk(NamedTuple):
+    """
+    Load-side kinematics of one chunk of encoder samples.
+
+    Attributes:
+        start (int): Index of the first sample of the chunk in the stream.
+        x (np.ndarray): The contraction in meters.
+        dx (np.ndarray): The contraction speed in m/s.
+        J (np.ndarray): The Jacobian dx/dtheta.
+        dJ (np.ndarray): The time derivative of the Jacobian.
+    """
+
+    start: int
+    x: np.ndarray
+    dx: np.ndarray
+    J: np.ndarray
+    dJ: np.ndarray
+
+
+def read_encoder(path: str | os.PathLike, dtype: np.dtype = np.float64, offset: int = 0) -> EncoderLog:
+    """
+    Memory-map an encoder log of interleaved (theta, dtheta) samples.
+
+    NumPy ``.npy`` files are opened with ``np.load(..., mmap_mode="r")`` and must hold an
+    (N, 2) array. Any other file is read as raw binary samples of the given dtype, laid out
+    as theta0, dtheta0, theta1, dtheta1, ... after a header of ``offset`` bytes. Nothing is
+    read from disk until the returned columns are sliced.
+
+    Args:
+        path (str | os.PathLike): The log file.
+        dtype (np.dtype, optional): Sample type of raw binary files. Defaults to np.float64.
+        offset (int, optional): Header size of raw binary files in bytes. Defaults to 0.
+
+    Returns:
+        EncoderLog: Read-only views of the motor angle and velocity columns.
+
+    Raises:
+        ValueError: If the file does not hold two columns.
+    """
+    if os.fspath(path).endswith(".npy"):
+        samples = np.load(path, mmap_mode="r")
+    else:
+        itemsize = np.dtype(dtype).itemsize
+        rows = (os.path.getsize(path) - offset) // (2 * itemsize)
+        samples = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows, 2))
+
+    if samples.ndim != 2 or samples.shape[1] != 2:
+        raise ValueError(f"Invalid encoder log shape: {samples.shape}")
+    return EncoderLog(samples[:, 0], samples[:, 1])
+
+
+def iter_chunks(
+    theta: np.ndarray, dtheta: np.ndarray, chunk_size: int = 1 << 16
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Split encoder columns into consecutive in-memory chunks.
+
+    Only one chunk is loaded at a time, so memory-mapped columns of any length can be
+    traversed with memory bounded by the chunk size.
+
+    Args:
+        theta (np.ndarray): The motor angles in radians.
+        dtheta (np.ndarray): The motor angular velocities in rad/s.
+        chunk_size (int, optional): Samples per chunk. Defaults to 2**16.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: Contiguous (theta, dtheta) chunks.
+    """
+    for start in range(0, len(theta), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        yield np.ascontiguousarray(theta[chunk], dtype=float), np.ascontiguousarray(dtheta[chunk], dtype=float)
+
+
+def stream_load(model: Model, chunks: Iterable[tuple[np.ndarray, np.ndarray]]) -> Iterator[LoadChunk]:
+    """
+    Reconstruct the load-side state from a stream of motor encoder chunks.
+
+    Each chunk is pushed through the vectorized kinematics in one pass. The stream is
+    consumed lazily, so the chunks may come from iter_chunks over a file as well as from a
+    live acquisition loop.
+
+    Example:
+        log = read_encoder("encoder.bin", dtype=np.float32)
+        for chunk in stream_load(model, iter_chunks(*log)):
+            x[chunk.start : chunk.start + len(chunk.x)] = chunk.x
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        chunks (Iterable[tuple[np.ndarray, np.ndarray]]): The (theta, dtheta) chunks.
+
+    Yields:
+        LoadChunk: The contraction, contraction speed, Jacobian and its time derivative.
+    """
+    start = 0
+    for theta, dtheta in chunks:
+        x, dx, J, dJ = batch.motor_state(model, theta, dtheta)
+        yield LoadChunk(start, x, dx, J, dJ)
+        start += len(x)
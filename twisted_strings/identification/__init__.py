@@ -0,0 +1,19 @@
+"""
+Parameter Identification for Twisted String Actuators
+
+Once J and dJ are known from the kinematic parameters, the inverse dynamics are linear in
+the inertia and damping parameters. This module builds the corresponding regressor over
+logged trajectories in vectorized form and solves for the parameters by streaming QR least
+squares, so logs of millions of samples (or memory-mapped logs larger than RAM) are
+processed in bounded memory. The nonlinear kinematic parameters (L, r) are fitted by
+Gauss-Newton with symbolic derivatives of the contraction.
+
+Example:
+    result = identification.fit_dynamics(model, theta, dtheta, ddtheta, torque, Space.MOTOR)
+    print(result.parameters, result.rms)
+"""
+
+from ._dynamics import FRICTION_PARAMETERS, fit_dynamics, parameter_names, regressor
+from ._kinematics import KINEMATIC_PARAMETERS, fit_kinematics
+from ._least_squares import LeastSquares
+from ._result import IdentificationResult
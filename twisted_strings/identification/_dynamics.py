@@ -0,0 +1,149 @@
+import copy
+
+import numpy as np
+
+from .._structs import Model, Space, set_field
+from ..kinematics import batch
+from ._least_squares import LeastSquares
+from ._result import IdentificationResult
+
+MOTOR_PARAMETERS = (
+    "dynamic.motor.inertia",
+    "dynamic.load.inertia",
+    "dynamic.motor.damping",
+    "dynamic.load.damping",
+)
+LOAD_PARAMETERS = (
+    "dynamic.motor.inertia",
+    "dynamic.motor.damping",
+    "dynamic.load.damping",
+)
+FRICTION_PARAMETERS = ("dynamic.motor.friction", "dynamic.load.friction")
+
+
+def parameter_names(space: Space, include_friction: bool = False) -> tuple[str, ...]:
+    """
+    Return the dynamic parameters identified in the chosen space, in regressor column order.
+
+    Args:
+        space (Space): The space enum (MOTOR or LOAD).
+        include_friction (bool, optional): Whether Coulomb friction columns are appended. Defaults to False.
+
+    Returns:
+        tuple[str, ...]: Dotted model field paths.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+    """
+    if space == Space.MOTOR:
+        names = MOTOR_PARAMETERS
+    elif space == Space.LOAD:
+        names = LOAD_PARAMETERS
+    else:
+        raise ValueError(f"Invalid space: {space}")
+    return names + FRICTION_PARAMETERS if include_friction else names
+
+
+def regressor(
+    model: Model,
+    position: np.ndarray,
+    velocity: np.ndarray,
+    acceleration: np.ndarray,
+    space: Space = Space.MOTOR,
+    include_friction: bool = False,
+) -> np.ndarray:
+    """
+    Build the regressor Y such that inverse_dynamics = Y @ p for the dynamic parameters p.
+
+    Once J and dJ are known from the kinematic parameters, the inverse dynamics (without
+    jamming) are linear in the inertia and damping parameters listed by parameter_names:
+
+        MOTOR: tau = I ddtheta + m (J^2 ddtheta + J dJ dtheta) + b_theta dtheta + b_x J dtheta
+        LOAD:  F = I (ddx + dJ dx) / J^2 + b_theta dx / J + b_x dx
+
+    inverse_dynamics does not model Coulomb friction. With include_friction the columns
+    sign(dtheta) and sign(dx) mapped to the chosen space are appended, so the friction
+    coefficients can be estimated alongside.
+
+    Args:
+        model (Model): The model object containing the kinematic parameters.
+        position (np.ndarray): Positions in the chosen space (theta or x).
+        velocity (np.ndarray): Velocities in the chosen space.
+        acceleration (np.ndarray): Accelerations in the chosen space.
+        space (Space, optional): The space enum (MOTOR or LOAD). Defaults to Space.MOTOR.
+        include_friction (bool, optional): Whether Coulomb friction columns are appended. Defaults to False.
+
+    Returns:
+        np.ndarray: The (N, P) regressor matrix.
+
+    Raises:
+        ValueError: If an invalid space is provided.
+    """
+    if space == Space.MOTOR:
+        dtheta, ddtheta = np.asarray(velocity), np.asarray(acceleration)
+        _, dx, J, dJ = batch.motor_state(model, position, dtheta)
+        columns = [ddtheta, J * (J * ddtheta + dJ * dtheta), dtheta, J * dtheta]
+        friction = [np.sign(dtheta), J * np.sign(dx)]
+    elif space == Space.LOAD:
+        dx, ddx = np.asarray(velocity), np.asarray(acceleration)
+        _, dtheta, J, dJ = batch.load_state(model, position, dx)
+        columns = [(ddx + dJ * dx) / J**2, dx / J, dx]
+        friction = [np.sign(dtheta) / J, np.sign(dx)]
+    else:
+        raise ValueError(f"Invalid space: {space}")
+
+    if include_friction:
+        columns += friction
+    return np.column_stack(columns)
+
+
+def fit_dynamics(
+    model: Model,
+    position: np.ndarray,
+    velocity: np.ndarray,
+    acceleration: np.ndarray,
+    force: np.ndarray,
+    space: Space = Space.MOTOR,
+    include_friction: bool = False,
+    chunk_size: int = 1 << 20,
+) -> IdentificationResult:
+    """
+    Identify the inertia, damping (and optionally friction) parameters from a logged trajectory.
+
+    The regressor is built chunk by chunk and folded into a streaming QR least squares, so
+    trajectories larger than memory can be passed as memory-mapped arrays (np.load with
+    mmap_mode="r" or np.memmap).
+
+    In LOAD space inverse_dynamics adds the jamming term k F^2 to the force F of the linear
+    model. F + k F^2 is not invertible for F in general, so the load forces passed here must
+    be free of jamming (as returned by inverse_dynamics with include_jamming=False).
+
+    Args:
+        model (Model): The model object; its kinematic parameters are used and kept.
+        position (np.ndarray): Positions in the chosen space (theta or x).
+        velocity (np.ndarray): Velocities in the chosen space.
+        acceleration (np.ndarray): Accelerations in the chosen space.
+        force (np.ndarray): Measured motor torque (MOTOR) or load force (LOAD).
+        space (Space, optional): The space enum (MOTOR or LOAD). Defaults to Space.MOTOR.
+        include_friction (bool, optional): Whether Coulomb friction is identified. Defaults to False.
+        chunk_size (int, optional): Samples processed per chunk. Defaults to 2**20.
+
+    Returns:
+        IdentificationResult: The identified parameters and a model copy holding them.
+    """
+    names = parameter_names(space, include_friction)
+    solver = LeastSquares(len(names))
+
+    for start in range(0, len(force), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        Y = regressor(model, position[chunk], velocity[chunk], acceleration[chunk], space, include_friction)
+        solver.update(Y, np.asarray(force[chunk], dtype=float))
+
+    estimate = solver.solve()
+    identified = copy.deepcopy(model)
+    for name, value in zip(names, estimate, strict=True):
+        set_field(identified, name, float(value))
+
+    return IdentificationResult(
+        identified, dict(zip(names, estimate.tolist(), strict=True)), solver.residual, solver.samples
+    )
@@ -0,0 +1,95 @@
+import copy
+from collections.abc import Callable
+from functools import cache
+
+import numpy as np
+
+from .._structs import Data, Model
+from ..kinematics import contraction
+from ._least_squares import LeastSquares
+from ._result import IdentificationResult
+
+KINEMATIC_PARAMETERS = ("kinematic.length", "kinematic.radius")
+
+
+@cache
+def _contraction_gradient() -> Callable:
+    """Trace kinematics.contraction with SymPy and emit x and its derivatives with respect to (L, r)."""
+    import sympy as sp
+
+    theta, L, r = sp.symbols("theta L r", positive=True)
+    model = Model()
+    model.kinematic.length, model.kinematic.radius = L, r
+    data = Data()
+    x = sp.nsimplify(contraction(model, data, theta), rational=True)
+    return sp.lambdify((theta, L, r), [x, sp.diff(x, L), sp.diff(x, r)], modules="numpy", cse=True)
+
+
+def _chunks(size: int, chunk_size: int):
+    for start in range(0, size, chunk_size):
+        yield slice(start, start + chunk_size)
+
+
+def fit_kinematics(
+    model: Model,
+    theta: np.ndarray,
+    x: np.ndarray,
+    iterations: int = 20,
+    tol: float = 1e-12,
+    chunk_size: int = 1 << 20,
+) -> IdentificationResult:
+    """
+    Identify the string length L and radius r from measured motor angles and contractions.
+
+    The contraction is nonlinear in (L, r), but squaring the position constraint
+    (L - x)^2 = L^2 - (r theta)^2 gives x^2 = 2 L x - r^2 theta^2, which is linear in
+    (L, r^2) and provides the initial guess. It is refined by Gauss-Newton on the contraction
+    residual, with the Jacobian dx/d(L, r) derived symbolically from kinematics.contraction.
+    Every pass streams over chunks, so memory-mapped arrays of any length can be used.
+
+    Args:
+        model (Model): The model object; all parameters other than L and r are kept.
+        theta (np.ndarray): Measured motor angles in radians.
+        x (np.ndarray): Measured contractions in meters.
+        iterations (int, optional): Maximum number of Gauss-Newton iterations. Defaults to 20.
+        tol (float, optional): Relative step size at which the iterations stop. Defaults to 1e-12.
+        chunk_size (int, optional): Samples processed per chunk. Defaults to 2**20.
+
+    Returns:
+        IdentificationResult: The identified (L, r) and a model copy holding them.
+
+    Raises:
+        ImportError: If SymPy is not installed.
+    """
+    gradient = _contraction_gradient()
+
+    solver = LeastSquares(2)
+    for chunk in _chunks(len(x), chunk_size):
+        theta_i, x_i = np.asarray(theta[chunk], dtype=float), np.asarray(x[chunk], dtype=float)
+        solver.update(np.column_stack((2 * x_i, -(theta_i**2))), x_i**2)
+    L, r2 = solver.solve()
+    # no sample may lie beyond the full twist r theta = L of the initial guess
+    r = min(np.sqrt(abs(r2)), (1 - 1e-9) * L / float(np.max(np.abs(theta))))
+
+    for _ in range(iterations):
+        solver = LeastSquares(2)
+        for chunk in _chunks(len(x), chunk_size):
+            theta_i, x_i = np.asarray(theta[chunk], dtype=float), np.asarray(x[chunk], dtype=float)
+            x_model, dx_dL, dx_dr = gradient(theta_i, L, r)
+            solver.update(np.column_stack(np.broadcast_arrays(dx_dL, dx_dr)), x_i - x_model)
+        dL, dr = solver.solve()
+        L, r = L + dL, r + dr
+        if abs(dL) <= tol * abs(L) and abs(dr) <= tol * abs(r):
+            break
+
+    identified = copy.deepcopy(model)
+    identified.kinematic.length, identified.kinematic.radius = float(L), float(r)
+
+    # residual at the final estimate
+    squared = 0.0
+    for chunk in _chunks(len(x), chunk_size):
+        squared += float(np.sum((np.asarray(x[chunk]) - gradient(np.asarray(theta[chunk]), L, r)[0]) ** 2))
+    rms = float(np.sqrt(squared / len(x))) if len(x) else 0.0
+
+    parameters = dict(zip(KINEMATIC_PARAMETERS, (float(L), float(r)), strict=True))
+    return IdentificationResult(identified, parameters, rms, len(x))
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class LeastSquares:
+    """
+    Streaming linear least squares by incremental QR factorization.
+
+    Chunks of the regressor A and the target b are folded into the triangular factor of the
+    augmented matrix [A | b], so memory stays bounded by the chunk size whatever the number
+    of samples, and the normal equations are never formed.
+
+    Args:
+        size (int): Number of unknown parameters.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.samples = 0
+        self._R = np.zeros((0, size + 1))
+
+    def update(self, A: np.ndarray, b: np.ndarray) -> None:
+        """
+        Add a chunk of equations A p = b.
+
+        Args:
+            A (np.ndarray): The (N, size) regressor chunk.
+            b (np.ndarray): The (N,) target chunk.
+        """
+        stacked = np.vstack((self._R, np.column_stack((A, b))))
+        self._R = np.linalg.qr(stacked, mode="r")
+        self.samples += len(b)
+
+    def solve(self) -> np.ndarray:
+        """
+        Solve for the parameters minimizing the accumulated squared residual.
+
+        Returns:
+            np.ndarray: The (size,) parameter estimate.
+        """
+        R = self._R[: self.size]
+        return np.linalg.lstsq(R[:, : self.size], R[:, self.size], rcond=None)[0]
+
+    @property
+    def residual(self) -> float:
+        """Root mean square residual of the accumulated equations at the solution."""
+        if self.samples == 0 or len(self._R) <= self.size:
+            return 0.0
+        return float(abs(self._R[self.size, self.size]) / np.sqrt(self.samples))
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from .._structs import Model
+
+
+@dataclass
+class IdentificationResult:
+    """
+    Outcome of a parameter identification.
+
+    Attributes:
+        model (Model): Copy of the initial model with the identified parameters written in.
+        parameters (dict[str, float]): Identified values keyed by dotted model field path.
+        rms (float): Root mean square residual of the fit.
+        samples (int): Number of samples used.
+    """
+
+    model: Model
+    parameters: dict[str, float]
+    rms: float
+    samples: int
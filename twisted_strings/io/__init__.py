@@ -0,0 +1,18 @@
+"""
+Log Files for Twisted String Actuators
+
+A compact, versioned columnar format for streams of Data samples. A log is a directory
+with a JSON header holding the format version, the column names, the Model parameters and
+user metadata, and one raw little-endian float64 file per column (the 22 SpaceData fields of
+both spaces and an optional time column). LogWriter appends buffered samples, LogReader
+memory-maps the columns for zero-copy random access and replays ranges as BatchData.
+
+Example:
+    with io.LogWriter("run.tsalog", model) as log:
+        log.append(data, t)
+
+    log = io.LogReader("run.tsalog")
+    data = log.snapshot(log.index(12.5))
+"""
+
+from ._log import COLUMNS, FORMAT, VERSION, LogReader, LogWriter, read_header
@@ -0,0 +1,339 @@
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import fields
+from operator import attrgetter
+
+import numpy as np
+
+from .._structs import BatchData, Data, Model, SpaceData, get_field, set_field
+
+FORMAT = "twisted_strings.log"
+VERSION = 1
+
+HEADER = "header.json"
+SPACES = ("motor", "load")
+FIELDS = tuple(f.name for f in fields(SpaceData))
+# Column names in the order of the BatchData buffer, (space, field)
+COLUMNS = tuple(f"{space}.{name}" for space in SPACES for name in FIELDS)
+
+_DTYPE = np.dtype("<f8")
+_fields = attrgetter(*FIELDS)
+
+
+def _paths(dtype: np.dtype, prefix: str = "") -> list[str]:
+    """Dotted paths of the leaf fields of a (nested) record dtype."""
+    paths = []
+    for name in dtype.names:
+        sub = dtype.fields[name][0]
+        paths.extend(_paths(sub, f"{prefix}{name}.") if sub.names else [f"{prefix}{name}"])
+    return paths
+
+
+def _column_file(path: str, column: str) -> str:
+    return os.path.join(path, f"{column}.f8")
+
+
+def _model_header(model: Model) -> dict:
+    """Model parameters by dotted path as stored in the header."""
+    return {name: np.asarray(get_field(model, name)).tolist() for name in _paths(Model.dtype)}
+
+
+def read_header(path: str) -> dict:
+    """
+    Read and validate the header of a log.
+
+    Args:
+        path (str): The log directory.
+
+    Returns:
+        dict: The header with the format, version, column names, model parameters and metadata.
+
+    Raises:
+        ValueError: If the directory does not hold a log of a supported version.
+    """
+    with open(os.path.join(path, HEADER)) as file:
+        header = json.load(file)
+    if header.get("format") != FORMAT:
+        raise ValueError(f"Not a log: {path}")
+    if header["version"] > VERSION:
+        raise ValueError(f"Unsupported log version: {header['version']}")
+    return header
+
+
+class LogWriter:
+    """
+    Append-only writer of a columnar Data log.
+
+    A log is a directory holding ``header.json`` (format version, column names, the Model
+    parameters and free metadata) and one raw little-endian float64 file per column: the 11
+    SpaceData fields of the motor and the load space, plus an optional time column. Samples
+    are collected in a preallocated (2, 11, buffer_size) buffer laid out like BatchData and
+    each full buffer is appended to the column files with one write per column, so logging a
+    tick costs two attribute reads and two slice assignments.
+
+    Example:
+        with LogWriter("run.tsalog", model) as log:
+            for t in ticks:
+                ...
+                log.append(data, t)
+
+    Args:
+        path (str): The log directory, created if missing.
+        model (Model): The model stored in the header.
+        time (bool, optional): Whether samples carry a time stamp. Defaults to True.
+        buffer_size (int, optional): Samples buffered between writes. Defaults to 4096.
+        metadata (dict | None, optional): JSON serializable user data stored in the header. Defaults to None.
+        append (bool, optional): Whether to continue an existing log instead of failing. Defaults to False.
+
+    Raises:
+        FileExistsError: If the log exists and append is False.
+        ValueError: If an appended log has a different version, time column or model.
+
+    Note:
+        Rows are committed when the buffer is flushed. A reader sees the samples common to
+        all column files, so a log cut short by a crash stays readable up to the last flush;
+        appending to such a log first truncates every column to the common length.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Model,
+        time: bool = True,
+        buffer_size: int = 4096,
+        metadata: dict | None = None,
+        append: bool = False,
+    ):
+        self.path = path
+        self.columns = COLUMNS + (("time",) if time else ())
+        if os.path.exists(os.path.join(path, HEADER)):
+            if not append:
+                raise FileExistsError(f"Log already exists: {path}")
+            header = read_header(path)
+            if header["version"] != VERSION or tuple(header["columns"]) != self.columns:
+                raise ValueError(f"Incompatible log: {path}")
+            if header["model"] != _model_header(model):
+                raise ValueError(f"Log {path} was recorded with a different model")
+            # drop the rows of a partial flush so that every column continues at the same index
+            files = [_column_file(path, column) for column in self.columns]
+            length = min(os.path.getsize(file) for file in files) // _DTYPE.itemsize
+            for file in files:
+                os.truncate(file, length * _DTYPE.itemsize)
+        else:
+            os.makedirs(path, exist_ok=True)
+            header = {
+                "format": FORMAT,
+                "version": VERSION,
+                "dtype": _DTYPE.str,
+                "columns": list(self.columns),
+                "model": _model_header(model),
+                "metadata": metadata or {},
+            }
+            with open(os.path.join(path, HEADER), "w") as file:
+                json.dump(header, file, indent=2)
+
+        self._files = [open(_column_file(path, column), "ab") for column in self.columns]
+        self._buffer = np.empty((2, len(FIELDS), buffer_size), dtype=_DTYPE)
+        self._time = np.empty(buffer_size, dtype=_DTYPE) if time else None
+        self._size = buffer_size
+        self._count = 0
+
+    def __enter__(self) -> "LogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, data: Data, time: float | None = None) -> None:
+        """
+        Append one sample.
+
+        Args:
+            data (Data): The sample, all 22 fields are recorded.
+            time (float | None, optional): The time stamp, required if the log has a time column.
+
+        Raises:
+            ValueError: If the log has a time column and no time stamp is given.
+        """
+        if time is None and self._time is not None:
+            raise ValueError(f"Log {self.path} needs a time stamp")
+        n = self._count
+        self._buffer[0, :, n] = _fields(data.motor)
+        self._buffer[1, :, n] = _fields(data.load)
+        if self._time is not None:
+            self._time[n] = time
+        self._count = n + 1
+        if self._count == self._size:
+            self.flush()
+
+    def append_batch(self, data: BatchData, time: np.ndarray | None = None) -> None:
+        """
+        Append consecutive samples stored in a BatchData.
+
+        Args:
+            data (BatchData): The samples, one per batch element.
+            time (np.ndarray | None, optional): The time stamps, required if the log has a time column.
+
+        Raises:
+            ValueError: If the log has a time column and no time stamps are given.
+        """
+        if time is None and self._time is not None:
+            raise ValueError(f"Log {self.path} needs a time stamp")
+        self.flush()
+        # the time column, if any, is the last file and is written separately
+        for file, column in zip(self._files, data.buffer.reshape(-1, len(data)), strict=False):
+            file.write(np.ascontiguousarray(column, dtype=_DTYPE))
+        if self._time is not None:
+            self._files[-1].write(np.ascontiguousarray(np.broadcast_to(time, (len(data),)), dtype=_DTYPE))
+
+    def flush(self) -> None:
+        """Write the buffered samples to the column files."""
+        n = self._count
+        if n:
+            for file, column in zip(self._files, self._buffer.reshape(-1, self._size), strict=False):
+                file.write(column[:n])
+            if self._time is not None:
+                self._files[-1].write(self._time[:n])
+            self._count = 0
+        for file in self._files:
+            file.flush()
+
+    def close(self) -> None:
+        """Flush the buffer and close the column files."""
+        if self._files:
+            self.flush()
+            for file in self._files:
+                file.close()
+            self._files = []
+
+
+class LogReader:
+    """
+    Memory-mapped reader of a columnar Data log.
+
+    Every column is mapped read-only, so opening a log of any length is instant and nothing
+    is read until it is indexed. Columns and their slices are zero-copy views into the
+    files; ``batch`` and ``iter_batches`` copy ranges of samples into a writable BatchData
+    (one memcpy per column) to replay them through the kinematics and dynamics functions.
+
+    Example:
+        log = LogReader("run.tsalog")
+        x = log["load.position"][1000:2000]
+        for start, batch in log.iter_batches(1 << 16):
+            forward_dynamics(log.model, batch, Space.MOTOR)
+
+    Args:
+        path (str): The log directory.
+
+    Attributes:
+        header (dict): The log header.
+        model (Model): The model rebuilt from the header.
+        metadata (dict): The user metadata of the header.
+        columns (dict[str, np.ndarray]): Read-only memory-mapped columns by name.
+
+    Raises:
+        ValueError: If the directory does not hold a log of a supported version.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.header = read_header(path)
+        self.metadata = self.header["metadata"]
+        self.model = Model()
+        for name, value in self.header["model"].items():
+            set_field(self.model, name, value if np.isscalar(value) else np.array(value))
+
+        dtype = np.dtype(self.header["dtype"])
+        files = [_column_file(path, column) for column in self.header["columns"]]
+        # rows fully written to every column, a crashed writer may leave a partial flush
+        self._length = min(os.path.getsize(file) for file in files) // dtype.itemsize
+        self.columns = {
+            column: np.memmap(file, dtype=dtype, mode="r", shape=(self._length,)) if self._length else np.empty(0)
+            for column, file in zip(self.header["columns"], files, strict=True)
+        }
+        self._data = [self.columns[column] for column in COLUMNS]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"LogReader({self.path!r}, samples={len(self)})"
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @property
+    def time(self) -> np.ndarray | None:
+        """The memory-mapped time column, or None if the log has none."""
+        return self.columns.get("time")
+
+    def index(self, time: float) -> int:
+        """
+        Find the sample at or right after a time, assuming increasing time stamps.
+
+        Args:
+            time (float): The time.
+
+        Returns:
+            int: The sample index.
+
+        Raises:
+            ValueError: If the log has no time column.
+        """
+        if self.time is None:
+            raise ValueError(f"Log has no time column: {self.path}")
+        return int(np.searchsorted(self.time, time))
+
+    def snapshot(self, index: int) -> Data:
+        """
+        Read one sample.
+
+        Args:
+            index (int): The sample index, negative values count from the end.
+
+        Returns:
+            Data: The sample.
+        """
+        values = [float(column[index]) for column in self._data]
+        return Data(motor=SpaceData(*values[: len(FIELDS)]), load=SpaceData(*values[len(FIELDS) :]))
+
+    def batch(self, start: int = 0, stop: int | None = None, out: BatchData | None = None) -> BatchData:
+        """
+        Copy a range of samples into a BatchData.
+
+        Args:
+            start (int, optional): The first sample. Defaults to 0.
+            stop (int | None, optional): The end of the range. Defaults to None (end of the log).
+            out (BatchData | None, optional): A BatchData of the range length to fill. Defaults
+                to None (a new one).
+
+        Returns:
+            BatchData: The samples, one per batch element.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        size = max(stop - start, 0)
+        out = BatchData(size) if out is None or len(out) != size else out
+        if not size:
+            return out
+        for target, column in zip(out.buffer.reshape(-1, size), self._data, strict=True):
+            target[:] = column[start:stop]
+        return out
+
+    def iter_batches(self, chunk_size: int = 1 << 16) -> Iterator[tuple[int, BatchData]]:
+        """
+        Replay the log in consecutive chunks.
+
+        One BatchData is reused for all full chunks, so memory is bounded by the chunk size.
+
+        Args:
+            chunk_size (int, optional): Samples per chunk. Defaults to 2**16.
+
+        Yields:
+            tuple[int, BatchData]: The index of the first sample and the chunk. The chunk is
+                overwritten by the next iteration.
+        """
+        out = None
+        for start in range(0, len(self), chunk_size):
+            out = self.batch(start, start + chunk_size, out)
+            yield start, out
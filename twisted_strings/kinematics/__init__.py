@@ -21,3 +21,6 @@ from ._acceleration import djacobian, motor_acceleration
 from ._position import contraction, motor_angle
 from ._velocity import contraction_speed, jacobian, motor_speed
 from ._constraints import position_constraint, velocity_constraint, acceleration_constraint
+from ._cache import CacheInfo, KinematicsCache
+from ._table import ContractionTable
+from . import batch, fast
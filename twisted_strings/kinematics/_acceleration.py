@@ -87,6 +87,7 @@ def motor_acceleration(
 
     theta = motor_angle(model, data)
     dtheta = dx / J
-    d2theta = (ddx - djacobian(model, data, theta=theta, dtheta=dtheta, x=x, dx=dx)) / J
+    # ddx = J ddtheta + dJ/dt dtheta
+    d2theta = (ddx - djacobian(model, data, theta=theta, dtheta=dtheta, x=x, dx=dx) * dtheta) / J
 
     return d2theta
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import NamedTuple
+
+from .._structs import Data, Model
+from ._acceleration import djacobian
+from ._position import contraction, motor_angle
+from ._velocity import contraction_speed, jacobian, motor_speed
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class KinematicsCache:
+    """
+    Opt-in memoization of the kinematics functions for repeated scalar evaluations.
+
+    Results are stored in a bounded LRU shared by all methods. The key holds the kinematic
+    parameters by value together with the arguments, so mutating ``model.kinematic`` in place
+    never returns a stale entry. Methods take plain hashable scalars and do not touch any
+    user Data object.
+
+    Example:
+        cache = KinematicsCache(maxsize=256)
+        J = cache.jacobian(model, theta=100.0)  # miss
+        J = cache.jacobian(model, theta=100.0)  # hit
+        print(cache.cache_info())
+
+    Args:
+        maxsize (int, optional): Maximum number of stored results. Defaults to 128.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+        self._data = Data()
+        self._hits = 0
+        self._misses = 0
+
+    def _lookup(self, function: Callable, model: Model, *args: float | None) -> float:
+        key = (function.__name__, model.kinematic.length, model.kinematic.radius, *args)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            value = function(model, self._data, *args)
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def contraction(self, model: Model, theta: float) -> float:
+        """Cached ``kinematics.contraction`` at the motor angle theta."""
+        return self._lookup(contraction, model, theta)
+
+    def motor_angle(self, model: Model, x: float) -> float:
+        """Cached ``kinematics.motor_angle`` at the contraction x."""
+        return self._lookup(motor_angle, model, x)
+
+    def jacobian(self, model: Model, theta: float | None = None, x: float | None = None) -> float:
+        """
+        Cached ``kinematics.jacobian`` at the motor angle theta and/or the contraction x.
+
+        Raises:
+            ValueError: If neither theta nor x is provided.
+        """
+        if theta is None and x is None:
+            raise ValueError("Insufficient data to calculate Jacobian")
+        return self._lookup(jacobian, model, theta, x)
+
+    def contraction_speed(self, model: Model, x: float, dtheta: float) -> float:
+        """Cached ``kinematics.contraction_speed`` at the contraction x and motor speed dtheta."""
+        return self._lookup(contraction_speed, model, x, dtheta)
+
+    def motor_speed(self, model: Model, theta: float, dx: float) -> float:
+        """Cached ``kinematics.motor_speed`` at the motor angle theta and contraction speed dx."""
+        return self._lookup(motor_speed, model, theta, dx)
+
+    def djacobian(self, model: Model, theta: float, dtheta: float) -> float:
+        """Cached ``kinematics.djacobian`` at the motor state (theta, dtheta)."""
+        return self._lookup(djacobian, model, theta, dtheta)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report the hit and miss statistics of the cache.
+
+        Returns:
+            CacheInfo: Named tuple (hits, misses, maxsize, currsize).
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Clear the stored results and the statistics."""
+        self._entries.clear()
+        self._hits = self._misses = 0
@@ -0,0 +1,246 @@
+import numpy as np
+
+from .._structs import Model
+
+_ARRAYS = ("x", "J", "dJ", "ddJ")
+_ERRORS = ("contraction", "jacobian", "djacobian", "motor_angle")
+
+
+def _cubic(values: np.ndarray, slopes: np.ndarray, h: float) -> np.ndarray:
+    """Power basis coefficients (4, N) of the cubic Hermite interpolants, computed in float64 and stored as values."""
+    y0, y1 = values[:-1].astype(np.float64), values[1:].astype(np.float64)
+    m0, m1 = h * slopes[:-1].astype(np.float64), h * slopes[1:].astype(np.float64)
+    return np.stack((y0, m0, 3 * (y1 - y0) - 2 * m0 - m1, 2 * (y0 - y1) + m0 + m1)).astype(values.dtype)
+
+
+def _horner(coefficients: np.ndarray, i: np.ndarray, t: np.ndarray) -> np.ndarray:
+    c0, c1, c2, c3 = coefficients[:, i]
+    return c0 + t * (c1 + t * (c2 + t * c3))
+
+
+class ContractionTable:
+    """
+    Table-driven contraction map of a fixed model.
+
+    The contraction x, the Jacobian J = dx/dtheta and its derivatives dJ/dtheta and
+    d2J/dtheta2 are sampled once on a uniform motor angle grid. Queries are answered by
+    vectorized cubic Hermite interpolation using the tabulated values and slopes (expanded
+    once into per-interval polynomial coefficients), so the forward maps evaluate no square
+    root per call. Negative motor angles use the symmetry of the map
+    (x and dJ/dtheta are even, J is odd in theta).
+
+    Domain:
+        The forward maps accept motor angles with |theta| <= theta_max and motor_angle
+        accepts contractions up to the last tabulated one; queries outside the table raise
+        a ValueError instead of extrapolating the last cubic.
+
+    Error bound:
+        For a grid step h the interpolation error of a function f is bounded by
+        h^4 / 384 * max|f''''| over each interval. The maximum error of every map, measured
+        against the closed form at the interval midpoints where the Hermite error peaks, is
+        stored in the ``error`` attribute when the table is built from a model. The error
+        grows quickly as theta_max approaches the singular full twist L / r.
+
+    Example:
+        table = ContractionTable.from_model(model, size=2048)
+        x = table.contraction(theta)
+        table.save("contraction.npz")
+
+    Attributes:
+        theta_max (float): Largest tabulated motor angle in radians.
+        x (np.ndarray): Contraction at the grid nodes.
+        J (np.ndarray): Jacobian dx/dtheta at the grid nodes.
+        dJ (np.ndarray): Derivative dJ/dtheta at the grid nodes.
+        ddJ (np.ndarray): Second derivative d2J/dtheta2 at the grid nodes.
+        error (dict[str, float]): Measured maximum absolute error of each map.
+    """
+
+    def __init__(
+        self,
+        theta_max: float,
+        x: np.ndarray,
+        J: np.ndarray,
+        dJ: np.ndarray,
+        ddJ: np.ndarray,
+        error: dict[str, float] | None = None,
+    ):
+        self.theta_max = float(theta_max)
+        self.x = x
+        self.J = J
+        self.dJ = dJ
+        self.ddJ = ddJ
+        self.error = {} if error is None else error
+        self._size = len(x) - 1
+        self._h = self.theta_max / self._size
+        self._x = _cubic(x, J, self._h)
+        self._J = _cubic(J, dJ, self._h)
+        self._dJ = _cubic(dJ, ddJ, self._h)
+
+    @classmethod
+    def from_model(
+        cls,
+        model: Model,
+        size: int = 1024,
+        theta_max: float | None = None,
+        dtype: type = np.float64,
+    ) -> "ContractionTable":
+        """
+        Sample the contraction map of a model.
+
+        Args:
+            model (Model): The model object containing kinematic parameters.
+            size (int, optional): Number of grid intervals. Defaults to 1024.
+            theta_max (float | None, optional): Largest tabulated motor angle in radians.
+                Defaults to 90% of the full twist angle L / r.
+            dtype (type, optional): Storage type of the tabulated values and the interpolation
+                coefficients, e.g. np.float32 for tables of half the size at a larger
+                interpolation error. Queries are evaluated in float64. Defaults to np.float64.
+
+        Returns:
+            ContractionTable: The sampled table with its measured error.
+        """
+        L, r = model.kinematic.length, model.kinematic.radius
+        theta_max = 0.9 * L / r if theta_max is None else theta_max
+
+        def sample(theta: np.ndarray) -> dict[str, np.ndarray]:
+            s = np.sqrt(L**2 - (theta * r) ** 2)
+            return {
+                "x": L - s,
+                "J": theta * r**2 / s,
+                "dJ": (r * L) ** 2 / s**3,
+                "ddJ": 3 * r**4 * L**2 * theta / s**5,
+            }
+
+        nodes = sample(np.linspace(0.0, theta_max, size + 1))
+        table = cls(theta_max, *(nodes[name].astype(dtype) for name in _ARRAYS))
+
+        midpoints = (np.arange(size) + 0.5) * theta_max / size
+        exact = sample(midpoints)
+        table.error = {
+            "contraction": float(np.abs(table.contraction(midpoints) - exact["x"]).max()),
+            "jacobian": float(np.abs(table.jacobian(midpoints) - exact["J"]).max()),
+            "djacobian": float(np.abs(table.djacobian(midpoints) - exact["dJ"]).max()),
+            "motor_angle": float(np.abs(table.motor_angle(exact["x"]) - midpoints).max()),
+        }
+        return table
+
+    def _locate(self, theta: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if np.any(np.abs(theta) > self.theta_max):
+            raise ValueError(f"Motor angle outside of the table range: |theta| > {self.theta_max}")
+        u = np.abs(theta) / self._h
+        i = np.clip(u.astype(np.intp), 0, self._size - 1)
+        return i, u - i, np.sign(theta)
+
+    def contraction(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the contraction at the motor angle.
+
+        Args:
+            theta (np.ndarray): The motor angles in radians.
+
+        Returns:
+            np.ndarray: The contraction (x) in meters.
+
+        Raises:
+            ValueError: If |theta| exceeds theta_max.
+        """
+        i, t, _ = self._locate(np.asarray(theta))
+        return _horner(self._x, i, t)
+
+    def jacobian(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the Jacobian dx/dtheta at the motor angle.
+
+        Args:
+            theta (np.ndarray): The motor angles in radians.
+
+        Returns:
+            np.ndarray: The Jacobian.
+
+        Raises:
+            ValueError: If |theta| exceeds theta_max.
+        """
+        i, t, sign = self._locate(np.asarray(theta))
+        return sign * _horner(self._J, i, t)
+
+    def djacobian(self, theta: np.ndarray, dtheta: np.ndarray = 1.0) -> np.ndarray:
+        """
+        Interpolate the time derivative of the Jacobian at the motor state.
+
+        Args:
+            theta (np.ndarray): The motor angles in radians.
+            dtheta (np.ndarray, optional): The motor angular velocities in rad/s. With the
+                default of 1.0 the derivative dJ/dtheta itself is returned.
+
+        Returns:
+            np.ndarray: The time derivative of the Jacobian dJ/dt = dJ/dtheta * dtheta.
+
+        Raises:
+            ValueError: If |theta| exceeds theta_max.
+        """
+        i, t, _ = self._locate(np.asarray(theta))
+        return _horner(self._dJ, i, t) * dtheta
+
+    def motor_angle(self, x: np.ndarray, iterations: int = 3) -> np.ndarray:
+        """
+        Invert the tabulated contraction map.
+
+        The interval is found by binary search in the tabulated contraction, then a fixed
+        number of Newton iterations is run on the interpolating cubic. The first interval,
+        where x grows quadratically with theta, starts from a square root guess.
+
+        Args:
+            x (np.ndarray): The contractions in meters.
+            iterations (int, optional): Number of Newton iterations. Defaults to 3.
+
+        Returns:
+            np.ndarray: The non-negative motor angle (theta) in radians.
+
+        Raises:
+            ValueError: If x exceeds the largest tabulated contraction.
+        """
+        x = np.asarray(x)
+        if np.any(x > self.x[-1]):
+            raise ValueError(f"Contraction outside of the table range: x > {float(self.x[-1])}")
+        i = np.clip(np.searchsorted(self.x, x, side="right") - 1, 0, self._size - 1)
+        fraction = np.clip((x - self.x[i]) / (self.x[i + 1] - self.x[i]), 0.0, 1.0)
+        t = np.where(i == 0, np.sqrt(fraction), fraction)
+
+        c0, c1, c2, c3 = self._x[:, i]
+        for _ in range(iterations):
+            residual = c0 - x + t * (c1 + t * (c2 + t * c3))
+            slope = c1 + t * (2 * c2 + 3 * t * c3)
+            t = np.clip(t - residual / np.where(slope > 0, slope, np.inf), 0.0, 1.0)
+
+        return (i + t) * self._h
+
+    def save(self, path: str) -> None:
+        """
+        Write the table to a NumPy .npz file.
+
+        Args:
+            path (str): The destination file.
+        """
+        np.savez(
+            path,
+            theta_max=self.theta_max,
+            error=np.array([self.error.get(name, np.nan) for name in _ERRORS]),
+            **{name: getattr(self, name) for name in _ARRAYS},
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionTable":
+        """
+        Read a table written by save.
+
+        Args:
+            path (str): The source file.
+
+        Returns:
+            ContractionTable: The loaded table.
+        """
+        with np.load(path) as arrays:
+            error = {
+                name: float(value) for name, value in zip(_ERRORS, arrays["error"], strict=True) if np.isfinite(value)
+            }
+            return cls(float(arrays["theta_max"]), *(arrays[name] for name in _ARRAYS), error=error)
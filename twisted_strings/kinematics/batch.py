@@ -0,0 +1,193 @@
+"""
+Vectorized kinematics over NumPy arrays.
+
+The functions in this module are the array counterparts of the ``Data`` based kinematics
+functions. They take the model and plain arrays of states, never touch a ``Data`` object
+and evaluate every element in one NumPy pass. Model parameters may themselves be arrays,
+in which case they are broadcast against the states (e.g. a sweep over string radii).
+
+Example:
+    theta = np.linspace(0, 150, 1_000_000)
+    x, dx, J, dJ = batch.motor_state(model, theta, dtheta=10.0)
+"""
+
+import numpy as np
+
+from .._structs import Model
+
+
+def _parameters(model: Model) -> tuple[np.ndarray, np.ndarray]:
+    return np.asarray(model.kinematic.length, dtype=float), np.asarray(model.kinematic.radius, dtype=float)
+
+
+def contraction(model: Model, theta: np.ndarray) -> np.ndarray:
+    """
+    Calculate contraction as a function of motor angle.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        theta (np.ndarray): The motor angles in radians.
+
+    Returns:
+        np.ndarray: The contraction (x) in meters.
+    """
+    L, r = _parameters(model)
+    return L - np.sqrt(L**2 - (np.asarray(theta) * r) ** 2)
+
+
+def motor_angle(model: Model, x: np.ndarray) -> np.ndarray:
+    """
+    Calculate motor angle as a function of contraction.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        x (np.ndarray): The contractions in meters.
+
+    Returns:
+        np.ndarray: The motor angle (theta) in radians.
+    """
+    L, r = _parameters(model)
+    return np.sqrt(L**2 - (L - np.asarray(x)) ** 2) / r
+
+
+def jacobian(model: Model, theta: np.ndarray | None = None, x: np.ndarray | None = None) -> np.ndarray:
+    """
+    Calculate the Jacobian as a function of motor angle or contraction.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        theta (np.ndarray | None, optional): The motor angles in radians. Defaults to None.
+        x (np.ndarray | None, optional): The contractions in meters. Defaults to None.
+
+    Returns:
+        np.ndarray: The Jacobian dx/dtheta.
+
+    Raises:
+        ValueError: If neither theta nor x is provided.
+    """
+    L, r = _parameters(model)
+
+    if theta is not None and x is not None:
+        return np.asarray(theta) * r**2 / (L - np.asarray(x))
+
+    if theta is not None:
+        theta = np.asarray(theta)
+        return theta * r**2 / np.sqrt(L**2 - (theta * r) ** 2)
+
+    if x is not None:
+        s = L - np.asarray(x)
+        return r * np.sqrt(L**2 - s**2) / s
+
+    raise ValueError("Insufficient data to calculate Jacobian")
+
+
+def contraction_speed(model: Model, x: np.ndarray, dtheta: np.ndarray) -> np.ndarray:
+    """
+    Calculate contraction speed as a function of contraction and motor speed.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        x (np.ndarray): The contractions in meters.
+        dtheta (np.ndarray): The motor angular velocities in rad/s.
+
+    Returns:
+        np.ndarray: The contraction speed (dx) in m/s.
+    """
+    return jacobian(model, x=x) * dtheta
+
+
+def motor_speed(model: Model, theta: np.ndarray, dx: np.ndarray) -> np.ndarray:
+    """
+    Calculate motor speed as a function of motor angle and contraction speed.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        theta (np.ndarray): The motor angles in radians.
+        dx (np.ndarray): The contraction speeds in m/s.
+
+    Returns:
+        np.ndarray: The motor angular velocity (dtheta) in rad/s.
+    """
+    return dx / jacobian(model, theta=theta)
+
+
+def djacobian(model: Model, theta: np.ndarray, dtheta: np.ndarray) -> np.ndarray:
+    """
+    Calculate the time derivative of the Jacobian as a function of motor state.
+
+    Uses the closed form dJ/dt = r^2 L^2 dtheta / (L^2 - (r theta)^2)^(3/2), which equals the
+    expression evaluated by ``kinematics.djacobian`` without the intermediate contraction.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        theta (np.ndarray): The motor angles in radians.
+        dtheta (np.ndarray): The motor angular velocities in rad/s.
+
+    Returns:
+        np.ndarray: The time derivative of the Jacobian.
+    """
+    L, r = _parameters(model)
+    s = np.sqrt(L**2 - (np.asarray(theta) * r) ** 2)
+    return (r * L) ** 2 * np.asarray(dtheta) / s**3
+
+
+def motor_acceleration(model: Model, x: np.ndarray, dx: np.ndarray, ddx: np.ndarray) -> np.ndarray:
+    """
+    Calculate motor acceleration as a function of contraction kinematics.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        x (np.ndarray): The contractions in meters.
+        dx (np.ndarray): The contraction velocities in m/s.
+        ddx (np.ndarray): The contraction accelerations in m/s^2.
+
+    Returns:
+        np.ndarray: The motor angular acceleration (ddtheta) in rad/s^2.
+    """
+    theta, dtheta, J, dJ = load_state(model, x, dx)
+    return (ddx - dJ * dtheta) / J
+
+
+def motor_state(
+    model: Model, theta: np.ndarray, dtheta: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the full load-side kinematics from the motor state in a single pass.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        theta (np.ndarray): The motor angles in radians.
+        dtheta (np.ndarray): The motor angular velocities in rad/s.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The contraction x, the contraction
+            speed dx, the Jacobian J and its time derivative dJ.
+    """
+    L, r = _parameters(model)
+    theta, dtheta = np.asarray(theta), np.asarray(dtheta)
+    s = np.sqrt(L**2 - (theta * r) ** 2)
+    J = theta * r**2 / s
+    dJ = (r * L) ** 2 * dtheta / s**3
+    return L - s, J * dtheta, J, dJ
+
+
+def load_state(model: Model, x: np.ndarray, dx: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the full motor-side kinematics from the load state in a single pass.
+
+    Args:
+        model (Model): The model object containing kinematic parameters.
+        x (np.ndarray): The contractions in meters.
+        dx (np.ndarray): The contraction velocities in m/s.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The motor angle theta, the motor
+            speed dtheta, the Jacobian J and its time derivative dJ.
+    """
+    L, r = _parameters(model)
+    s = L - np.asarray(x)
+    rtheta = np.sqrt(L**2 - s**2)
+    J = r * rtheta / s
+    dtheta = dx / J
+    dJ = (r * L) ** 2 * dtheta / s**3
+    return rtheta / r, dtheta, J, dJ
@@ -0,0 +1,76 @@
+"""
+Allocation-free scalar kinematics.
+
+Pure functions of plain floats for tight real-time loops: no Data writes, no recursion and
+no None checks. The model parameters are passed explicitly as the string length L and
+radius r (read them once outside the loop). Each call evaluates a handful of float
+operations and at most one square root, and runs well under a microsecond on CPython.
+Use the functions of ``twisted_strings.kinematics`` when the convenience of Data or
+symbolic inputs is needed.
+
+Example:
+    L, r = model.kinematic.length, model.kinematic.radius
+    x, dx, J, dJ = fast.motor_state(theta, dtheta, L, r)
+"""
+
+from math import sqrt
+
+
+def contraction(theta: float, L: float, r: float) -> float:
+    """Contraction x in meters at the motor angle theta."""
+    return L - sqrt(L * L - theta * theta * r * r)
+
+
+def motor_angle(x: float, L: float, r: float) -> float:
+    """Non-negative motor angle theta in radians at the contraction x."""
+    s = L - x
+    return sqrt(L * L - s * s) / r
+
+
+def jacobian(theta: float, L: float, r: float) -> float:
+    """Jacobian dx/dtheta at the motor angle theta."""
+    return theta * r * r / sqrt(L * L - theta * theta * r * r)
+
+
+def djacobian(theta: float, dtheta: float, L: float, r: float) -> float:
+    """Time derivative of the Jacobian at the motor state (theta, dtheta)."""
+    s2 = L * L - theta * theta * r * r
+    return r * r * L * L * dtheta / (s2 * sqrt(s2))
+
+
+def motor_state(theta: float, dtheta: float, L: float, r: float) -> tuple[float, float, float, float]:
+    """
+    Load-side kinematics from the motor state.
+
+    Returns:
+        tuple[float, float, float, float]: The contraction x, the contraction speed dx, the
+            Jacobian J and its time derivative dJ.
+    """
+    s2 = L * L - theta * theta * r * r
+    s = sqrt(s2)
+    r2 = r * r
+    J = theta * r2 / s
+    return L - s, J * dtheta, J, r2 * L * L * dtheta / (s2 * s)
+
+
+def load_state(x: float, dx: float, L: float, r: float) -> tuple[float, float, float, float]:
+    """
+    Motor-side kinematics from the load state.
+
+    Returns:
+        tuple[float, float, float, float]: The motor angle theta, the motor speed dtheta, the
+            Jacobian J and its time derivative dJ.
+    """
+    s = L - x
+    rtheta = sqrt(L * L - s * s)
+    J = r * rtheta / s
+    dtheta = dx / J
+    return rtheta / r, dtheta, J, r * r * L * L * dtheta / (s * s * s)
+
+
+def motor_acceleration(x: float, dx: float, ddx: float, L: float, r: float) -> float:
+    """Motor angular acceleration ddtheta in rad/s^2 from the load kinematics (x, dx, ddx)."""
+    s = L - x
+    J = r * sqrt(L * L - s * s) / s
+    dtheta = dx / J
+    return (ddx - r * r * L * L * dtheta * dtheta / (s * s * s)) / J
@@ -0,0 +1,16 @@
+"""
+Trajectory Planning for Twisted String Actuators
+
+Point to point contraction profiles that minimize the duration or the motor losses under
+motor torque and speed limits, following the energy aware motion planning of the
+energy-preserving motion paper cited in ``dynamics``. The dynamics are transcribed by
+direct collocation with the load space inverse dynamics and jamming traced by CasADi, and
+solved with IPOPT (optional dependency).
+
+Example:
+    optimizer = TrajectoryOptimizer(model, torque_limit=0.05, objective="time")
+    plans = optimizer.solve_batch(0.01, np.linspace(0.02, 0.08, 20))
+"""
+
+from ._collocation import OBJECTIVES, TrajectoryOptimizer
+from ._result import Plan
@@ -0,0 +1,240 @@
+from functools import cache
+
+import numpy as np
+
+from .._structs import Data, Model, Space, set_field
+from ..codegen import PARAMETERS, parameters
+from ..dynamics import inverse_dynamics, jamming
+from ._result import Plan
+
+OBJECTIVES = ("time", "energy")
+
+
+@cache
+def _motor_function():
+    """CasADi function of the motor torque, angle and speed realizing a load space motion."""
+    import casadi as ca
+
+    x, dx, ddx, external = ca.SX.sym("x"), ca.SX.sym("dx"), ca.SX.sym("ddx"), ca.SX.sym("external")
+    p = ca.SX.sym("p", len(PARAMETERS))
+
+    model = Model()
+    for path, value in zip(PARAMETERS, ca.vertsplit(p), strict=True):
+        set_field(model, path, value)
+
+    data = Data()
+    data.load.position, data.load.velocity, data.load.acceleration = x, dx, ddx
+    # the external load adds to the string tension before it is amplified by jamming
+    force = inverse_dynamics(model, data, Space.LOAD, include_jamming=False) + external
+    force = force + jamming(model, data, force)
+    outputs = [data.load.jacobian * force, data.motor.position, data.motor.velocity]
+    return ca.Function("motor_motion", [x, dx, ddx, external, p], ca.cse(outputs))
+
+
+@cache
+def _problem(objective: str, intervals: int, max_iterations: int):
+    """Collocation NLP, built once per objective, number of intervals and iteration cap."""
+    import casadi as ca
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    N = intervals
+    # stage-wise layout (x_k, dx_k, ddx_k) keeps the constraint Jacobian banded
+    W, T = ca.SX.sym("w", 3, N + 1), ca.SX.sym("duration")
+    external, p = ca.SX.sym("external"), ca.SX.sym("p", len(PARAMETERS))
+    X, V, A = W[0, :], W[1, :], W[2, :]
+    h = T / N
+
+    torque, _, speed = _motor_function().map(N + 1)(X, V, A, external, p)
+    # exact integration of a piecewise linear acceleration
+    defects = ca.vertcat(
+        X[1:] - X[:-1] - h * V[:-1] - h**2 * (2 * A[:-1] + A[1:]) / 6,
+        V[1:] - V[:-1] - h * (A[:-1] + A[1:]) / 2,
+    )
+
+    if objective == "time":
+        cost = T
+    else:
+        cost = h * (ca.sumsqr(torque) - (torque[0] ** 2 + torque[-1] ** 2) / 2)
+
+    nlp = {
+        "x": ca.vertcat(ca.vec(W), T),
+        "p": ca.vertcat(external, p),
+        "f": cost,
+        "g": ca.vertcat(ca.vec(defects), ca.vec(ca.vertcat(torque, speed))),
+    }
+    options = {
+        "print_time": False,
+        "show_eval_warnings": False,
+        "ipopt.print_level": 0,
+        "ipopt.sb": "yes",
+        "ipopt.max_iter": max_iterations,
+    }
+    return ca.nlpsol(f"plan_{objective}_{N}", "ipopt", nlp, options)
+
+
+class TrajectoryOptimizer:
+    """
+    Time or energy optimal point to point contraction profiles under motor limits.
+
+    The motion x(t) from rest to rest is transcribed by direct collocation on N intervals with
+    the contraction, its speed and a piecewise linear acceleration at the nodes. The motor
+    torque at every node is given by the load space inverse dynamics including the jamming
+    term, traced once with CasADi, and bounded together with the motor speed. Objectives:
+
+    - "time": minimize the duration T
+    - "energy": minimize the integral of the squared torque (the resistive losses of the motor)
+      over the given duration
+
+    The NLP is built once per objective and number of intervals with the model parameters and
+    external load as parameters, and the boundary conditions and limits as bounds, so one
+    compiled problem with sparse, banded Jacobians serves every target; ``solve_batch`` plans
+    many targets in a row, warm starting each from the previous profile.
+
+    Example:
+        optimizer = TrajectoryOptimizer(model, torque_limit=0.05, objective="time")
+        plan = optimizer.solve(0.01, 0.05)
+        print(plan.duration)
+
+    Args:
+        model (Model): The model object containing system parameters.
+        torque_limit (float): The bound |tau| <= torque_limit on the motor torque.
+        speed_limit (float, optional): The bound |dtheta| <= speed_limit on the motor speed. Defaults to inf.
+        objective (str, optional): "time" or "energy". Defaults to "time".
+        intervals (int, optional): Number of collocation intervals N. Defaults to 50.
+        position_bounds (tuple[float, float] | None, optional): Bounds of the contraction.
+            Defaults to None, which is (0, L).
+        external (float, optional): Constant external load force opposing the contraction. Defaults to 0.0.
+        max_iterations (int, optional): Iteration cap of a solve. Defaults to 500.
+
+    Raises:
+        ValueError: If an unknown objective is provided.
+        ImportError: If CasADi is not installed.
+
+    Note:
+        The strings must stay twisted, so the start and target must lie in (0, L). The model is
+        read at every solve.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        torque_limit: float,
+        speed_limit: float = np.inf,
+        objective: str = "time",
+        intervals: int = 50,
+        position_bounds: tuple[float, float] | None = None,
+        external: float = 0.0,
+        max_iterations: int = 500,
+    ):
+        self.model = model
+        self.torque_limit = torque_limit
+        self.speed_limit = speed_limit
+        self.objective = objective
+        self.intervals = intervals
+        self.position_bounds = position_bounds
+        self.external = external
+        self._solver = _problem(objective, intervals, max_iterations)
+
+    def _guess(self, start: float, target: float, duration: float, previous: Plan | None) -> np.ndarray:
+        """Initial guess, the previous profile rescaled to the new boundary conditions or a smoothstep."""
+        if previous is None or previous.position[-1] == previous.position[0]:
+            s = np.linspace(0.0, 1.0, self.intervals + 1)
+            shape, dshape, ddshape = 3 * s**2 - 2 * s**3, 6 * (s - s**2), 6 - 12 * s
+        else:
+            span, T = previous.position[-1] - previous.position[0], previous.duration
+            shape = (previous.position - previous.position[0]) / span
+            dshape, ddshape = previous.velocity * T / span, previous.acceleration * T**2 / span
+            if self.objective == "time":
+                duration = T
+        distance = target - start
+        w = np.stack((start + distance * shape, distance * dshape / duration, distance * ddshape / duration**2), 1)
+        return np.append(w.ravel(), duration)
+
+    def solve(self, start: float, target: float, duration: float = 1.0, guess: Plan | None = None) -> Plan:
+        """
+        Plan a rest to rest motion of the contraction.
+
+        Args:
+            start (float): The initial contraction in meters.
+            target (float): The final contraction in meters.
+            duration (float, optional): The duration for the "energy" objective, and the initial
+                guess of the duration for the "time" objective. Defaults to 1.0.
+            guess (Plan | None, optional): A previous plan whose profile is rescaled as the
+                initial guess. Defaults to None (smoothstep profile).
+
+        Returns:
+            Plan: The optimized trajectory.
+        """
+        N = self.intervals
+        lower, upper = (0.0, self.model.kinematic.length) if self.position_bounds is None else self.position_bounds
+
+        lbx, ubx = np.full((N + 1, 3), -np.inf), np.full((N + 1, 3), np.inf)
+        lbx[:, 0], ubx[:, 0] = lower, upper
+        lbx[0, :2] = ubx[0, :2] = start, 0.0
+        lbx[-1, :2] = ubx[-1, :2] = target, 0.0
+        if self.objective == "time":
+            bounds = (0.0, np.inf)
+        else:
+            bounds = (duration, duration)
+        lbx, ubx = np.append(lbx.ravel(), bounds[0]), np.append(ubx.ravel(), bounds[1])
+
+        limits = np.concatenate((np.zeros(2 * N), np.tile((self.torque_limit, self.speed_limit), N + 1)))
+        lbg = np.concatenate((np.zeros(2 * N), -limits[2 * N :]))
+
+        solution = self._solver(
+            x0=self._guess(start, target, duration, guess),
+            p=np.array([self.external, *parameters(self.model)], dtype=float),
+            lbx=lbx,
+            ubx=ubx,
+            lbg=lbg,
+            ubg=limits,
+        )
+        stats = self._solver.stats()
+
+        w = np.asarray(solution["x"]).ravel()
+        T, (x, dx, ddx) = w[-1], w[:-1].reshape(N + 1, 3).T
+        torque, theta, dtheta = (
+            np.asarray(output).ravel()
+            for output in _motor_function().map(N + 1)(x, dx, ddx, self.external, parameters(self.model))
+        )
+        return Plan(
+            time=np.linspace(0.0, T, N + 1),
+            position=x,
+            velocity=dx,
+            acceleration=ddx,
+            motor_position=theta,
+            motor_velocity=dtheta,
+            torque=torque,
+            cost=float(solution["f"]),
+            success=stats["success"],
+            iterations=stats["iter_count"],
+        )
+
+    def solve_batch(
+        self, starts: np.ndarray | float, targets: np.ndarray, durations: np.ndarray | float = 1.0
+    ) -> list[Plan]:
+        """
+        Plan many motions with the same compiled problem.
+
+        Each solve is warm started from the previous plan rescaled to the new boundary
+        conditions, so neighbouring targets converge in few iterations; sort the targets for
+        best effect.
+
+        Args:
+            starts (np.ndarray | float): The initial contractions, broadcast against the targets.
+            targets (np.ndarray): The final contractions.
+            durations (np.ndarray | float, optional): The durations (see solve). Defaults to 1.0.
+
+        Returns:
+            list[Plan]: The optimized trajectories in the order of the targets.
+        """
+        starts, targets, durations = np.broadcast_arrays(
+            np.asarray(starts, dtype=float), np.asarray(targets, dtype=float), np.asarray(durations, dtype=float)
+        )
+        plans, previous = [], None
+        for start, target, duration in zip(starts.ravel(), targets.ravel(), durations.ravel(), strict=True):
+            plan = self.solve(start, target, duration, previous)
+            previous = plan if plan.success else None
+            plans.append(plan)
+        return plans
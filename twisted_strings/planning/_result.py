@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Plan:
+    """
+    Optimized contraction trajectory sampled on the collocation grid.
+
+    Attributes:
+        time (np.ndarray): The collocation times in seconds, from 0 to the duration.
+        position (np.ndarray): The contraction x in meters.
+        velocity (np.ndarray): The contraction speed in m/s.
+        acceleration (np.ndarray): The contraction acceleration in m/s^2, linear between the nodes.
+        motor_position (np.ndarray): The motor angle theta in radians.
+        motor_velocity (np.ndarray): The motor speed in rad/s.
+        torque (np.ndarray): The motor torque required by the inverse dynamics, including jamming.
+        cost (float): The optimal objective, the duration or the integral of the squared torque.
+        success (bool): Whether the solver converged.
+        iterations (int): The number of solver iterations.
+    """
+
+    time: np.ndarray
+    position: np.ndarray
+    velocity: np.ndarray
+    acceleration: np.ndarray
+    motor_position: np.ndarray
+    motor_velocity: np.ndarray
+    torque: np.ndarray
+    cost: float
+    success: bool
+    iterations: int
+
+    @property
+    def duration(self) -> float:
+        """The duration of the motion in seconds."""
+        return float(self.time[-1])
@@ -0,0 +1,19 @@
+"""
+Profiling of Twisted String Actuator Computations
+
+Opt-in instrumentation showing where the time of a control or simulation loop goes. While
+a Profiler is enabled, the public kinematics and dynamics functions are wrapped in place, so
+the nested calls between them (e.g. inverse_dynamics -> compute_all, nonlinear -> coriolis
+-> jacobian) are counted with their cumulative and own time, nesting depth, recursion and
+the redundant recomputations within each forward or inverse dynamics call. Disabling
+restores the original functions, so the instrumentation costs nothing when unused.
+
+Example:
+    with profiling.Profiler() as profiler:
+        run_loop()
+    print(profiler.report())
+    profiler.save("profile.json")
+    print(profiling.compare(profiling.load("baseline.json"), profiler.summary()))
+"""
+
+from ._profiler import MODULES, ROOTS, FunctionStats, Profiler, RootStats, compare, load
@@ -0,0 +1,297 @@
+import importlib
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from functools import wraps
+from types import FunctionType, ModuleType
+
+# Packages whose public functions are instrumented by default
+MODULES = ("twisted_strings.kinematics", "twisted_strings.dynamics")
+# Top-level calls whose redundant recomputations are counted
+ROOTS = ("dynamics.forward_dynamics", "dynamics.inverse_dynamics")
+
+_SCALARS = (int, float, complex, str, bool, Enum, type(None))
+
+
+@dataclass
+class FunctionStats:
+    """
+    Counters of one instrumented function.
+
+    Attributes:
+        calls (int): Number of calls.
+        total (float): Cumulative time in seconds, including callees; nested recursive calls are counted once.
+        own (float): Time in seconds spent in the function itself, excluding instrumented callees.
+        depth (int): Maximum depth of the instrumented call stack at which the function ran, 1 for top-level calls.
+        recursion (int): Maximum number of simultaneously active calls of the function.
+        redundant (int): Calls repeating an earlier call with the same arguments within one root call.
+    """
+
+    calls: int = 0
+    total: float = 0.0
+    own: float = 0.0
+    depth: int = 0
+    recursion: int = 0
+    redundant: int = 0
+
+
+@dataclass
+class RootStats:
+    """
+    Counters of one top-level call, see ROOTS.
+
+    Attributes:
+        calls (int): Number of top-level calls.
+        total (float): Cumulative time in seconds.
+        redundant (int): Redundant recomputations summed over all top-level calls.
+    """
+
+    calls: int = 0
+    total: float = 0.0
+    redundant: int = 0
+
+    @property
+    def redundant_per_call(self) -> float:
+        """Average number of redundant recomputations per top-level call."""
+        return self.redundant / self.calls if self.calls else 0.0
+
+
+def _key(args: tuple, kwargs: dict) -> tuple:
+    """Identity of a call: scalars by value and every other argument by object identity."""
+    return (
+        tuple(a if isinstance(a, _SCALARS) else id(a) for a in args),
+        tuple((k, v if isinstance(v, _SCALARS) else id(v)) for k, v in sorted(kwargs.items())),
+    )
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of the kinematics and dynamics functions.
+
+    While enabled, every public function of the given packages is replaced by a counting
+    wrapper in every loaded module that binds it, including ``from ... import`` bindings in
+    the package itself and in user code, so the calls between the functions are traced
+    through the same wrappers. Disabling restores the original functions, so a disabled
+    profiler costs nothing.
+
+    For each function the calls, the cumulative and own time, the deepest nesting and
+    recursion are recorded. Within each root call (forward_dynamics and inverse_dynamics by
+    default) a call is redundant if the same function was already called with the same
+    argument objects, i.e. it most likely recomputes a value that was already available.
+
+    Example:
+        with Profiler() as profiler:
+            forward_dynamics(model, data, Space.MOTOR)
+        print(profiler.report())
+        profiler.save("profile.json")
+
+    Args:
+        modules (tuple[str, ...], optional): Packages whose public functions are instrumented.
+            Defaults to MODULES.
+        roots (tuple[str, ...], optional): Qualified names ("package.function", relative to
+            twisted_strings) of the top-level calls. Defaults to ROOTS.
+
+    Note:
+        The wrappers add about a microsecond per call, which is included in the measured
+        times of the callers. Functions called through references taken before enabling
+        (e.g. stored in a dict) are not traced. Not thread-safe.
+    """
+
+    def __init__(self, modules: tuple[str, ...] = MODULES, roots: tuple[str, ...] = ROOTS):
+        self.modules = modules
+        self.roots = roots
+        self.enabled = False
+        self._originals: dict[str, FunctionType] = {}
+        self._patches: list[tuple[ModuleType, str, FunctionType]] = []
+        self._stack: list[list[float]] = []
+        self._active: dict[str, int] = {}
+        self.reset()
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.disable()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.functions: dict[str, FunctionStats] = {name: FunctionStats() for name in self._originals}
+        self.root_calls: dict[str, RootStats] = {}
+        # the wrappers hold on to the stack and the active counts, so they are cleared in place
+        self._stack.clear()
+        self._active.update(dict.fromkeys(self._originals, 0))
+        self._seen: set | None = None
+        self._redundant = 0
+
+    def _discover(self) -> dict[str, FunctionType]:
+        functions = {}
+        for module_name in self.modules:
+            module = importlib.import_module(module_name)
+            prefix = module_name.removeprefix("twisted_strings.")
+            for name in dir(module):
+                value = getattr(module, name)
+                if not name.startswith("_") and isinstance(value, FunctionType):
+                    functions.setdefault(f"{prefix}.{name}", value)
+        return functions
+
+    def _wrap(self, name: str, function: FunctionType) -> FunctionType:
+        stack, active = self._stack, self._active
+        is_root = name in self.roots
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            stats = self.functions[name]
+            stats.calls += 1
+            stats.depth = max(stats.depth, len(stack) + 1)
+            active[name] += 1
+            stats.recursion = max(stats.recursion, active[name])
+
+            root = is_root and self._seen is None
+            if root:
+                self._seen, self._redundant = set(), 0
+            elif self._seen is not None:
+                key = (name, _key(args, kwargs))
+                if key in self._seen:
+                    stats.redundant += 1
+                    self._redundant += 1
+                else:
+                    self._seen.add(key)
+
+            frame = [0.0]
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                active[name] -= 1
+                if not active[name]:
+                    stats.total += elapsed
+                stats.own += elapsed - frame[0]
+                if stack:
+                    stack[-1][0] += elapsed
+                if root:
+                    root_stats = self.root_calls.setdefault(name, RootStats())
+                    root_stats.calls += 1
+                    root_stats.total += elapsed
+                    root_stats.redundant += self._redundant
+                    self._seen = None
+
+        return wrapper
+
+    def enable(self) -> None:
+        """Install the wrappers in every module binding an instrumented function."""
+        if self.enabled:
+            return
+        self._originals = self._discover()
+        for name in self._originals:
+            self.functions.setdefault(name, FunctionStats())
+            self._active.setdefault(name, 0)
+        wrappers = {id(function): self._wrap(name, function) for name, function in self._originals.items()}
+
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, "__dict__", None)
+            if not isinstance(module, ModuleType) or namespace is None:
+                continue
+            for attribute, value in list(namespace.items()):
+                wrapper = wrappers.get(id(value))
+                if wrapper is not None and isinstance(value, FunctionType):
+                    self._patches.append((module, attribute, value))
+                    setattr(module, attribute, wrapper)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Restore the original functions."""
+        for module, attribute, function in reversed(self._patches):
+            setattr(module, attribute, function)
+        self._patches = []
+        self.enabled = False
+
+    def summary(self) -> dict:
+        """
+        Collect the counters of the called functions.
+
+        Returns:
+            dict: JSON serializable summary with the "functions" and "roots" counters by name.
+        """
+        return {
+            "functions": {name: asdict(stats) for name, stats in self.functions.items() if stats.calls},
+            "roots": {
+                name: {**asdict(stats), "redundant_per_call": stats.redundant_per_call}
+                for name, stats in self.root_calls.items()
+            },
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the summary as JSON.
+
+        Args:
+            path (str): The output file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def report(self) -> str:
+        """
+        Format the summary as a table sorted by cumulative time.
+
+        Returns:
+            str: One line per called function and per root call.
+        """
+        lines = [
+            f"{'function':<36}{'calls':>10}{'total ms':>12}{'own ms':>12}{'depth':>7}{'recursion':>11}{'redundant':>11}"
+        ]
+        for name, stats in sorted(self.functions.items(), key=lambda item: -item[1].total):
+            if stats.calls:
+                lines.append(
+                    f"{name:<36}{stats.calls:>10}{1e3 * stats.total:>12.3f}{1e3 * stats.own:>12.3f}"
+                    f"{stats.depth:>7}{stats.recursion:>11}{stats.redundant:>11}"
+                )
+        for name, stats in self.root_calls.items():
+            lines.append(
+                f"{name}: {stats.calls} calls, {stats.redundant_per_call:.2f} redundant recomputations per call"
+            )
+        return "\n".join(lines)
+
+
+def load(path: str) -> dict:
+    """
+    Read a summary written by Profiler.save.
+
+    Args:
+        path (str): The JSON file.
+
+    Returns:
+        dict: The summary.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(baseline: dict, current: dict) -> dict[str, dict[str, tuple[float, float]]]:
+    """
+    Compare the function counters of two summaries.
+
+    Args:
+        baseline (dict): The reference summary, e.g. from load.
+        current (dict): The summary to compare, e.g. Profiler.summary().
+
+    Returns:
+        dict[str, dict[str, tuple[float, float]]]: For every function of either summary, the
+            (baseline, current) values of each counter that differs; functions missing from a
+            summary count as zero.
+    """
+    empty = asdict(FunctionStats())
+    differences = {}
+    for name in baseline["functions"].keys() | current["functions"].keys():
+        before = baseline["functions"].get(name, empty)
+        after = current["functions"].get(name, empty)
+        changed = {field: (before[field], after[field]) for field in empty if before[field] != after[field]}
+        if changed:
+            differences[name] = changed
+    return differences
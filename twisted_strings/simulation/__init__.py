@@ -0,0 +1,21 @@
+"""
+Simulation of Twisted String Actuators
+
+This module integrates the actuator dynamics computed by ``dynamics.forward_dynamics``
+in motor or load space. The integrators work on a BatchData, so a batch of initial
+conditions or model parameters is advanced in one vectorized call per stage.
+
+Available methods:
+- "rk4": classical fixed step fourth order Runge-Kutta
+- "rk45": adaptive Dormand-Prince 5(4) with embedded error control
+- "euler", "bdf2": implicit backward Euler and BDF2 for the stiff string compliance
+- "midpoint": implicit, energy-preserving midpoint rule
+
+Parameter sweeps and Monte Carlo studies over model fields are run by ``sweep``, which
+simulates chunks of a parameter grid as batches in parallel worker processes.
+"""
+
+from ._implicit import IMPLICIT_METHODS, ImplicitStepper
+from ._integrators import dopri5_step, rk4_step
+from ._simulate import Control, Trajectory, simulate
+from ._sweep import Metrics, Progress, parameter_grid, parameter_samples, summary, sweep
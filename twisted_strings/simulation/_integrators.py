@@ -0,0 +1,76 @@
+from collections.abc import Callable
+
+import numpy as np
+
+# Dormand-Prince 5(4) tableau
+_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# difference between the 5th and the embedded 4th order weights
+_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+
+def rk4_step(
+    f: Callable[[float, np.ndarray], np.ndarray],
+    t: float,
+    y: np.ndarray,
+    h: float,
+    k1: np.ndarray,
+) -> np.ndarray:
+    """
+    Advance the state by one classical fourth order Runge-Kutta step.
+
+    Args:
+        f (Callable): The right hand side f(t, y) of the ODE.
+        t (float): The current time.
+        y (np.ndarray): The current state.
+        h (float): The step size.
+        k1 (np.ndarray): The derivative f(t, y) at the current state.
+
+    Returns:
+        np.ndarray: The state at time t + h.
+    """
+    k2 = f(t + h / 2, y + h / 2 * k1)
+    k3 = f(t + h / 2, y + h / 2 * k2)
+    k4 = f(t + h, y + h * k3)
+    return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def dopri5_step(
+    f: Callable[[float, np.ndarray], np.ndarray],
+    t: float,
+    y: np.ndarray,
+    h: float,
+    k1: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Advance the state by one Dormand-Prince 5(4) step.
+
+    The last stage is evaluated at the new state (first same as last), so it can be reused as
+    k1 of the next step once the step is accepted.
+
+    Args:
+        f (Callable): The right hand side f(t, y) of the ODE.
+        t (float): The current time.
+        y (np.ndarray): The current state.
+        h (float): The step size.
+        k1 (np.ndarray): The derivative f(t, y) at the current state.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The fifth order state at t + h, the local
+            error estimate and the derivative at the new state.
+    """
+    k = [k1]
+    for c, a in zip(_C[1:6], _A[1:6], strict=True):
+        k.append(f(t + c * h, y + h * sum(a_i * k_i for a_i, k_i in zip(a, k, strict=True))))
+    y_new = y + h * sum(b_i * k_i for b_i, k_i in zip(_A[6], k, strict=True) if b_i)
+    k.append(f(t + h, y_new))
+    error = h * sum(e_i * k_i for e_i, k_i in zip(_E, k, strict=True) if e_i)
+    return y_new, error, k[-1]
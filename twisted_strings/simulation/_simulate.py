@@ -0,0 +1,226 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from .._structs import BatchData, Model, Space
+from ..dynamics import forward_dynamics
+from ._implicit import IMPLICIT_METHODS, ImplicitStepper
+from ._integrators import dopri5_step, rk4_step
+
+Control = Callable[[float, np.ndarray, np.ndarray], np.ndarray | float]
+
+
+@dataclass
+class Trajectory:
+    """
+    Simulated trajectory sampled on the requested time grid.
+
+    Arrays have shape (T,) for a single initial condition and (T, N) for a batch of N.
+
+    Attributes:
+        time (np.ndarray): The time grid in seconds.
+        position (np.ndarray): The position in the simulated space.
+        velocity (np.ndarray): The velocity in the simulated space.
+        acceleration (np.ndarray): The acceleration in the simulated space.
+        input (np.ndarray): The control input applied at each sample.
+        evaluations (int): The number of dynamics evaluations spent on the integration.
+        jamming_iterations (int): The largest number of Newton iterations solve_jamming needed
+            in one evaluation, 0 without jamming or with the closed form.
+    """
+
+    time: np.ndarray
+    position: np.ndarray
+    velocity: np.ndarray
+    acceleration: np.ndarray
+    input: np.ndarray
+    evaluations: int = 0
+    jamming_iterations: int = 0
+
+
+class _Dynamics:
+    """First order form f(t, y) of the actuator dynamics for y = (position, velocity)."""
+
+    def __init__(
+        self,
+        model: Model,
+        space: Space,
+        size: int,
+        control: Control | None,
+        include_jamming: bool = False,
+        jamming_method: str = "closed",
+    ):
+        if space not in (Space.MOTOR, Space.LOAD):
+            raise ValueError(f"Invalid space: {space}")
+        self.model = model
+        self.space = space
+        self.control = control
+        self.include_jamming = include_jamming
+        self.jamming_method = jamming_method
+        self.data = BatchData(size)
+        self.evaluations = 0
+        self.jamming_iterations = 0
+
+    def __call__(self, t: float, y: np.ndarray) -> np.ndarray:
+        model, data = self.model, self.data
+        position, velocity = y
+
+        # forward_dynamics propagates the state to the other space
+        space_data = data.motor if self.space == Space.MOTOR else data.load
+        space_data.position = position
+        space_data.velocity = velocity
+
+        # forward_dynamics reads the generalized input from data.load.force in both spaces
+        data.load.force = 0.0 if self.control is None else self.control(t, position, velocity)
+        acceleration, iterations = forward_dynamics(
+            model, data, self.space, self.include_jamming, self.jamming_method, full_output=True
+        )
+        self.evaluations += 1
+        self.jamming_iterations = max(self.jamming_iterations, iterations)
+        return np.stack((velocity, np.broadcast_to(acceleration, velocity.shape)))
+
+    @property
+    def input(self) -> np.ndarray:
+        return self.data.load.force
+
+
+def simulate(
+    model: Model,
+    time: np.ndarray,
+    position: np.ndarray | float,
+    velocity: np.ndarray | float = 0.0,
+    space: Space = Space.MOTOR,
+    control: Control | None = None,
+    method: str = "rk4",
+    substeps: int = 1,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    include_jamming: bool = False,
+    jamming_method: str = "closed",
+) -> Trajectory:
+    """
+    Integrate the actuator dynamics over a time grid.
+
+    The dynamics are evaluated with forward_dynamics on a BatchData, so a batch of initial
+    conditions (e.g. Monte Carlo samples) is integrated together in one vectorized pass.
+    Model parameters may be arrays broadcast against the batch.
+
+    With the default stiffness the dynamics are stiff and explicit methods need very small
+    steps. The implicit methods ("euler", "bdf2", "midpoint") use analytic Jacobians of the
+    traced dynamics and stay stable at steps orders of magnitude larger; they require CasADi.
+
+    Args:
+        model (Model): The model object containing system parameters.
+        time (np.ndarray): The increasing time grid at which the trajectory is recorded.
+        position (np.ndarray | float): The initial position (theta for MOTOR, x for LOAD).
+        velocity (np.ndarray | float, optional): The initial velocity. Defaults to 0.0.
+        space (Space, optional): The space in which the dynamics are integrated. Defaults to Space.MOTOR.
+        control (Control | None, optional): Callback u = control(t, position, velocity) returning
+            the generalized input in the chosen space. Defaults to None (zero input).
+        method (str, optional): "rk4" for fixed step Runge-Kutta, "rk45" for adaptive
+            Dormand-Prince, or the fixed step implicit methods "euler" (backward Euler), "bdf2"
+            (second order backward differentiation) and "midpoint" (implicit midpoint,
+            symplectic). Defaults to "rk4".
+        substeps (int, optional): Number of fixed steps per grid interval. Defaults to 1.
+        rtol (float, optional): Relative tolerance of the adaptive method and of the Newton
+            iterations of the implicit methods. Defaults to 1e-6.
+        atol (float, optional): Absolute tolerance of the adaptive method and of the Newton
+            iterations of the implicit methods. Defaults to 1e-9.
+        include_jamming (bool, optional): Whether forward_dynamics accounts for jamming (LOAD
+            space with the explicit methods only). Defaults to False.
+        jamming_method (str, optional): The method of solve_jamming, "closed" or "newton".
+            Defaults to "closed".
+
+    Returns:
+        Trajectory: The simulated trajectory.
+
+    Raises:
+        ValueError: If an invalid space or method is provided, or jamming is requested in
+            MOTOR space or with an implicit method.
+        RuntimeError: If the adaptive step size underflows or the Newton iterations of an
+            implicit method or of solve_jamming do not converge.
+    """
+    time = np.asarray(time, dtype=float)
+    scalar = np.ndim(position) == 0 and np.ndim(velocity) == 0
+    position, velocity = np.broadcast_arrays(np.atleast_1d(position), np.atleast_1d(velocity))
+    y = np.stack((position, velocity)).astype(float)
+
+    if include_jamming and space == Space.MOTOR:
+        raise ValueError(f"Jamming is not supported in space: {space}")
+    if include_jamming and method in IMPLICIT_METHODS:
+        raise ValueError(f"Jamming is not supported by the implicit method: {method}")
+
+    f = _Dynamics(model, space, y.shape[1], control, include_jamming, jamming_method)
+    states = np.empty((len(time), *y.shape))
+    accelerations = np.empty((len(time), y.shape[1]))
+    inputs = np.empty((len(time), y.shape[1]))
+
+    def record(index: int, y: np.ndarray, dy: np.ndarray) -> None:
+        states[index] = y
+        accelerations[index] = dy[1]
+        inputs[index] = f.input
+
+    k1 = f(time[0], y)
+    record(0, y, k1)
+
+    if method == "rk4":
+        for i in range(1, len(time)):
+            t, h = time[i - 1], (time[i] - time[i - 1]) / substeps
+            for j in range(substeps):
+                if j:
+                    k1 = f(t, y)
+                y = rk4_step(f, t, y, h, k1)
+                t += h
+            k1 = f(time[i], y)
+            record(i, y, k1)
+    elif method == "rk45":
+        h = time[1] - time[0] if len(time) > 1 else 0.0
+        for i in range(1, len(time)):
+            t = time[i - 1]
+            while t < time[i]:
+                # h is the adaptive step size, step the one actually taken, clipped to the grid
+                last = h >= time[i] - t
+                step = time[i] - t if last else h
+                y_new, error, k7 = dopri5_step(f, t, y, step, k1)
+                scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+                norm = np.sqrt(np.mean((error / scale) ** 2, axis=0)).max()
+                accepted = norm <= 1.0
+                if accepted:
+                    t, y, k1 = time[i] if last else t + step, y_new, k7
+                    if last:
+                        record(i, y, k1)
+                if not np.isfinite(norm):
+                    # e.g. a stage evaluated beyond the full twist, retry with a smaller step
+                    h = 0.2 * step
+                else:
+                    factor = min(5.0, max(0.2, 0.9 * norm ** (-1 / 5))) if norm > 0 else 5.0
+                    # a short step accepted at a grid point does not shrink the step size
+                    h = max(h, factor * step) if accepted and step < h else factor * step
+                if h <= 1e-14 * max(1.0, abs(t)):
+                    raise RuntimeError(f"Step size became too small at t={t}")
+    elif method in IMPLICIT_METHODS:
+        stepper = ImplicitStepper(model, space, y.shape[1], control, rtol, atol)
+        previous, h_previous = None, None
+        for i in range(1, len(time)):
+            t, h = time[i - 1], (time[i] - time[i - 1]) / substeps
+            for _ in range(substeps):
+                if method == "midpoint":
+                    y_new = stepper.midpoint(t, y, h)
+                elif method == "bdf2" and previous is not None and np.isclose(h, h_previous):
+                    y_new = stepper.bdf2(t, y, previous, h)
+                else:
+                    # backward Euler also starts BDF2 and restarts it when the step changes
+                    y_new = stepper.euler(t, y, h)
+                previous, h_previous, y = y, h, y_new
+                t += h
+            k1 = f(time[i], y)
+            record(i, y, k1)
+    else:
+        raise ValueError(f"Invalid method: {method}")
+
+    evaluations = f.evaluations + (stepper.evaluations if method in IMPLICIT_METHODS else 0)
+    trajectory = Trajectory(time, states[:, 0], states[:, 1], accelerations, inputs, evaluations, f.jamming_iterations)
+    if scalar:
+        for name in ("position", "velocity", "acceleration", "input"):
+            setattr(trajectory, name, getattr(trajectory, name)[:, 0])
+    return trajectory
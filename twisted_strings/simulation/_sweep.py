@@ -0,0 +1,255 @@
+import copy
+import hashlib
+import itertools
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .._structs import Model, Space, set_field
+from ._simulate import Control, Trajectory, simulate
+
+Metrics = Callable[[Trajectory], dict[str, np.ndarray]]
+Progress = Callable[[int, int], None]
+
+CHECKPOINT = "sweep.json"
+
+
+def parameter_grid(axes: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Build the full factorial grid over model fields.
+
+    Args:
+        axes (dict[str, np.ndarray]): Values of each swept field keyed by dotted model field
+            path, e.g. ``{"kinematic.radius": np.linspace(5e-4, 2e-3, 100)}``.
+
+    Returns:
+        np.ndarray: Structured array with one field per path and one row per combination.
+    """
+    names = list(axes)
+    grid = np.empty(int(np.prod([len(axes[name]) for name in names])), dtype=[(name, float) for name in names])
+    for row, values in enumerate(itertools.product(*(axes[name] for name in names))):
+        grid[row] = values
+    return grid
+
+
+def parameter_samples(
+    distributions: dict[str, Callable[[np.random.Generator, int], np.ndarray]],
+    size: int,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Draw Monte Carlo samples of model fields.
+
+    Args:
+        distributions (dict[str, Callable]): Samplers ``f(rng, size)`` keyed by dotted model field
+            path, e.g. ``{"kinematic.radius": lambda rng, n: rng.normal(1e-3, 5e-5, n)}``.
+        size (int): Number of samples.
+        seed (int | None, optional): Seed of the random generator. Defaults to None.
+
+    Returns:
+        np.ndarray: Structured array with one field per path and one row per sample.
+    """
+    rng = np.random.default_rng(seed)
+    samples = np.empty(size, dtype=[(name, float) for name in distributions])
+    for name, distribution in distributions.items():
+        samples[name] = distribution(rng, size)
+    return samples
+
+
+def summary(trajectory: Trajectory) -> dict[str, np.ndarray]:
+    """
+    Default sweep metrics of a batch of trajectories.
+
+    Args:
+        trajectory (Trajectory): A batched trajectory with arrays of shape (T, N).
+
+    Returns:
+        dict[str, np.ndarray]: The final position, the peak absolute velocity, acceleration
+            and input of every trajectory.
+    """
+    return {
+        "final_position": trajectory.position[-1],
+        "peak_velocity": np.abs(trajectory.velocity).max(axis=0),
+        "peak_acceleration": np.abs(trajectory.acceleration).max(axis=0),
+        "peak_input": np.abs(trajectory.input).max(axis=0),
+    }
+
+
+def _run(model: Model, parameters: np.ndarray, metrics: Metrics, options: dict) -> dict[str, np.ndarray]:
+    """Simulate one chunk of parameter rows as a single batch."""
+    model = copy.deepcopy(model)
+    for name in parameters.dtype.names:
+        set_field(model, name, np.array(parameters[name]))
+
+    size = len(parameters)
+    position = np.broadcast_to(options["position"], size)
+    velocity = np.broadcast_to(options["velocity"], size)
+    trajectory = simulate(model, **{**options, "position": position, "velocity": velocity})
+    return metrics(trajectory)
+
+
+def _digest(value) -> str:
+    """Hash of an array by dtype, shape and content, or of any other value by its qualified name or repr."""
+    if callable(value) and hasattr(value, "__qualname__"):
+        text = f"{value.__module__}.{value.__qualname__}"
+    elif value is None or isinstance(value, str | Space):
+        text = repr(value)
+    else:
+        array = np.ascontiguousarray(value)
+        text = f"{array.dtype.str}{array.shape}{hashlib.sha256(array.tobytes()).hexdigest()}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _fingerprint(model: Model, parameters: np.ndarray, metrics: Metrics, options: dict) -> dict[str, str]:
+    """Digest of every input determining the results of a sweep, see _digest."""
+    inputs = {"parameters": parameters, "model": model.to_array(), "metrics": metrics, **options}
+    return {name: _digest(value) for name, value in inputs.items()}
+
+
+def _save(path: str, write: Callable) -> None:
+    """Write a file atomically through a temporary file in the same directory."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        write(file)
+    os.replace(temporary, path)
+
+
+def sweep(
+    model: Model,
+    parameters: np.ndarray,
+    time: np.ndarray,
+    position: np.ndarray | float,
+    velocity: np.ndarray | float = 0.0,
+    space: Space = Space.MOTOR,
+    control: Control | None = None,
+    method: str = "rk45",
+    metrics: Metrics = summary,
+    chunk_size: int = 1024,
+    workers: int | None = None,
+    progress: Progress | None = None,
+    checkpoint: str | None = None,
+) -> np.ndarray:
+    """
+    Simulate the actuator for every row of a parameter grid and collect summary metrics.
+
+    The rows are split into chunks. Each chunk is simulated as one vectorized batch, with
+    the swept model fields set to arrays, in a pool of worker processes. With a checkpoint
+    directory, every finished chunk is written to disk and skipped when the sweep is run
+    again with the same chunk size, so long sweeps can be resumed. The checkpoint records a
+    digest of the parameters, the model, the time grid, the initial state, the space, the
+    method and the control and metrics functions, and a sweep with different inputs is
+    refused instead of mixing results.
+
+    Example:
+        grid = parameter_grid({"kinematic.radius": radii, "dynamic.load.inertia": masses})
+        results = sweep(model, grid, np.linspace(0, 1, 101), position=50.0, checkpoint="sweep")
+        best = results[np.argmin(results["peak_input"])]
+
+    Args:
+        model (Model): The nominal model; fields not swept keep their values.
+        parameters (np.ndarray): Structured array of swept fields keyed by dotted path, see
+            parameter_grid and parameter_samples.
+        time (np.ndarray): The time grid of every simulation.
+        position (np.ndarray | float): The initial position, scalar or one per row.
+        velocity (np.ndarray | float, optional): The initial velocity, scalar or one per row.
+            Defaults to 0.0.
+        space (Space, optional): The space in which the dynamics are integrated. Defaults to Space.MOTOR.
+        control (Control | None, optional): The control callback, see simulate. Defaults to None.
+        method (str, optional): The integration method, see simulate. Defaults to "rk45".
+        metrics (Metrics, optional): Function reducing a batched Trajectory to named arrays of
+            one value per row. Defaults to summary.
+        chunk_size (int, optional): Rows simulated per batch. Defaults to 1024.
+        workers (int | None, optional): Number of worker processes. 0 runs the sweep in the
+            calling process. Defaults to None (the number of CPUs).
+        progress (Progress | None, optional): Callback ``progress(done, total)`` called with the
+            number of finished rows after every chunk. Defaults to None.
+        checkpoint (str | None, optional): Directory storing finished chunks. Defaults to None.
+
+    Returns:
+        np.ndarray: Structured array with the parameter fields followed by the metric fields.
+
+    Raises:
+        ValueError: If the checkpoint directory belongs to a different sweep.
+
+    Note:
+        With worker processes, control and metrics must be picklable (module level functions).
+        Functions are identified by their qualified name, so editing the body of control or
+        metrics between runs is not detected; use a new checkpoint directory.
+    """
+    total = len(parameters)
+    starts = range(0, total, chunk_size)
+    options = {
+        "time": time,
+        "position": position,
+        "velocity": velocity,
+        "space": space,
+        "control": control,
+        "method": method,
+    }
+
+    results: dict[int, dict[str, np.ndarray]] = {}
+    if checkpoint is not None:
+        os.makedirs(checkpoint, exist_ok=True)
+        fingerprint = _fingerprint(model, parameters, metrics, options)
+        header_path = os.path.join(checkpoint, CHECKPOINT)
+        if os.path.exists(header_path):
+            with open(header_path) as file:
+                stored = json.load(file)
+            changed = [name for name in fingerprint.keys() | stored.keys() if fingerprint.get(name) != stored.get(name)]
+            if changed:
+                raise ValueError(f"Checkpoint {checkpoint} belongs to a different sweep: {', '.join(sorted(changed))}")
+        else:
+            _save(header_path, lambda file: file.write(json.dumps(fingerprint, indent=2).encode()))
+        for start in starts:
+            path = os.path.join(checkpoint, f"chunk_{start:012d}_{chunk_size}.npz")
+            if os.path.exists(path):
+                with np.load(path) as stored:
+                    results[start] = dict(stored)
+
+    done = sum(len(parameters[start : start + chunk_size]) for start in results)
+
+    def finish(start: int, values: dict[str, np.ndarray]) -> None:
+        nonlocal done
+        results[start] = values
+        done += len(parameters[start : start + chunk_size])
+        if checkpoint is not None:
+            # a chunk interrupted while being written must not be loaded on resume
+            _save(
+                os.path.join(checkpoint, f"chunk_{start:012d}_{chunk_size}.npz"), lambda file: np.savez(file, **values)
+            )
+        if progress is not None:
+            progress(done, total)
+
+    def arguments(start: int) -> tuple[Model, np.ndarray, Metrics, dict]:
+        rows = slice(start, start + chunk_size)
+        local = dict(options)
+        for name in ("position", "velocity"):
+            if np.ndim(options[name]):
+                local[name] = np.asarray(options[name])[rows]
+        return model, parameters[rows], metrics, local
+
+    pending = [start for start in starts if start not in results]
+    if workers == 0:
+        for start in pending:
+            finish(start, _run(*arguments(start)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_run, *arguments(start)): start for start in pending}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+
+    if not results:
+        return np.empty(0, dtype=parameters.dtype)
+
+    names = list(next(iter(results.values())))
+    output = np.empty(total, dtype=parameters.dtype.descr + [(name, float) for name in names])
+    for name in parameters.dtype.names:
+        output[name] = parameters[name]
+    for start, values in results.items():
+        rows = slice(start, start + chunk_size)
+        for name in names:
+            output[name][rows] = values[name]
+    return output
@@ -0,0 +1,18 @@
+"""
+Multi-Actuator Systems of Twisted String Actuators
+
+This module composes several actuators onto a shared rigid joint, e.g. an antagonistic
+pair on a pulley or a multi-string joint. The actuators are coupled to the joint through a
+linear map x = offset + A q, their parameters are stacked so all per-actuator terms are
+evaluated in one vectorized call, and the joint dynamics need a single small linear solve
+per step.
+
+Example:
+    system = SystemModel.from_models([Model(), Model()], coupling=[0.02, -0.02], offset=0.03, inertia=1e-3)
+    data = SystemData(system)
+    data.torque[:] = 0.05, 0.02
+    ddq = forward_dynamics(system, data)
+"""
+
+from ._dynamics import coriolis, forward_dynamics, inertia, kinematics, tension
+from ._system import SystemData, SystemModel
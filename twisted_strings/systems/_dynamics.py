@@ -0,0 +1,117 @@
+import numpy as np
+
+from .._structs import Space
+from ..dynamics import compute_all
+from ._system import SystemData, SystemModel
+
+
+def kinematics(system: SystemModel, data: SystemData) -> np.ndarray:
+    """
+    Map the joint state to the actuators and evaluate all actuator terms.
+
+    Args:
+        system (SystemModel): The system model.
+        data (SystemData): The system data holding the joint state.
+
+    Returns:
+        np.ndarray: The contractions x = offset + A q of the actuators.
+
+    Note:
+        This function updates the state and every computed term of data.actuators.
+    """
+    actuators = data.actuators
+    actuators.load.position = system.offset + system.coupling @ data.position
+    actuators.load.velocity = system.coupling @ data.velocity
+    compute_all(system.actuators, actuators, Space.LOAD, include_jamming=False)
+    return actuators.load.position
+
+
+def inertia(system: SystemModel, data: SystemData) -> np.ndarray:
+    """
+    Calculate the joint space inertia matrix M_q = M_joint + A^T diag(M_load) A.
+
+    Args:
+        system (SystemModel): The system model.
+        data (SystemData): The system data, with the actuator terms computed by kinematics.
+
+    Returns:
+        np.ndarray: The (DOF, DOF) inertia matrix.
+    """
+    A = system.coupling
+    data.inertia = system.inertia + A.T @ (data.actuators.load.inertia[:, None] * A)
+    return data.inertia
+
+
+def coriolis(system: SystemModel, data: SystemData) -> np.ndarray:
+    """
+    Calculate the joint space Coriolis and damping matrix C_q = D_joint + A^T diag(C_load) A.
+
+    Args:
+        system (SystemModel): The system model.
+        data (SystemData): The system data, with the actuator terms computed by kinematics.
+
+    Returns:
+        np.ndarray: The (DOF, DOF) Coriolis matrix.
+    """
+    A = system.coupling
+    data.coriolis = system.damping + A.T @ (data.actuators.load.coriolis[:, None] * A)
+    return data.coriolis
+
+
+def forward_dynamics(system: SystemModel, data: SystemData) -> np.ndarray:
+    """
+    Calculate the joint accelerations produced by the motor torques.
+
+    Each actuator obeys its load space dynamics M_i ddx_i + C_i dx_i = tau_i / J_i - T_i with
+    the string tension T_i acting on the joint, M_joint ddq + D dq = A^T T + external and
+    ddx = A ddq. Eliminating the tensions leaves a single DOF x DOF linear solve
+
+        M_q ddq = A^T (tau / J) - C_q dq + external.
+
+    Args:
+        system (SystemModel): The system model.
+        data (SystemData): The system data holding the joint state, data.torque and data.external.
+
+    Returns:
+        np.ndarray: The joint accelerations ddq.
+
+    Note:
+        This function updates data.acceleration, data.tension, data.inertia, data.coriolis and
+        the actuator data. Strings can only pull; negative tensions are not prevented.
+    """
+    kinematics(system, data)
+    M = inertia(system, data)
+    C = coriolis(system, data)
+    actuators = data.actuators
+
+    force = data.torque / actuators.load.jacobian
+    data.acceleration = np.linalg.solve(M, system.coupling.T @ force - C @ data.velocity + data.external)
+
+    actuators.load.acceleration = system.coupling @ data.acceleration
+    actuators.load.force = force
+    data.tension = force - actuators.load.inertia * actuators.load.acceleration - actuators.load.nonlinear
+    return data.acceleration
+
+
+def tension(system: SystemModel, data: SystemData) -> np.ndarray:
+    """
+    Calculate the string tensions required to follow the joint acceleration with the given torques.
+
+    Args:
+        system (SystemModel): The system model.
+        data (SystemData): The system data holding the joint state, data.acceleration and data.torque.
+
+    Returns:
+        np.ndarray: The tensions T = tau / J - M_load A ddq - C_load A dq of the actuators.
+
+    Note:
+        This function updates data.tension and the actuator data.
+    """
+    kinematics(system, data)
+    actuators = data.actuators
+    actuators.load.acceleration = system.coupling @ data.acceleration
+    actuators.load.force = data.torque / actuators.load.jacobian
+    data.tension = (
+        actuators.load.force - actuators.load.inertia * actuators.load.acceleration - actuators.load.nonlinear
+    )
+    return data.tension
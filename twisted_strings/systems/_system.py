@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .._structs import BatchData, Model, from_columns
+
+
+@dataclass
+class SystemModel:
+    """
+    Rigid joint driven by several twisted string actuators.
+
+    The actuators are coupled to the joint coordinates q through the linear map
+    x = offset + coupling @ q, e.g. a pulley of radius R driven by an antagonistic pair has
+    coupling [[R], [-R]] and the pretension contractions as offset. The parameters of all
+    actuators are stacked into one Model with array fields, so every per-actuator term is
+    evaluated in a single vectorized call.
+
+    Attributes:
+        actuators (Model): Stacked actuator parameters, each field an array over the actuators.
+        coupling (np.ndarray): The (N, DOF) coupling matrix A.
+        offset (np.ndarray): The (N,) contractions at q = 0.
+        inertia (np.ndarray): The (DOF, DOF) inertia matrix of the joint.
+        damping (np.ndarray): The (DOF, DOF) viscous damping matrix of the joint.
+    """
+
+    actuators: Model
+    coupling: np.ndarray
+    offset: np.ndarray
+    inertia: np.ndarray
+    damping: np.ndarray
+
+    @classmethod
+    def from_models(
+        cls,
+        models: Sequence[Model],
+        coupling: np.ndarray,
+        offset: np.ndarray | float = 0.0,
+        inertia: np.ndarray | float = 0.0,
+        damping: np.ndarray | float = 0.0,
+    ) -> "SystemModel":
+        """
+        Compose actuator models onto a shared joint.
+
+        Args:
+            models (Sequence[Model]): One model per actuator.
+            coupling (np.ndarray): The (N, DOF) coupling matrix, or (N,) for a single DOF joint.
+            offset (np.ndarray | float, optional): The contractions at q = 0. Defaults to 0.0.
+            inertia (np.ndarray | float, optional): The joint inertia, a scalar is used on the
+                diagonal. Defaults to 0.0.
+            damping (np.ndarray | float, optional): The joint damping, a scalar is used on the
+                diagonal. Defaults to 0.0.
+
+        Returns:
+            SystemModel: The composed system.
+
+        Raises:
+            ValueError: If the coupling does not have one row per model.
+        """
+        coupling = np.asarray(coupling, dtype=float)
+        coupling = coupling[:, None] if coupling.ndim == 1 else coupling
+        if coupling.shape[0] != len(models):
+            raise ValueError(f"Invalid coupling shape: {coupling.shape} for {len(models)} actuators")
+
+        dof = coupling.shape[1]
+        actuators = from_columns(Model, np.array([model.to_array() for model in models]))
+        return cls(
+            actuators,
+            coupling,
+            np.broadcast_to(np.asarray(offset, dtype=float), len(models)).copy(),
+            np.asarray(inertia, dtype=float) * np.eye(dof) if np.ndim(inertia) == 0 else np.asarray(inertia),
+            np.asarray(damping, dtype=float) * np.eye(dof) if np.ndim(damping) == 0 else np.asarray(damping),
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of actuators."""
+        return self.coupling.shape[0]
+
+    @property
+    def dof(self) -> int:
+        """Number of joint degrees of freedom."""
+        return self.coupling.shape[1]
+
+
+class SystemData:
+    """
+    State and dynamic terms of a multi-actuator system.
+
+    Args:
+        system (SystemModel): The system the data is sized for.
+
+    Attributes:
+        position (np.ndarray): Joint positions q, shape (DOF,).
+        velocity (np.ndarray): Joint velocities dq, shape (DOF,).
+        acceleration (np.ndarray): Joint accelerations ddq, shape (DOF,).
+        external (np.ndarray): External generalized forces on the joint, shape (DOF,).
+        torque (np.ndarray): Motor torques of the actuators, shape (N,).
+        tension (np.ndarray): String tensions acting on the joint, shape (N,).
+        inertia (np.ndarray): Joint space inertia matrix, shape (DOF, DOF).
+        coriolis (np.ndarray): Joint space Coriolis and damping matrix, shape (DOF, DOF).
+        actuators (BatchData): States and terms of every actuator.
+    """
+
+    def __init__(self, system: SystemModel):
+        size, dof = system.size, system.dof
+        self.position = np.zeros(dof)
+        self.velocity = np.zeros(dof)
+        self.acceleration = np.zeros(dof)
+        self.external = np.zeros(dof)
+        self.torque = np.zeros(size)
+        self.tension = np.zeros(size)
+        self.inertia = np.zeros((dof, dof))
+        self.coriolis = np.zeros((dof, dof))
+        self.actuators = BatchData(size)